@@ -0,0 +1,171 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Synthetic observations and datasets shared by the benchmarks.
+
+No external data is needed: the IRFs are analytical, the events are sampled
+with `~gammapy.datasets.MapDatasetEventSampler` and all random numbers are
+seeded, so that the benchmarks are reproducible between commits.
+"""
+
+import numpy as np
+import astropy.units as u
+from astropy.coordinates import SkyCoord
+from regions import CircleSkyRegion
+from gammapy.data import FixedPointingInfo, Observation
+from gammapy.datasets import MapDataset, MapDatasetEventSampler, SpectrumDataset
+from gammapy.irf import PSF3D, Background2D, EffectiveAreaTable2D, EnergyDispersion2D
+from gammapy.makers import MapDatasetMaker, SpectrumDatasetMaker
+from gammapy.maps import MapAxis, RegionGeom, WcsGeom
+from gammapy.modeling.models import (
+    FoVBackgroundModel,
+    GaussianSpatialModel,
+    Models,
+    PowerLawSpectralModel,
+    SkyModel,
+)
+
+POSITION = SkyCoord(83.63, 22.01, unit="deg", frame="icrs")
+LIVETIME = 1 * u.h
+
+
+def energy_axes(nbin=10):
+    """Reconstructed and true energy axes."""
+    energy_axis = MapAxis.from_energy_bounds("0.1 TeV", "100 TeV", nbin=nbin)
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.05 TeV", "200 TeV", nbin=2 * nbin, name="energy_true"
+    )
+    return energy_axis, energy_axis_true
+
+
+def make_psf(energy_axis_true, sigma=0.1 * u.deg):
+    """Gaussian PSF, independent of energy and offset."""
+    offset_axis = MapAxis.from_nodes([0, 1, 2, 3, 4, 5] * u.deg, name="offset")
+    rad_axis = MapAxis.from_edges(np.linspace(0, 1, 101) * u.deg, name="rad")
+
+    rad = rad_axis.center
+    value = np.exp(-0.5 * (rad / sigma).to_value("") ** 2)
+    drad = 2 * np.pi * (np.cos(rad_axis.edges[:-1]) - np.cos(rad_axis.edges[1:]))
+    value = value / np.sum(value * drad.value)
+
+    data = np.ones((energy_axis_true.nbin, offset_axis.nbin, 1)) * value
+    return PSF3D(axes=[energy_axis_true, offset_axis, rad_axis], data=data, unit="sr-1")
+
+
+def make_background(energy_axis):
+    """Radially symmetric background with a power law spectrum."""
+    offset_axis = MapAxis.from_nodes(np.linspace(0, 5, 11) * u.deg, name="offset")
+
+    energy = energy_axis.center.to_value("TeV")[:, np.newaxis]
+    offset = offset_axis.center.to_value("deg")[np.newaxis, :]
+    data = 1e-6 * energy**-2.7 * np.exp(-0.5 * (offset / 2.5) ** 2)
+
+    return Background2D(
+        axes=[energy_axis, offset_axis], data=data, unit="s-1 MeV-1 sr-1"
+    )
+
+
+def make_observation(obs_id=0, tstart=0 * u.h, livetime=LIVETIME):
+    """Observation with analytical IRFs and a fixed pointing."""
+    _, energy_axis_true = energy_axes()
+    offset_axis = MapAxis.from_nodes(np.linspace(0, 5, 11) * u.deg, name="offset")
+    migra_axis = MapAxis.from_bounds(0.2, 5, nbin=100, node_type="edges", name="migra")
+    energy_axis_bkg = MapAxis.from_energy_bounds("0.05 TeV", "200 TeV", nbin=20)
+
+    irfs = {
+        "aeff": EffectiveAreaTable2D.from_parametrization(
+            energy_axis_true=energy_axis_true, instrument="CTAO"
+        ),
+        "edisp": EnergyDispersion2D.from_gauss(
+            energy_axis_true=energy_axis_true,
+            migra_axis=migra_axis,
+            offset_axis=offset_axis,
+            bias=0,
+            sigma=0.2,
+        ),
+        "psf": make_psf(energy_axis_true),
+        "bkg": make_background(energy_axis_bkg),
+    }
+
+    pointing = FixedPointingInfo(
+        fixed_icrs=POSITION.directional_offset_by(0 * u.deg, 0.5 * u.deg)
+    )
+    return Observation.create(
+        pointing=pointing,
+        obs_id=obs_id,
+        tstart=tstart,
+        tstop=tstart + livetime,
+        irfs=irfs,
+    )
+
+
+def make_models(name="source", spatial=True):
+    """Gaussian source with a power law spectrum."""
+    spatial_model = None
+    if spatial:
+        spatial_model = GaussianSpatialModel(
+            lon_0=POSITION.ra, lat_0=POSITION.dec, sigma="0.2 deg", frame="icrs"
+        )
+    spectral_model = PowerLawSpectralModel(
+        index=2.5, amplitude="1e-11 cm-2 s-1 TeV-1", reference="1 TeV"
+    )
+    return SkyModel(
+        spatial_model=spatial_model, spectral_model=spectral_model, name=name
+    )
+
+
+def make_geom(width=4 * u.deg, binsz=0.02 * u.deg, nbin=10):
+    """WCS geometry centered on the source."""
+    energy_axis, _ = energy_axes(nbin=nbin)
+    return WcsGeom.create(
+        skydir=POSITION, width=width, binsz=binsz, frame="icrs", axes=[energy_axis]
+    )
+
+
+def make_map_dataset(observation=None, geom=None, sample_events=True):
+    """Map dataset reduced from a synthetic observation.
+
+    The counts are either sampled from the models with
+    `~gammapy.datasets.MapDatasetEventSampler`, which also attaches the event list
+    to the observation, or taken from a Poisson realisation of the predicted counts.
+    """
+    if observation is None:
+        observation = make_observation()
+
+    if geom is None:
+        geom = make_geom()
+
+    _, energy_axis_true = energy_axes()
+    empty = MapDataset.create(
+        geom, energy_axis_true=energy_axis_true, binsz_irf=0.5, name="dataset"
+    )
+    maker = MapDatasetMaker(selection=["exposure", "background", "psf", "edisp"])
+    dataset = maker.run(empty, observation)
+
+    models = Models([make_models(), FoVBackgroundModel(dataset_name=dataset.name)])
+    dataset.models = models
+
+    if sample_events:
+        sampler = MapDatasetEventSampler(random_state=0)
+        observation.events = sampler.run(dataset, observation)
+        dataset.counts.fill_events(observation.events)
+    else:
+        dataset.fake(random_state=0)
+
+    return dataset
+
+
+def make_spectrum_dataset(observation=None, name="spectrum"):
+    """Spectrum dataset with Poisson counts from a point-like region."""
+    if observation is None:
+        observation = make_observation()
+
+    energy_axis, energy_axis_true = energy_axes(nbin=20)
+    region = CircleSkyRegion(center=POSITION, radius=0.1 * u.deg)
+    geom = RegionGeom.create(region=region, axes=[energy_axis])
+
+    empty = SpectrumDataset.create(geom, energy_axis_true=energy_axis_true, name=name)
+    maker = SpectrumDatasetMaker(selection=["exposure", "background", "edisp"])
+    dataset = maker.run(empty, observation)
+
+    dataset.models = make_models(spatial=False)
+    dataset.fake(random_state=0)
+    return dataset
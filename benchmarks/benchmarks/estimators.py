@@ -0,0 +1,111 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmarks of the flux, excess and test statistic estimators."""
+
+import numpy as np
+import astropy.units as u
+from gammapy.datasets import Datasets
+from gammapy.estimators import (
+    ExcessMapEstimator,
+    FluxPointsEstimator,
+    LightCurveEstimator,
+    TSMapEstimator,
+)
+from gammapy.modeling.models import (
+    PointSpatialModel,
+    PowerLawSpectralModel,
+    SkyModel,
+)
+from .data import make_geom, make_map_dataset, make_observation, make_spectrum_dataset
+
+
+class ExcessMapEstimatorSuite:
+    """Correlated excess and significance maps."""
+
+    def setup(self):
+        self.dataset = make_map_dataset(geom=make_geom(nbin=4), sample_events=False)
+        self.dataset.models = None
+
+    def time_excess_map(self):
+        ExcessMapEstimator(correlation_radius="0.1 deg").run(self.dataset)
+
+    def time_excess_map_energy_bins(self):
+        estimator = ExcessMapEstimator(
+            correlation_radius="0.1 deg", energy_edges=[0.1, 1, 10, 100] * u.TeV
+        )
+        estimator.run(self.dataset)
+
+
+class TSMapEstimatorSuite:
+    """Test statistic map of a point source."""
+
+    timeout = 600
+
+    def setup(self):
+        geom = make_geom(width=2 * u.deg, binsz=0.04 * u.deg, nbin=4)
+        self.dataset = make_map_dataset(geom=geom, sample_events=False)
+        self.dataset.models = None
+        self.model = SkyModel(
+            spatial_model=PointSpatialModel(),
+            spectral_model=PowerLawSpectralModel(index=2),
+        )
+
+    def time_ts_map(self):
+        estimator = TSMapEstimator(
+            model=self.model, kernel_width="0.3 deg", selection_optional=[]
+        )
+        estimator.run(self.dataset)
+
+    def time_ts_map_downsampled(self):
+        estimator = TSMapEstimator(
+            model=self.model,
+            kernel_width="0.3 deg",
+            downsampling_factor=2,
+            selection_optional=[],
+        )
+        estimator.run(self.dataset)
+
+
+class FluxPointsEstimatorSuite:
+    """Flux points of a 1D spectrum dataset."""
+
+    timeout = 300
+
+    def setup(self):
+        self.dataset = make_spectrum_dataset()
+        self.energy_edges = np.geomspace(0.1, 100, 7) * u.TeV
+
+    def time_flux_points(self):
+        estimator = FluxPointsEstimator(
+            energy_edges=self.energy_edges, source="source", selection_optional=[]
+        )
+        estimator.run([self.dataset])
+
+    def time_flux_points_ul(self):
+        estimator = FluxPointsEstimator(
+            energy_edges=self.energy_edges, source="source", selection_optional=["ul"]
+        )
+        estimator.run([self.dataset])
+
+
+class LightCurveEstimatorSuite:
+    """Light curve of a source observed in consecutive runs."""
+
+    timeout = 300
+    n_obs = 10
+
+    def setup(self):
+        datasets = []
+        for idx in range(self.n_obs):
+            observation = make_observation(
+                obs_id=idx, tstart=idx * u.h, livetime=0.5 * u.h
+            )
+            dataset = make_spectrum_dataset(observation=observation, name=f"obs-{idx}")
+            datasets.append(dataset)
+
+        self.datasets = Datasets(datasets)
+
+    def time_light_curve(self):
+        estimator = LightCurveEstimator(
+            energy_edges=[0.1, 100] * u.TeV, source="source", selection_optional=[]
+        )
+        estimator.run(self.datasets)
@@ -0,0 +1,44 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmarks of the likelihood fit of 1D and 3D datasets."""
+
+from gammapy.modeling import Fit
+from .data import make_map_dataset, make_spectrum_dataset
+
+
+class FitSpectrumDatasetSuite:
+    """Fit of a power law to a 1D spectrum dataset."""
+
+    def setup(self):
+        self.dataset = make_spectrum_dataset()
+        self.values = self.dataset.models.parameters.value.copy()
+
+    def teardown(self):
+        self.dataset.models.parameters.value = self.values
+
+    def time_fit_run(self):
+        Fit().run(datasets=[self.dataset])
+
+    def time_stat_sum(self):
+        self.dataset.stat_sum()
+
+
+class FitMapDatasetSuite:
+    """Fit of a Gaussian source and a background model to a 3D map dataset."""
+
+    timeout = 600
+
+    def setup(self):
+        self.dataset = make_map_dataset(sample_events=False)
+        self.values = self.dataset.models.parameters.value.copy()
+
+    def teardown(self):
+        self.dataset.models.parameters.value = self.values
+
+    def time_fit_run(self):
+        Fit().run(datasets=[self.dataset])
+
+    def time_npred(self):
+        self.dataset.npred()
+
+    def time_stat_sum(self):
+        self.dataset.stat_sum()
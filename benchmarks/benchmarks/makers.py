@@ -0,0 +1,80 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmarks of the data reduction makers."""
+
+import astropy.units as u
+from gammapy.datasets import MapDataset, MapDatasetEventSampler
+from gammapy.makers import FoVBackgroundMaker, MapDatasetMaker, SafeMaskMaker
+from .data import energy_axes, make_geom, make_map_dataset, make_observation
+
+
+class MapDatasetMakerSuite:
+    """Reduction of a single observation to a 3D map dataset."""
+
+    timeout = 300
+
+    def setup(self):
+        self.observation = make_observation()
+        # attaches the sampled event list to the observation
+        make_map_dataset(observation=self.observation)
+
+        _, energy_axis_true = energy_axes()
+        self.empty = MapDataset.create(
+            make_geom(), energy_axis_true=energy_axis_true, binsz_irf=0.5
+        )
+        self.maker = MapDatasetMaker()
+
+    def time_map_dataset_maker(self):
+        self.maker.run(self.empty, self.observation)
+
+    def peakmem_map_dataset_maker(self):
+        self.maker.run(self.empty, self.observation)
+
+
+class SafeMaskMakerSuite:
+    """Safe mask computation on a 3D map dataset."""
+
+    def setup(self):
+        self.observation = make_observation()
+        self.dataset = make_map_dataset(
+            observation=self.observation, sample_events=False
+        )
+        self.maker = SafeMaskMaker(
+            methods=["aeff-default", "aeff-max", "edisp-bias", "offset-max"],
+            aeff_percent=10,
+            bias_percent=10,
+            offset_max=2.5 * u.deg,
+        )
+
+    def time_safe_mask_maker(self):
+        self.maker.run(self.dataset, self.observation)
+
+
+class FoVBackgroundMakerSuite:
+    """Background normalisation with the field of view method."""
+
+    def setup(self):
+        self.dataset = make_map_dataset(sample_events=False)
+        self.dataset.models = None
+        self.maker = FoVBackgroundMaker(method="fit")
+
+    def time_fov_background_maker_scale(self):
+        FoVBackgroundMaker(method="scale").run(self.dataset)
+
+    def time_fov_background_maker_fit(self):
+        self.maker.run(self.dataset)
+
+
+class MapDatasetEventSamplerSuite:
+    """Event sampling from a 3D map dataset."""
+
+    timeout = 300
+
+    def setup(self):
+        self.observation = make_observation()
+        self.dataset = make_map_dataset(
+            observation=self.observation, sample_events=False
+        )
+
+    def time_event_sampler(self):
+        sampler = MapDatasetEventSampler(random_state=0)
+        sampler.run(self.dataset, self.observation)
@@ -0,0 +1,74 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Benchmarks of map interpolation, convolution and FITS serialisation."""
+
+import tempfile
+from pathlib import Path
+import numpy as np
+import astropy.units as u
+from gammapy.datasets import MapDataset
+from gammapy.irf import PSFKernel
+from gammapy.maps import Map
+from .data import make_geom, make_map_dataset
+
+
+class MapInterpSuite:
+    """Interpolation of a 3D map at random coordinates."""
+
+    params = ([1000, 100000], ["nearest", "linear"])
+    param_names = ["n_points", "method"]
+
+    def setup(self, n_points, method):
+        geom = make_geom()
+        self.map = Map.from_geom(geom)
+        rng = np.random.default_rng(0)
+        self.map.data = rng.uniform(size=geom.data_shape)
+
+        coords = geom.get_coord().flat
+        idx = rng.integers(0, len(coords["energy"]), n_points)
+        self.coords = {
+            "skycoord": coords.skycoord[idx],
+            "energy": coords["energy"][idx],
+        }
+
+    def time_interp_by_coord(self, n_points, method):
+        self.map.interp_by_coord(self.coords, method=method)
+
+
+class WcsNDMapConvolveSuite:
+    """Convolution of a 3D map with a PSF kernel."""
+
+    params = [0.05, 0.2]
+    param_names = ["sigma"]
+
+    def setup(self, sigma):
+        geom = make_geom()
+        self.map = Map.from_geom(geom)
+        rng = np.random.default_rng(0)
+        self.map.data = rng.poisson(1, size=geom.data_shape).astype(float)
+        self.kernel = PSFKernel.from_gauss(geom, sigma=sigma * u.deg)
+
+    def time_convolve(self, sigma):
+        self.map.convolve(self.kernel)
+
+    def time_convolve_direct(self, sigma):
+        self.map.convolve(self.kernel, method="direct")
+
+
+class MapDatasetIOSuite:
+    """Writing and reading a 3D map dataset to and from FITS."""
+
+    def setup(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.dataset = make_map_dataset(sample_events=False)
+        self.dataset.models = None
+        self.filename = Path(self.tmpdir.name) / "dataset.fits.gz"
+        self.dataset.write(self.filename)
+
+    def teardown(self):
+        self.tmpdir.cleanup()
+
+    def time_write(self):
+        self.dataset.write(self.filename, overwrite=True)
+
+    def time_read(self):
+        MapDataset.read(self.filename)
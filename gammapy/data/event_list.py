@@ -23,6 +23,9 @@ __all__ = ["EventList"]
 
 log = logging.getLogger(__name__)
 
+EVENTS_LAZY_LOADING = False
+"""Default for ``lazy`` in `EventList.read`, also used when loading observations."""
+
 
 class EventList:
     """Event list.
@@ -44,6 +47,12 @@ class EventList:
     meta : `~gammapy.data.EventListMetaData`
         The metadata. Default is None.
 
+    Notes
+    -----
+    Event lists read with ``lazy=True`` are memory-mapped and their columns are
+    only read on first access. Selections and `map_coord` access the required
+    columns only, while accessing ``table`` reads all of them.
+
     Examples
     --------
     >>> from gammapy.data import EventList
@@ -79,6 +88,50 @@ class EventList:
         self.table = self._validate_table(table)
         self.meta = meta or EventListMetaData()
 
+    @classmethod
+    def _from_columns(cls, columns, meta=None):
+        """Create lazy event list from columns, see `~gammapy.data.io.GADFEventColumns`."""
+        events = cls.__new__(cls)
+        events._table = None
+        events._columns = columns
+        events.meta = meta or EventListMetaData()
+        return events
+
+    @property
+    def table(self):
+        """Event list table as an `~astropy.table.Table`."""
+        if self._table is None:
+            self._table = self._validate_table(self._columns.to_table())
+            self._columns = None
+        return self._table
+
+    @table.setter
+    def table(self, value):
+        self._table = value
+        self._columns = None
+
+    @property
+    def is_lazy(self):
+        """Whether the columns are read on first access."""
+        return self._table is None
+
+    @property
+    def _table_meta(self):
+        if self.is_lazy:
+            return self._columns.meta
+        return self.table.meta
+
+    @property
+    def _colnames(self):
+        if self.is_lazy:
+            return self._columns.colnames
+        return self.table.colnames
+
+    def _column(self, name):
+        if self.is_lazy:
+            return self._columns[name]
+        return self.table[name]
+
     @staticmethod
     def _create_empty_list():
         """Create empty event list table."""
@@ -127,7 +180,7 @@ class EventList:
             return f"<pre>{html.escape(str(self))}</pre>"
 
     @classmethod
-    def read(cls, filename, hdu="EVENTS", checksum=False, **kwargs):
+    def read(cls, filename, hdu="EVENTS", checksum=False, lazy=None, **kwargs):
         """Read from FITS file.
 
         Format specification: :ref:`gadf:iact-events`
@@ -140,10 +193,16 @@ class EventList:
             Name of events HDU. Default is "EVENTS".
         checksum : bool
             If True checks both DATASUM and CHECKSUM cards in the file headers. Default is False.
+        lazy : bool, optional
+            If True the file is memory-mapped and the columns are only read on
+            first access. Default is None, which uses `EVENTS_LAZY_LOADING`.
         """
         from gammapy.data.io import EventListReader
 
-        return EventListReader(hdu, checksum).read(filename, **kwargs)
+        if lazy is None:
+            lazy = EVENTS_LAZY_LOADING
+
+        return EventListReader(hdu, checksum, lazy=lazy).read(filename, **kwargs)
 
     def to_table_hdu(self, format="gadf"):
         """
@@ -198,18 +257,18 @@ class EventList:
         info = self.__class__.__name__ + "\n"
         info += "-" * len(self.__class__.__name__) + "\n\n"
 
-        instrument = self.table.meta.get("INSTRUME")
+        instrument = self._table_meta.get("INSTRUME")
         info += f"\tInstrument       : {instrument}\n"
 
-        telescope = self.table.meta.get("TELESCOP")
+        telescope = self._table_meta.get("TELESCOP")
         info += f"\tTelescope        : {telescope}\n"
 
-        obs_id = self.table.meta.get("OBS_ID", "")
+        obs_id = self._table_meta.get("OBS_ID", "")
         info += f"\tObs. ID          : {obs_id}\n\n"
 
-        info += f"\tNumber of events : {len(self.table)}\n"
-        if self.table.meta.get("TSTART", False):
-            rate = len(self.table) / self.observation_time_duration
+        info += f"\tNumber of events : {len(self)}\n"
+        if self._table_meta.get("TSTART", False):
+            rate = len(self) / self.observation_time_duration
             info += f"\tEvent rate       : {rate:.3f}\n\n"
 
             info += f"\tTime start       : {self.observation_time_start}\n"
@@ -225,12 +284,14 @@ class EventList:
         return info.expandtabs(tabsize=2)
 
     def __len__(self):
+        if self.is_lazy:
+            return len(self._columns)
         return self.table.__len__()
 
     @property
     def time_ref(self):
         """Time reference as a `~astropy.time.Time` object."""
-        return time_ref_from_dict(self.table.meta)
+        return time_ref_from_dict(self._table_meta)
 
     @property
     def time(self):
@@ -242,22 +303,24 @@ class EventList:
         With 32-bit floats times will be incorrect by a few seconds
         when e.g. adding them to the reference time.
         """
-        return self.table["TIME"]
+        return self._column("TIME")
 
     @property
     def observation_time_start(self):
         """Observation start time as a `~astropy.time.Time` object."""
-        return self.time_ref + u.Quantity(self.table.meta["TSTART"], "second")
+        return self.time_ref + u.Quantity(self._table_meta["TSTART"], "second")
 
     @property
     def observation_time_stop(self):
         """Observation stop time as a `~astropy.time.Time` object."""
-        return self.time_ref + u.Quantity(self.table.meta["TSTOP"], "second")
+        return self.time_ref + u.Quantity(self._table_meta["TSTOP"], "second")
 
     @property
     def radec(self):
         """Event RA / DEC sky coordinates as a `~astropy.coordinates.SkyCoord` object."""
-        return SkyCoord(self.table["RA"], self.table["DEC"], unit="deg", frame="icrs")
+        return SkyCoord(
+            self._column("RA"), self._column("DEC"), unit="deg", frame="icrs"
+        )
 
     @property
     def galactic(self):
@@ -270,7 +333,7 @@ class EventList:
     @property
     def energy(self):
         """Event energies as a `~astropy.units.Quantity`."""
-        return self.table["ENERGY"].quantity
+        return self._column("ENERGY").quantity
 
     @property
     def galactic_median(self):
@@ -313,6 +376,9 @@ class EventList:
         >>> print(len(events2.table))
         97978
         """
+        if self.is_lazy:
+            return self._from_columns(self._columns.select(row_specifier))
+
         table = self.table[row_specifier]
         return self.__class__(table=table)
 
@@ -427,7 +493,7 @@ class EventList:
         >>> print(len(event_list_id.table))
         38
         """
-        col_data = self.table[parameter]
+        col_data = self._column(parameter)
 
         if is_range:
             # Handle numerical range case
@@ -673,11 +739,11 @@ class EventList:
         """
         coord = {"skycoord": self.radec}
 
-        cols = {k.upper(): v for k, v in self.table.columns.items()}
+        cols = {name.upper(): name for name in self._colnames}
 
         for axis in geom.axes:
             try:
-                col = cols[axis.name.upper()]
+                col = self._column(cols[axis.name.upper()])
                 coord[axis.name] = u.Quantity(col).to(axis.unit)
             except KeyError:
                 raise KeyError(f"Column not found in event list: {axis.name!r}")
@@ -719,7 +785,7 @@ class EventList:
     @property
     def observatory_earth_location(self):
         """Observatory location as an `~astropy.coordinates.EarthLocation` object."""
-        return earth_location_from_dict(self.table.meta)
+        return earth_location_from_dict(self._table_meta)
 
     @property
     def observation_time_duration(self):
@@ -740,7 +806,7 @@ class EventList:
         - In Fermi-LAT it is automatically provided in the header of the event list.
         - In IACTs is computed as ``t_live = t_observation * (1 - f_dead)`` where ``f_dead`` is the dead-time fraction.
         """
-        return u.Quantity(self.table.meta["LIVETIME"], "second")
+        return u.Quantity(self._table_meta["LIVETIME"], "second")
 
     @property
     def observation_dead_time_fraction(self):
@@ -757,7 +823,7 @@ class EventList:
         The dead-time fraction is used in the live-time computation,
         which in turn is used in the exposure and flux computation.
         """
-        return 1 - self.table.meta["DEADC"]
+        return 1 - self._table_meta["DEADC"]
 
     @property
     def altaz_frame(self):
@@ -772,14 +838,14 @@ class EventList:
     @property
     def altaz_from_table(self):
         """ALT / AZ position from table as a `~astropy.coordinates.SkyCoord` object."""
-        lon = self.table["AZ"]
-        lat = self.table["ALT"]
+        lon = self._column("AZ")
+        lat = self._column("ALT")
         return SkyCoord(lon, lat, unit="deg", frame=self.altaz_frame)
 
     @property
     def pointing_radec(self):
         """Pointing RA / DEC sky coordinates as a `~astropy.coordinates.SkyCoord` object."""
-        info = self.table.meta
+        info = self._table_meta
         lon, lat = info["RA_PNT"], info["DEC_PNT"]
         return SkyCoord(lon, lat, unit="deg", frame="icrs")
 
@@ -861,7 +927,7 @@ class EventList:
     @property
     def is_pointed_observation(self):
         """Whether observation is pointed."""
-        return "RA_PNT" in self.table.meta
+        return "RA_PNT" in self._table_meta
 
     def peek(self, allsky=False):
         """Quick look plots.
@@ -1,8 +1,10 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import warnings
 import logging
+import numpy as np
 from astropy.io import fits
-from astropy.table import Table
+from astropy.io.fits.connect import REMOVE_KEYWORDS, is_column_keyword
+from astropy.table import Column, Table
 import astropy.units as u
 from astropy.units import Quantity
 from gammapy.data import EventListMetaData, EventList, ObservationTable
@@ -13,6 +15,115 @@ from gammapy.utils.time import time_ref_from_dict
 log = logging.getLogger(__name__)
 
 
+GADF_EVENTS_REQUIRED_COLNAMES = ["TIME", "ENERGY", "RA", "DEC"]
+GADF_EVENTS_REMOVED_COLNAMES = ["RA", "DEC", "GLON", "GLAT", "TIME", "ENERGY"]
+
+
+def _check_gadf_colnames(colnames):
+    # This is not a strict check on input. It just checks that required information is there.
+    required_colnames = set(GADF_EVENTS_REQUIRED_COLNAMES)
+    if not required_colnames.issubset(set(colnames)):
+        missing_columns = required_colnames.difference(set(colnames))
+        raise ValueError(
+            f"GADF event table does not contain required columns {missing_columns}"
+        )
+
+
+class GADFEventColumns:
+    """Lazily converted columns of a GADF events table.
+
+    The columns are views of the, usually memory-mapped, FITS table data and are
+    only read and converted to the internal representation on first access.
+    Row selections are stored as indices and applied to the accessed columns only.
+
+    Parameters
+    ----------
+    data : `~astropy.io.fits.FITS_rec`
+        Events table data.
+    meta : dict
+        Table meta data.
+    rows : `~numpy.ndarray`, optional
+        Indices of the selected rows. Default is None, which selects all rows.
+    """
+
+    def __init__(self, data, meta, rows=None):
+        self._data = data
+        self.meta = meta
+        self._rows = rows
+        self._columns = {}
+
+    def __len__(self):
+        if self._rows is None:
+            return len(self._data)
+        return len(self._rows)
+
+    @property
+    def colnames(self):
+        """Column names, in the order of the internal event list table."""
+        colnames = [
+            name
+            for name in self._data.columns.names
+            if name not in GADF_EVENTS_REMOVED_COLNAMES
+        ]
+        return GADF_EVENTS_REQUIRED_COLNAMES + colnames
+
+    def __getitem__(self, name):
+        if name not in self._columns:
+            self._columns[name] = self._read_column(name)
+        return self._columns[name]
+
+    def _read_column(self, name):
+        if name not in self.colnames:
+            raise KeyError(f"Column not found in event list: {name!r}")
+
+        values = self._data[name]
+
+        if self._rows is not None:
+            values = values[self._rows]
+
+        if name == "TIME":
+            met = u.Quantity(values.astype("float64"), "second")
+            return time_ref_from_dict(self.meta) + met
+
+        unit = self._data.columns[name].unit
+        return Column(values, name=name, unit=unit, copy=False)
+
+    def select(self, row_specifier):
+        """Select a row subset, without reading the columns.
+
+        Parameters
+        ----------
+        row_specifier : slice or int or array of int or bool
+            Specification for rows to select.
+
+        Returns
+        -------
+        columns : `GADFEventColumns`
+            Columns with row subset selected.
+        """
+        if self._rows is None and isinstance(row_specifier, slice):
+            rows = np.arange(*row_specifier.indices(len(self)))
+        elif self._rows is None:
+            rows = np.arange(len(self))[row_specifier]
+        else:
+            rows = self._rows[row_specifier]
+
+        columns = self.__class__(
+            data=self._data, meta=self.meta, rows=np.atleast_1d(rows)
+        )
+
+        # columns already converted are subset directly
+        for name, column in self._columns.items():
+            columns._columns[name] = column[row_specifier]
+
+        return columns
+
+    def to_table(self):
+        """Convert to `~astropy.table.Table`, reading all columns."""
+        columns = {name: self[name] for name in self.colnames}
+        return Table(columns, meta=self.meta, copy=False)
+
+
 class EventListReader:
     """Reader class for EventList.
 
@@ -24,25 +135,43 @@ class EventListReader:
         Name of events HDU. Default is "EVENTS".
     checksum : bool
         If True checks both DATASUM and CHECKSUM cards in the file headers. Default is False.
+    lazy : bool
+        If True the file is memory-mapped and the event list columns are only
+        read on first access. Default is False.
     """
 
-    def __init__(self, hdu="EVENTS", checksum=False):
+    def __init__(self, hdu="EVENTS", checksum=False, lazy=False):
         self.hdu = hdu
         self.checksum = checksum
+        self.lazy = lazy
+
+    @staticmethod
+    def _lazy_from_gadf_hdu(events_hdu):
+        """Create lazy EventList from gadf HDU, see `GADFEventColumns`."""
+        meta = {}
+        for key, value in events_hdu.header.items():
+            if key in REMOVE_KEYWORDS or key in ["", "COMMENT", "HISTORY"]:
+                continue
+            if is_column_keyword(key):
+                continue
+            meta[key] = value
+
+        data = events_hdu.data
+        _check_gadf_colnames(data.columns.names)
+
+        columns = GADFEventColumns(data=data, meta=meta)
+        return EventList._from_columns(columns, EventListMetaData.from_header(meta))
 
     @staticmethod
-    def from_gadf_hdu(events_hdu):
+    def from_gadf_hdu(events_hdu, lazy=False):
         """Create EventList from gadf HDU."""
+        if lazy:
+            return EventListReader._lazy_from_gadf_hdu(events_hdu)
+
         table = Table.read(events_hdu)
         meta = EventListMetaData.from_header(table.meta)
 
-        # This is not a strict check on input. It just checks that required information is there.
-        required_colnames = set(["RA", "DEC", "TIME", "ENERGY"])
-        if not required_colnames.issubset(set(table.colnames)):
-            missing_columns = required_colnames.difference(set(table.colnames))
-            raise ValueError(
-                f"GADF event table does not contain required columns {missing_columns}"
-            )
+        _check_gadf_colnames(table.colnames)
 
         met = u.Quantity(table["TIME"].astype("float64"), "second")
         time = time_ref_from_dict(table.meta) + met
@@ -52,13 +181,11 @@ class EventListReader:
         ra = table["RA"].quantity
         dec = table["DEC"].quantity
 
-        removed_colnames = ["RA", "DEC", "GLON", "GLAT", "TIME", "ENERGY"]
-
         new_table = Table(
             {"TIME": time, "ENERGY": energy, "RA": ra, "DEC": dec}, meta=table.meta
         )
         for name in table.colnames:
-            if name not in removed_colnames:
+            if name not in GADF_EVENTS_REMOVED_COLNAMES:
                 new_table.add_column(table[name])
 
         return EventList(new_table, meta)
@@ -81,8 +208,9 @@ class EventListReader:
             If None, will try to guess from header.
         """
         filename = make_path(filename)
+        memmap = True if self.lazy else None
 
-        with fits.open(filename) as hdulist:
+        with fits.open(filename, memmap=memmap) as hdulist:
             events_hdu = hdulist[self.hdu]
 
             if self.checksum:
@@ -96,7 +224,7 @@ class EventListReader:
                 format = self.identify_format_from_hduclass(events_hdu)
 
             if format == "gadf" or format == "ogip":
-                return self.from_gadf_hdu(events_hdu)
+                return self.from_gadf_hdu(events_hdu, lazy=self.lazy)
             else:
                 raise ValueError(f"Unknown format :{format}")
 
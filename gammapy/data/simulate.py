@@ -21,7 +21,7 @@ class ObservationsEventsSampler(parallel.ParallelMixin):
     n_jobs : int, optional
         Number of processes to run in parallel.
         By default, the value is 1, unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` has been modified.
-    parallel_backend : {'multiprocessing', 'ray'}, optional
+    parallel_backend : {'multiprocessing', 'ray', 'futures', 'threading'}, optional
         Which backend to use for multiprocessing.
         Default is None.
     """
@@ -273,6 +273,61 @@ class TestEventListHESS:
         )
 
 
+@requires_data()
+class TestEventListLazy:
+    def setup_class(self):
+        filename = "$GAMMAPY_DATA/cta-1dc/data/baseline/gps/gps_baseline_110380.fits"
+        self.events = EventList.read(filename)
+        self.events_lazy = EventList.read(filename, lazy=True)
+
+    def test_basics(self):
+        events = EventList.read(
+            "$GAMMAPY_DATA/cta-1dc/data/baseline/gps/gps_baseline_110380.fits",
+            lazy=True,
+        )
+        assert events.is_lazy
+        assert len(events) == 106217
+        assert "Number of events : 106217" in str(events)
+        assert events.is_lazy
+
+        assert_allclose(events.energy, self.events.energy)
+        assert_time_allclose(events.time, self.events.time)
+        assert events.meta.event_class == self.events.meta.event_class
+
+        assert events.table.colnames == self.events.table.colnames
+        assert not events.is_lazy
+
+    def test_selection(self):
+        energy_range = [1, 10] * u.TeV
+        center = SkyCoord(0, 0, unit="deg", frame="galactic")
+        region = CircleSkyRegion(center=center, radius=1 * u.deg)
+
+        selected = self.events.select_energy(energy_range).select_region(region)
+        selected_lazy = self.events_lazy.select_energy(energy_range)
+        selected_lazy = selected_lazy.select_region(region)
+
+        assert selected_lazy.is_lazy
+        assert len(selected_lazy) == len(selected)
+        assert_allclose(selected_lazy.energy, selected.energy)
+        assert_allclose(selected_lazy.table["MC_ID"], selected.table["MC_ID"])
+
+        time_interval = self.events.time[[10, 1000]]
+        selected = self.events.select_time(time_interval)
+        selected_lazy = self.events_lazy.select_time(time_interval)
+        assert len(selected_lazy) == len(selected)
+
+    def test_map_coord(self):
+        axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+        geom = WcsGeom.create(skydir=(0, 0), width=4, frame="galactic", axes=[axis])
+
+        coord = self.events.map_coord(geom)
+        coord_lazy = self.events_lazy.map_coord(geom)
+
+        assert_allclose(coord_lazy.lon, coord.lon)
+        assert_allclose(coord_lazy["energy"], coord["energy"])
+        assert self.events_lazy.is_lazy
+
+
 @requires_data()
 class TestEventListFermi:
     def setup_class(self):
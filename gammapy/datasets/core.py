@@ -7,6 +7,7 @@ import logging
 import numpy as np
 from astropy import units as u
 from astropy.table import Table, vstack
+import gammapy.utils.profiling as profiling
 from gammapy.data import GTI
 from gammapy.modeling.models import DatasetModels, Models
 from gammapy.utils.scripts import make_name, make_path, read_yaml, to_yaml, write_yaml
@@ -17,6 +18,34 @@ log = logging.getLogger(__name__)
 
 __all__ = ["Dataset", "Datasets"]
 
+# Whether to compute the joint statistic of map datasets sharing the same
+# geometry with `~gammapy.datasets.evaluator.BatchedMapEvaluator`
+USE_BATCHED_EVALUATION = False
+
+# Relative step of the finite differences used to derive the priors
+PRIOR_GRADIENT_STEP = 1e-6
+
+_BATCHED_KEY_NAMES = [
+    "models",
+    "counts",
+    "exposure",
+    "background",
+    "psf",
+    "edisp",
+    "mask_safe",
+    "mask_fit",
+]
+
+
+def _is_same_key(key, other):
+    """Whether two lists of lists of objects contain the identical objects."""
+    if len(key) != len(other):
+        return False
+
+    return all(
+        a is b for items, others in zip(key, other) for a, b in zip(items, others)
+    )
+
 
 class Dataset(abc.ABC):
     """Dataset abstract base class.
@@ -87,6 +116,17 @@ class Dataset(abc.ABC):
         """Total statistic given the current model parameters without the priors."""
         return self._fit_statistic.stat_sum_dataset(self)
 
+    @property
+    def has_stat_sum_gradient(self):
+        """Whether the derivatives of the statistic are available, see `stat_sum_gradient`."""
+        return False
+
+    def stat_sum_gradient(self, parameters):
+        """Derivatives of the statistic without the priors, see `MapDataset.stat_sum_gradient`."""
+        raise NotImplementedError(
+            f"Statistic gradient not supported for {self.__class__.__name__}"
+        )
+
     def stat_array(self):
         """Statistic array, one value per data point."""
         return self._fit_statistic.stat_array_dataset(self)
@@ -142,6 +182,15 @@ class Datasets(collections.abc.MutableSequence):
     ----------
     datasets : `Dataset` or list of `Dataset`
         Datasets.
+
+    Notes
+    -----
+    If ``gammapy.datasets.core.USE_BATCHED_EVALUATION`` is set to True and the
+    datasets are `~gammapy.datasets.MapDataset` objects sharing the same
+    geometry, the joint statistic is computed with a single fused evaluation of
+    all datasets, see `~gammapy.datasets.evaluator.BatchedMapEvaluator`. The
+    stacked data is cached and rebuilt when the datasets, their maps or their
+    models are reassigned.
     """
 
     def __init__(self, datasets=None):
@@ -164,6 +213,7 @@ class Datasets(collections.abc.MutableSequence):
         self._datasets = datasets
         self._covariance = None
         self._penalties = None
+        self._batched_evaluator_cache = None
 
     @property
     def parameters(self):
@@ -261,26 +311,120 @@ class Datasets(collections.abc.MutableSequence):
 
     def stat_sum(self):
         """Compute joint statistic function value."""
+        evaluator = self._batched_evaluator
+
+        if evaluator is not None:
+            prior_stat_sum = evaluator.parameters.prior_stat_sum()
+            for penalty in self._penalties or []:
+                prior_stat_sum += penalty.stat_sum()
+            with profiling.stage("Datasets.stat_sum_batched"):
+                stat_sum = evaluator.stat_sum()
+            return stat_sum + prior_stat_sum
+
         prior_stat_sum = 0.0
-        if self.models is not None:
-            prior_stat_sum = self.models.parameters.prior_stat_sum()
-            if self.models._penalties is not None:
-                for penalty in self.models._penalties:
+        models = self.models
+        if models is not None:
+            prior_stat_sum = models.parameters.prior_stat_sum()
+            if models._penalties is not None:
+                for penalty in models._penalties:
                     prior_stat_sum += penalty.stat_sum()
 
+        # avoid building the stage names in the fit loop when no profiler is active
+        if not profiling.is_active():
+            return sum(dataset.stat_sum() for dataset in self) + prior_stat_sum
+
         stat_sum = 0.0
         for dataset in self:
-            stat_sum += dataset.stat_sum()
+            with profiling.stage(f"{dataset.tag}.stat_sum[{dataset.name}]"):
+                stat_sum += dataset.stat_sum()
 
         return stat_sum + prior_stat_sum
 
+    @property
+    def has_stat_sum_gradient(self):
+        """Whether the joint statistic derivatives are available, see `stat_sum_gradient`."""
+        return all(dataset.has_stat_sum_gradient for dataset in self)
+
+    def stat_sum_gradient(self):
+        """Derivatives of the joint statistic with respect to the free parameter values.
+
+        The likelihood terms are derived analytically by the datasets, see
+        `~gammapy.datasets.MapDataset.stat_sum_gradient`. The priors and penalties,
+        which are cheap to evaluate, are derived by central finite differences.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives with respect to the values of the free unique parameters,
+            in the order of ``Datasets.parameters.free_parameters``.
+        """
+        models = self.models
+        parameters = models.parameters.unique_parameters.free_parameters
+
+        gradient = np.zeros(len(parameters))
+        for dataset in self:
+            gradient += dataset.stat_sum_gradient(parameters)
+
+        penalties = models._penalties or []
+        penalty_parameters = [
+            par for penalty in penalties for par in penalty.parameters
+        ]
+
+        def prior_stat_sum():
+            value = models.parameters.prior_stat_sum()
+            for penalty in penalties:
+                value += penalty.stat_sum()
+            return value
+
+        for idx, par in enumerate(parameters):
+            if par.prior is None and not any(par is _ for _ in penalty_parameters):
+                continue
+
+            value = par.value
+            step = PRIOR_GRADIENT_STEP * max(abs(value), 1.0)
+            par.value = value + step
+            stat_upper = prior_stat_sum()
+            par.value = value - step
+            stat_lower = prior_stat_sum()
+            par.value = value
+            gradient[idx] += (stat_upper - stat_lower) / (2 * step)
+
+        return gradient
+
     def _stat_sum_likelihood(self):
         """Total statistic given the current model parameters without the priors."""
+        evaluator = self._batched_evaluator
+
+        if evaluator is not None:
+            return evaluator.stat_sum()
+
         stat_sum = 0
         for dataset in self:
             stat_sum += dataset._stat_sum_likelihood()
         return stat_sum
 
+    @property
+    def _batched_evaluator(self):
+        """Batched evaluator, if enabled and supported by the datasets."""
+        if not USE_BATCHED_EVALUATION:
+            return None
+
+        from .evaluator import BatchedMapEvaluator
+
+        key = [
+            [dataset] + [getattr(dataset, name, None) for name in _BATCHED_KEY_NAMES]
+            for dataset in self
+        ]
+
+        cache = self._batched_evaluator_cache
+        if cache is None or not _is_same_key(cache[0], key):
+            evaluator = None
+            if BatchedMapEvaluator.is_supported(self):
+                evaluator = BatchedMapEvaluator(self)
+            self._batched_evaluator_cache = key, evaluator
+
+        return self._batched_evaluator_cache[1]
+
     def select_time(self, time_min, time_max, atol="1e-6 s"):
         """Select datasets in a given time interval.
 
@@ -1,24 +1,174 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import html
 import logging
+from collections import OrderedDict
 import numpy as np
+import scipy.signal
 import astropy.units as u
-from astropy.coordinates import angular_separation
+from astropy.coordinates import SkyCoord, angular_separation
 from astropy.utils import lazyproperty
 from regions import CircleSkyRegion
 import matplotlib.pyplot as plt
+import gammapy.utils.profiling as profiling
 from gammapy.irf import EDispKernel, PSFKernel
 from gammapy.maps import HpxNDMap, Map, RegionNDMap, WcsNDMap
-from gammapy.modeling.models import PointSpatialModel, TemplateNPredModel
+from gammapy.modeling import Parameters
+from gammapy.modeling.models import (
+    FoVBackgroundModel,
+    PointSpatialModel,
+    TemplateNPredModel,
+)
+from gammapy.utils.compilation import get_fit_statistics_compiled
 from .utils import apply_edisp
 
 PSF_MAX_RADIUS = None
 PSF_CONTAINMENT = 0.999
 CUTOUT_MARGIN = 0.1 * u.deg
+IRF_KERNEL_CACHE_SIZE = 0
 
 log = logging.getLogger(__name__)
 
 
+class IRFKernelCache:
+    """Least recently used cache of PSF and energy dispersion kernels.
+
+    Kernels are cached by the spatial bin of the IRF map closest to the requested
+    position, together with the target geometry. A cached kernel is computed at the
+    center of that bin, so that model components moving by less than the IRF map
+    bin size reuse the same kernel. Positions outside of the IRF map are not cached.
+
+    The cache is shared by the model evaluators of a `~gammapy.datasets.MapDataset`,
+    see `~gammapy.datasets.MapDataset.irf_kernel_cache`.
+
+    Parameters
+    ----------
+    max_size : int, optional
+        Maximum number of cached kernels. A value of zero disables the cache.
+        Default is None, which uses ``IRF_KERNEL_CACHE_SIZE``.
+    """
+
+    def __init__(self, max_size=None):
+        if max_size is None:
+            max_size = IRF_KERNEL_CACHE_SIZE
+
+        self.max_size = max_size
+        self._kernels = OrderedDict()
+
+    def __len__(self):
+        return len(self._kernels)
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(max_size={self.max_size}, size={len(self)})"
+
+    def clear(self):
+        """Remove all cached kernels."""
+        self._kernels.clear()
+
+    @staticmethod
+    def _spatial_bin(irf, position):
+        """Index and center of the IRF map spatial bin closest to the position."""
+        geom = irf._irf_map.geom.to_image()
+
+        if irf.has_single_spatial_bin:
+            return (0,), position
+
+        idx = tuple(int(_) for _ in np.ravel(geom.coord_to_idx(position)))
+
+        if min(idx) < 0:
+            return None, position
+
+        lon, lat = geom.pix_to_coord(idx)
+        center = SkyCoord(
+            np.squeeze(lon), np.squeeze(lat), unit="deg", frame=geom.frame
+        )
+        return idx, center
+
+    def _get(self, name, irf, target, position, compute, **kwargs):
+        if self.max_size <= 0:
+            return compute(position=position, **kwargs)
+
+        idx, position_bin = self._spatial_bin(irf, position)
+
+        if idx is None:
+            return compute(position=position, **kwargs)
+
+        # the IRF and target geometry are stored with the kernel, so that their ids
+        # stay unique
+        key = (name, id(irf), id(target), idx, repr(sorted(kwargs.items())))
+
+        if key in self._kernels:
+            self._kernels.move_to_end(key)
+            profiling.count(f"IRFKernelCache.{name}.hit")
+            return self._kernels[key][-1]
+
+        profiling.count(f"IRFKernelCache.{name}.miss")
+        kernel = compute(position=position_bin, **kwargs)
+        self._kernels[key] = (irf, target, kernel)
+
+        while len(self._kernels) > self.max_size:
+            self._kernels.popitem(last=False)
+
+        return kernel
+
+    def get_psf_kernel(self, psf, position, geom, containment, max_radius):
+        """Get PSF kernel, see `~gammapy.irf.PSFMap.get_psf_kernel`.
+
+        Parameters
+        ----------
+        psf : `~gammapy.irf.PSFMap`
+            PSF map.
+        position : `~astropy.coordinates.SkyCoord`
+            Position of the model component.
+        geom : `~gammapy.maps.Geom`
+            Target geometry.
+        containment : float
+            Containment fraction to use as size of the kernel.
+        max_radius : `~astropy.coordinates.Angle`
+            Maximum angular size of the kernel map.
+
+        Returns
+        -------
+        kernel : `~gammapy.irf.PSFKernel`
+            PSF kernel.
+        """
+        return self._get(
+            "psf",
+            psf,
+            geom,
+            position,
+            psf.get_psf_kernel,
+            geom=geom,
+            containment=containment,
+            max_radius=max_radius,
+        )
+
+    def get_edisp_kernel(self, edisp, position, energy_axis):
+        """Get energy dispersion kernel, see `~gammapy.irf.EDispMap.get_edisp_kernel`.
+
+        Parameters
+        ----------
+        edisp : `~gammapy.irf.EDispMap` or `~gammapy.irf.EDispKernelMap`
+            Energy dispersion map.
+        position : `~astropy.coordinates.SkyCoord`
+            Position of the model component.
+        energy_axis : `~gammapy.maps.MapAxis`
+            Reconstructed energy axis.
+
+        Returns
+        -------
+        kernel : `~gammapy.irf.EDispKernel`
+            Energy dispersion kernel.
+        """
+        return self._get(
+            "edisp",
+            edisp,
+            energy_axis,
+            position,
+            edisp.get_edisp_kernel,
+            energy_axis=energy_axis,
+        )
+
+
 class MapEvaluator:
     """Sky model evaluation on maps.
 
@@ -48,6 +198,17 @@ class MapEvaluator:
         This mode is recommended for global optimization algorithms.
     use_cache : bool
         Use npred caching.
+    irf_kernel_cache : `IRFKernelCache`, optional
+        Cache of the PSF and energy dispersion kernels, shared between evaluators.
+        Default is None, which creates a new cache for the evaluator.
+    dtype : {None, "float32"}, optional
+        Data type of the exposure product, PSF convolution and energy dispersion.
+        With "float32" these cube operations are computed in single precision,
+        which halves the memory traffic on large cubes. The spectral and spatial
+        model integrals are still computed in double precision and cast, as they
+        are much smaller than the cube. The predicted counts are summed and
+        compared to the data in double precision by the dataset.
+        Default is None, which evaluates in double precision.
     """
 
     def __init__(
@@ -60,6 +221,8 @@ class MapEvaluator:
         mask=None,
         evaluation_mode="local",
         use_cache=True,
+        irf_kernel_cache=None,
+        dtype=None,
     ):
         self.model = model
         self.exposure = exposure
@@ -68,6 +231,12 @@ class MapEvaluator:
         self.mask = mask
         self.gti = gti
         self.use_cache = use_cache
+
+        if irf_kernel_cache is None:
+            irf_kernel_cache = IRFKernelCache()
+
+        self.irf_kernel_cache = irf_kernel_cache
+        self.dtype = None if dtype is None else np.dtype(dtype)
         self.contributes = True
         self.psf_containment = None
 
@@ -189,6 +358,7 @@ class MapEvaluator:
         """
         # TODO: simplify and clean up
         log.debug("Updating model evaluator")
+        profiling.count("MapEvaluator.update")
 
         del self.position
         del self.cutout_width
@@ -199,9 +369,10 @@ class MapEvaluator:
         del self._edisp_diagonal
         if edisp:
             energy_axis = geom.axes["energy"]
-            self.edisp = edisp.get_edisp_kernel(
-                position=self.position, energy_axis=energy_axis
-            )
+            with profiling.stage("MapEvaluator.edisp_kernel"):
+                self.edisp = self.irf_kernel_cache.get_edisp_kernel(
+                    edisp, position=self.position, energy_axis=energy_axis
+                )
             del self._edisp_diagonal
 
         # lookup psf
@@ -218,12 +389,15 @@ class MapEvaluator:
                 kwargs = {energy_name: energy_values, "rad": geom.region.radius}
                 self.psf_containment = psf.containment(**kwargs)
             else:
-                self.psf = psf.get_psf_kernel(
-                    position=self.position,
-                    geom=geom_psf,
-                    containment=PSF_CONTAINMENT,
-                    max_radius=PSF_MAX_RADIUS,
-                )
+                with profiling.stage("MapEvaluator.psf_kernel") as record:
+                    self.psf = self.irf_kernel_cache.get_psf_kernel(
+                        psf,
+                        position=self.position,
+                        geom=geom_psf,
+                        containment=PSF_CONTAINMENT,
+                        max_radius=PSF_MAX_RADIUS,
+                    )
+                    record.size = self.psf.psf_kernel_map.data.size
 
         self.exposure = exposure
         if self.evaluation_mode == "local":
@@ -260,9 +434,18 @@ class MapEvaluator:
         """
         return self.model.evaluate_geom(self.geom, self.gti)
 
+    def _cast(self, data):
+        """Cast data to the evaluation data type, if defined."""
+        if self.dtype is None:
+            return data
+        return data.astype(self.dtype, copy=False)
+
     def compute_flux(self, *arg):
         """Compute flux."""
-        return self.model.integrate_geom(self.geom, self.gti)
+        flux = self.model.integrate_geom(self.geom, self.gti)
+        if self.dtype is not None:
+            flux.data = self._cast(flux.data)
+        return flux
 
     def compute_flux_psf_convolved(self, *arg):
         """Compute PSF convolved and temporal model corrected flux."""
@@ -277,7 +460,9 @@ class MapEvaluator:
         if self.model.temporal_model:
             value *= self.compute_temporal_norm()
 
-        return Map.from_geom(geom=self.geom, data=value.value, unit=value.unit)
+        return Map.from_geom(
+            geom=self.geom, data=self._cast(value.value), unit=value.unit
+        )
 
     def compute_flux_spatial(self):
         """Compute spatial flux using caching."""
@@ -319,6 +504,9 @@ class MapEvaluator:
             geom = geom.to_image()
         value = self.model.spatial_model.integrate_geom(geom)
 
+        if self.dtype is not None:
+            value.data = self._cast(value.data)
+
         if self.psf and self.model.apply_irf["psf"]:
             value = self.apply_psf(value)
 
@@ -331,6 +519,8 @@ class MapEvaluator:
             energy[:-1],
             energy[1:],
         )
+        value = self._cast(value)
+
         if self.geom.is_hpx:
             return value.reshape((-1, 1))
         else:
@@ -348,7 +538,14 @@ class MapEvaluator:
 
         For now just divide flux cube by exposure.
         """
-        npred = (flux.quantity * self.exposure.quantity).to_value("")
+        if self.dtype is None:
+            npred = (flux.quantity * self.exposure.quantity).to_value("")
+        else:
+            # avoid double precision temporaries of the size of the cube
+            scale = (flux.unit * self.exposure.unit).to("")
+            npred = self._cast(flux.data) * self._cast(self.exposure.data)
+            npred *= self.dtype.type(scale)
+
         return Map.from_geom(self.geom, data=npred, unit="")
 
     def apply_psf(self, npred):
@@ -369,10 +566,10 @@ class MapEvaluator:
             Predicted counts in reconstructed energy bins.
         """
         if self.model.apply_irf["edisp"] and self.edisp:
-            return apply_edisp(npred, self.edisp)
+            return apply_edisp(npred, self.edisp, dtype=self.dtype)
         else:
             if "energy_true" in npred.geom.axes.names:
-                return apply_edisp(npred, self._edisp_diagonal)
+                return apply_edisp(npred, self._edisp_diagonal, dtype=self.dtype)
             else:
                 return npred
 
@@ -412,10 +609,138 @@ class MapEvaluator:
             Predicted counts on the map (in reconstructed energy bins).
         """
         if self.parameters_changed or not self.use_cache:
+            profiling.count("MapEvaluator.npred.miss")
             del self._compute_npred
+        else:
+            profiling.count("MapEvaluator.npred.hit")
 
         return self._compute_npred
 
+    @property
+    def has_gradient(self):
+        """Whether the npred derivatives with respect to the free parameters are available."""
+        if isinstance(self.model, TemplateNPredModel):
+            return len(self.model.parameters.free_parameters) == 0
+
+        if self.model.temporal_model is not None:
+            return False
+
+        for model in [self.model.spectral_model, self.model.spatial_model]:
+            if model is None or len(model.parameters.free_parameters) == 0:
+                continue
+            if not model.has_gradient:
+                return False
+        return True
+
+    def compute_npred_gradient(self):
+        """Evaluate the derivatives of the predicted counts.
+
+        The IRFs are linear in the flux, therefore the derivatives of the flux
+        are propagated with the same sequence of methods as the flux itself.
+
+        Returns
+        -------
+        gradient : dict of `~gammapy.maps.Map`
+            Derivatives of the predicted counts (in reconstructed energy bins)
+            with respect to the parameter values, keyed by free
+            `~gammapy.modeling.Parameter`.
+        """
+        if isinstance(self.model, TemplateNPredModel):
+            return {}
+
+        gradient = {}
+        for parameter, flux in self._compute_flux_gradient().items():
+            value = flux
+            for method in self.methods_sequence[1:]:
+                value = method(value)
+            gradient[parameter] = value
+        return gradient
+
+    def _compute_flux_gradient(self):
+        """Compute the derivatives of the flux with respect to the free parameters."""
+        spectral_model = self.model.spectral_model
+        spatial_model = self.model.spatial_model
+
+        energy = self.geom.axes["energy_true"].edges
+        shape = (-1, 1) if self.geom.is_hpx else (-1, 1, 1)
+
+        spectral = self.compute_flux_spectral()
+        spectral_gradient = {}
+        if spectral_model.parameters.free_parameters:
+            spectral_gradient = spectral_model.integral_gradient(
+                energy[:-1], energy[1:]
+            )
+
+        spatial, spatial_gradient = 1, {}
+        if spatial_model:
+            if self.apply_psf_after_edisp:
+                spatial = spatial_model.integrate_geom(self.geom).quantity
+                if spatial_model.parameters.free_parameters:
+                    gradient = spatial_model.integrate_geom_gradient(self.geom)
+                    spatial_gradient = {
+                        name: value.quantity for name, value in gradient.items()
+                    }
+            elif self.psf_containment is not None:
+                spatial = self.psf_containment
+            else:
+                spatial = self.compute_flux_spatial()
+                if isinstance(spatial, Map):
+                    spatial = spatial.quantity
+                if spatial_model.parameters.free_parameters:
+                    spatial_gradient = self._compute_flux_spatial_gradient()
+
+        unit = spectral.unit
+        ones = np.ones(self.geom.data_shape)
+
+        values = {}
+        for par in spectral_model.parameters.free_parameters:
+            value = spectral_gradient[par.name].reshape(shape) * spatial
+            values[par] = value.to_value(unit / par.unit) * ones
+
+        if spatial_model:
+            # with PSF containment correction the flux does not depend on the position
+            for par in spatial_model.parameters.free_parameters:
+                value = spectral * spatial_gradient.get(par.name, 0 / par.unit)
+                values[par] = value.to_value(unit / par.unit) * ones
+
+        return {
+            par: Map.from_geom(geom=self.geom, data=data, unit=unit)
+            for par, data in values.items()
+        }
+
+    def _compute_flux_spatial_gradient(self):
+        """Compute the derivatives of the spatial flux, see `_compute_flux_spatial`."""
+        if self.geom.is_region:
+            if self.geom.region is None or self.psf is None:
+                return {}
+
+            wcs_geom = self.geom.to_wcs_geom(width_min=self.cutout_width)
+            gradient = self._compute_flux_spatial_geom_gradient(wcs_geom)
+            weights = wcs_geom.region_weights(regions=[self.geom.region])
+
+            result = {}
+            for name, values in gradient.items():
+                if not values.geom.has_energy_axis:
+                    axes = [self.geom.axes["energy_true"].squash()]
+                    values = values.to_cube(axes=axes)
+                value = values.quantity * weights
+                result[name] = value.sum(axis=(1, 2), keepdims=True)
+            return result
+
+        gradient = self._compute_flux_spatial_geom_gradient(self.geom)
+        return {name: values.quantity for name, values in gradient.items()}
+
+    def _compute_flux_spatial_geom_gradient(self, geom):
+        """Compute the derivatives of the spatial flux, applying the PSF if necessary."""
+        if not self.model.spatial_model.is_energy_dependent:
+            geom = geom.to_image()
+        gradient = self.model.spatial_model.integrate_geom_gradient(geom)
+
+        if self.psf and self.model.apply_irf["psf"]:
+            gradient = {name: self.apply_psf(value) for name, value in gradient.items()}
+
+        return gradient
+
     @property
     def parameters_changed(self):
         """Parameters changed."""
@@ -589,3 +914,373 @@ class MapEvaluator:
             ax = fig.add_subplot(nrows, 2, idx + 1)
             ax.set_title("Energy dispersion matrix")
             self.edisp.plot_matrix(ax=ax)
+
+
+class _BatchedModelComponent:
+    """Evaluation of a single sky model on a set of datasets sharing the same geometry.
+
+    Parameters
+    ----------
+    model : `~gammapy.modeling.models.SkyModel`
+        Sky model.
+    indices : list of int
+        Indices of the datasets the model applies to.
+    """
+
+    def __init__(self, model, indices):
+        self.model = model
+        self.indices = np.array(indices)
+        self._position = None
+        self._psf_kernels = None
+        self._edisp_matrices = None
+        self._spectral_values = None
+        self._spectral = None
+        self._spatial_values = None
+        self._spatial = None
+        self._temporal_values = None
+        self._temporal = None
+        self._parameter_values = None
+        self._npred = None
+
+    @lazyproperty
+    def _norm_idx(self):
+        names = self.model.parameters.names
+        ind = [idx for idx, name in enumerate(names) if name in ["norm", "amplitude"]]
+        if len(ind) == 1:
+            return ind[0]
+
+    @property
+    def _irf_position_changed(self):
+        if self._position is None:
+            return True
+
+        if self.model.evaluation_radius is None:
+            return False
+
+        lon_cached, lat_cached = self._position
+        lon, lat = self.model.position_lonlat
+        separation = angular_separation(lon, lat, lon_cached, lat_cached)
+        return separation > (self.model.evaluation_radius + CUTOUT_MARGIN).to_value(
+            u.rad
+        )
+
+    def _update_irfs(self, batch):
+        """Look up the IRF kernels of all datasets at the model position."""
+        self._position = self.model.position_lonlat
+        position = self.model.position
+        datasets = [batch.datasets[idx] for idx in self.indices]
+
+        if batch.has_psf and self.model.spatial_model:
+            kernels = [
+                dataset.psf.get_psf_kernel(
+                    position=position,
+                    geom=batch.geom_exposure,
+                    containment=PSF_CONTAINMENT,
+                    max_radius=PSF_MAX_RADIUS,
+                ).psf_kernel_map.data
+                for dataset in datasets
+            ]
+            shape = np.max([kernel.shape for kernel in kernels], axis=0)
+            self._psf_kernels = np.zeros((len(kernels),) + tuple(shape))
+
+            for kernel, data in zip(kernels, self._psf_kernels):
+                pad = (shape[-2:] - kernel.shape[-2:]) // 2
+                data[:, pad[0] : shape[-2] - pad[0], pad[1] : shape[-1] - pad[1]] = (
+                    kernel
+                )
+
+        if batch.has_edisp:
+            energy_axis = batch.geom.axes["energy"]
+            self._edisp_matrices = np.stack(
+                [
+                    dataset.edisp.get_edisp_kernel(
+                        position=position, energy_axis=energy_axis
+                    ).pdf_matrix
+                    for dataset in datasets
+                ]
+            )
+        else:
+            self._edisp_matrices = batch.edisp_diagonal[np.newaxis]
+
+        self._spatial_values = None
+
+    def _compute_spectral(self, batch):
+        values = self.model.spectral_model.parameters.value
+
+        if self._spectral is None or np.any(self._spectral_values != values):
+            energy = batch.geom_exposure.axes["energy_true"].edges
+            flux = self.model.spectral_model.integral(energy[:-1], energy[1:])
+            self._spectral = flux.reshape((-1, 1, 1))
+            self._spectral_values = values
+
+        return self._spectral
+
+    def _compute_spatial(self, batch):
+        if not self.model.spatial_model:
+            return u.Quantity(np.ones((1, 1, 1, 1)))
+
+        values = self.model.spatial_model.parameters.value
+
+        if self._spatial is None or np.any(self._spatial_values != values):
+            geom = batch.geom_exposure
+
+            if not self.model.spatial_model.is_energy_dependent:
+                geom = geom.to_image()
+
+            spatial = self.model.spatial_model.integrate_geom(geom).quantity
+            spatial = spatial.reshape((-1,) + geom.data_shape[-2:])
+
+            if self._psf_kernels is not None:
+                # convolve all image planes of all datasets in a single call
+                shape = self._psf_kernels.shape[:2] + spatial.shape[-2:]
+                data = scipy.signal.fftconvolve(
+                    np.broadcast_to(spatial.value, shape),
+                    self._psf_kernels,
+                    mode="same",
+                    axes=(-2, -1),
+                )
+                spatial = u.Quantity(data, spatial.unit, copy=False)
+            else:
+                spatial = spatial[np.newaxis]
+
+            self._spatial = spatial
+            self._spatial_values = values
+
+        return self._spatial
+
+    def _compute_temporal(self, batch):
+        if not self.model.temporal_model:
+            return 1
+
+        values = self.model.temporal_model.parameters.value
+
+        if self._temporal is None or np.any(self._temporal_values != values):
+            norms = [
+                np.sum(
+                    self.model.temporal_model.integral(
+                        batch.datasets[idx].gti.time_start,
+                        batch.datasets[idx].gti.time_stop,
+                    )
+                )
+                for idx in self.indices
+            ]
+            self._temporal = np.reshape(norms, (-1, 1, 1, 1))
+            self._temporal_values = values
+
+        return self._temporal
+
+    def compute_npred(self, batch):
+        """Compute predicted counts for all the datasets the model applies to.
+
+        Parameters
+        ----------
+        batch : `BatchedMapEvaluator`
+            Batched evaluator holding the stacked dataset arrays.
+
+        Returns
+        -------
+        npred : `~numpy.ndarray`
+            Predicted counts with shape (n_datasets, energy, lat, lon).
+        """
+        values = self.model.parameters.value
+
+        if self._npred is not None:
+            changed = self._parameter_values != values
+
+            if not np.any(changed):
+                return self._npred
+
+            idx = self._norm_idx
+            if idx is not None and np.count_nonzero(changed) == 1 and changed[idx]:
+                if self._parameter_values[idx] != 0:
+                    self._npred *= values[idx] / self._parameter_values[idx]
+                    self._parameter_values = values
+                    return self._npred
+
+        if self._irf_position_changed:
+            self._update_irfs(batch)
+
+        flux = (
+            self._compute_spectral(batch)
+            * self._compute_spatial(batch)
+            * self._compute_temporal(batch)
+        )
+        exposure = batch.exposure[self.indices]
+        npred = flux.to_value(1 / batch.exposure_unit) * exposure
+
+        # apply energy dispersion to all datasets with one matrix product
+        shape = npred.shape
+        npred = np.matmul(
+            self._edisp_matrices.transpose(0, 2, 1),
+            npred.reshape(shape[:2] + (-1,)),
+        )
+        self._npred = npred.reshape((shape[0], -1) + shape[2:])
+        self._parameter_values = values
+        return self._npred
+
+
+class BatchedMapEvaluator:
+    """Joint sky model evaluation for map datasets sharing the same geometry.
+
+    The counts, exposure and background of the datasets are stacked into
+    arrays of shape (n_datasets, energy, lat, lon). Each model component is
+    evaluated once on the common geometry and folded with the PSF and energy
+    dispersion of all the datasets it applies to using vectorized operations.
+    The Cash statistic of all datasets is then computed in a single call.
+
+    The model components are evaluated on the full dataset geometry, which
+    corresponds to the "global" evaluation mode of `MapEvaluator`.
+
+    Parameters
+    ----------
+    datasets : list of `~gammapy.datasets.MapDataset`
+        Map datasets, see `BatchedMapEvaluator.is_supported`.
+    """
+
+    def __init__(self, datasets):
+        self.datasets = list(datasets)
+
+        dataset = self.datasets[0]
+        self.geom = dataset.counts.geom
+        self.geom_exposure = dataset.exposure.geom
+
+        self.exposure_unit = dataset.exposure.unit
+        self.exposure = np.stack(
+            [_.exposure.quantity.to_value(self.exposure_unit) for _ in self.datasets]
+        )
+
+        self.counts = np.stack([_.counts.data for _ in self.datasets]).astype(float)
+
+        masks = [_.mask for _ in self.datasets]
+        if all(mask is None for mask in masks):
+            self.mask = None
+        else:
+            self.mask = np.stack(
+                [
+                    np.ones(self.geom.data_shape, dtype=bool)
+                    if mask is None
+                    else mask.data.astype(bool)
+                    for mask in masks
+                ]
+            )
+
+        self.has_psf = dataset.psf is not None
+        self.has_edisp = dataset.edisp is not None
+
+        self.edisp_diagonal = EDispKernel.from_diagonal_response(
+            energy_axis_true=self.geom_exposure.axes["energy_true"],
+            energy_axis=self.geom.axes["energy"],
+        ).pdf_matrix
+
+        components, models = {}, {}
+        for idx, dataset in enumerate(self.datasets):
+            for model in dataset.models or []:
+                models[model] = model
+                if not isinstance(model, FoVBackgroundModel):
+                    components.setdefault(model, []).append(idx)
+
+        self.parameters = Parameters.from_stack(
+            [model.parameters for model in models]
+        ).unique_parameters
+
+        self.components = [
+            _BatchedModelComponent(model=model, indices=indices)
+            for model, indices in components.items()
+        ]
+        self._npred = np.zeros(self.counts.shape)
+
+    @staticmethod
+    def is_supported(datasets):
+        """Whether the datasets can be evaluated jointly.
+
+        This requires `~gammapy.datasets.MapDataset` objects with the Cash
+        statistic, WCS geometries identical for the counts and for the exposure,
+        PSF defined in true energy and either all or none of the datasets
+        having a PSF and an energy dispersion. The models must apply all IRFs
+        and must not be `~gammapy.modeling.models.TemplateNPredModel`.
+
+        Parameters
+        ----------
+        datasets : list of `~gammapy.datasets.Dataset`
+            Datasets.
+
+        Returns
+        -------
+        supported : bool
+            Whether the datasets are supported.
+        """
+        datasets = list(datasets)
+
+        if not datasets:
+            return False
+
+        for dataset in datasets:
+            if dataset.tag != "MapDataset" or dataset.stat_type != "cash":
+                return False
+
+            if dataset.counts is None or dataset.exposure is None:
+                return False
+
+            if dataset.psf is not None and dataset.psf.energy_name != "energy_true":
+                return False
+
+            for model in dataset.models or []:
+                if isinstance(model, FoVBackgroundModel):
+                    continue
+
+                if isinstance(model, TemplateNPredModel) or not all(
+                    model.apply_irf.values()
+                ):
+                    return False
+
+        reference = datasets[0]
+
+        if reference.counts.geom.is_region or reference.counts.geom.is_hpx:
+            return False
+
+        for dataset in datasets[1:]:
+            if (dataset.psf is None) != (reference.psf is None):
+                return False
+
+            if (dataset.edisp is None) != (reference.edisp is None):
+                return False
+
+            if dataset.counts.geom != reference.counts.geom:
+                return False
+
+            if dataset.exposure.geom != reference.exposure.geom:
+                return False
+
+        return True
+
+    def compute_npred(self):
+        """Compute total predicted counts of all datasets.
+
+        Returns
+        -------
+        npred : `~numpy.ndarray`
+            Predicted counts with shape (n_datasets, energy, lat, lon).
+        """
+        npred = self._npred
+        npred.fill(0)
+
+        for component in self.components:
+            npred[component.indices] += component.compute_npred(self)
+
+        for idx, dataset in enumerate(self.datasets):
+            if dataset.background:
+                npred[idx] += dataset.npred_background().data
+
+        npred[npred < 0.0] = 0
+        return npred
+
+    def stat_sum(self):
+        """Total Cash statistic of all datasets given the current model parameters."""
+        counts, npred = self.counts, self.compute_npred()
+
+        if self.mask is not None:
+            counts, npred = counts[self.mask], npred[self.mask]
+
+        return get_fit_statistics_compiled()["cash_sum_compiled"](
+            counts.ravel(), npred.ravel()
+        )
@@ -5,6 +5,7 @@ from scipy.stats import median_abs_deviation as mad
 import astropy.units as u
 from astropy.io import fits
 from astropy.table import Table
+from astropy.utils import lazyproperty
 from regions import CircleSkyRegion, RectangleSkyRegion
 import matplotlib.pyplot as plt
 from matplotlib.colors import LogNorm
@@ -16,6 +17,7 @@ from gammapy.modeling.models import DatasetModels, FoVBackgroundModel, Models
 from gammapy.stats import (
     CashCountsStatistic,
     WStatCountsStatistic,
+    cash,
     get_wstat_mu_bkg,
 )
 from gammapy.utils.fits import HDULocation, LazyFitsData
@@ -49,7 +51,11 @@ MIGRA_AXIS_DEFAULT = MapAxis.from_bounds(
 BINSZ_IRF_DEFAULT = 0.2 * u.deg
 
 EVALUATION_MODE = "local"
+EVALUATION_DTYPE = None
 USE_NPRED_CACHE = True
+USE_INCREMENTAL_NPRED = False
+INCREMENTAL_NPRED_MAX_CHANGES = 100
+STAT_TYPES_GRADIENT = ["cash", "cash_weighted", "wstat"]
 
 
 def create_map_dataset_geoms(
@@ -450,6 +456,23 @@ class MapDataset(Dataset):
     on the MapDataset is accessed. If it was accessed once it is cached for
     the next time.
 
+    If ``gammapy.datasets.map.USE_INCREMENTAL_NPRED`` is True, the total predicted
+    signal counts are kept between calls, and only the contributions of the models
+    whose parameters changed are subtracted and added again within their cutout.
+    The total is rebuilt from the stored contributions after
+    ``gammapy.datasets.map.INCREMENTAL_NPRED_MAX_CHANGES`` updates, to bound the
+    accumulated rounding errors. For the "cash" statistic, the statistic is then
+    only recomputed on the affected pixels, and the predicted background counts
+    only when the background model parameters or map change. As for the npred
+    caching of the evaluators, changes of the IRFs, masks or data done in place
+    are not tracked.
+
+    If ``gammapy.datasets.map.EVALUATION_DTYPE`` is set to "float32", the model
+    components are multiplied by the exposure, convolved with the PSF and the energy
+    dispersion in single precision, see `~gammapy.datasets.evaluator.MapEvaluator`.
+    The model integrals, the total predicted counts and the fit statistic are still
+    computed in double precision.
+
     Examples
     --------
     >>> from gammapy.datasets import MapDataset
@@ -489,6 +512,7 @@ class MapDataset(Dataset):
     """
 
     tag = "MapDataset"
+    _supports_incremental_stat = True
     counts = LazyFitsData(cache=True)
     exposure = LazyFitsData(cache=True)
     edisp = LazyFitsData(cache=True)
@@ -675,6 +699,7 @@ class MapDataset(Dataset):
     def models(self, models):
         """Models setter."""
         self._evaluators = {}
+        self._reset_incremental_npred()
         if models is not None:
             models = DatasetModels(models)
             models = models.select(datasets_names=self.name)
@@ -688,6 +713,8 @@ class MapDataset(Dataset):
                         evaluation_mode=EVALUATION_MODE,
                         gti=self.gti,
                         use_cache=USE_NPRED_CACHE,
+                        irf_kernel_cache=self.irf_kernel_cache,
+                        dtype=EVALUATION_DTYPE,
                     )
                     self._evaluators[model.name] = evaluator
 
@@ -698,6 +725,17 @@ class MapDataset(Dataset):
         """Model evaluators."""
         return self._evaluators
 
+    @lazyproperty
+    def irf_kernel_cache(self):
+        """Cache of PSF and energy dispersion kernels shared by the model evaluators.
+
+        The cache is disabled by default. Its size can be set with
+        ``dataset.irf_kernel_cache.max_size`` or globally with
+        `~gammapy.datasets.evaluator.IRF_KERNEL_CACHE_SIZE`, see
+        `~gammapy.datasets.evaluator.IRFKernelCache`.
+        """
+        return meval.IRFKernelCache()
+
     @property
     def _geom(self):
         """Main analysis geometry."""
@@ -841,6 +879,9 @@ class MapDataset(Dataset):
         npred_sig : `gammapy.maps.Map`
             Map of the predicted signal counts.
         """
+        if self._use_incremental_npred and model_names is None and stack:
+            return self._update_npred_signal_incremental().copy()
+
         npred_total = Map.from_geom(self._geom, dtype=float)
 
         evaluators = self.evaluators
@@ -879,6 +920,259 @@ class MapDataset(Dataset):
 
         return npred_total
 
+    @property
+    def _use_incremental_npred(self):
+        return USE_INCREMENTAL_NPRED and USE_NPRED_CACHE
+
+    def stat_sum(self):
+        """Total statistic given the current model parameters and priors."""
+        if self._use_incremental_stat:
+            return self._stat_sum_incremental()
+        return super().stat_sum()
+
+    def _stat_sum_likelihood(self):
+        """Total statistic given the current model parameters without the priors."""
+        if self._use_incremental_stat:
+            return self._stat_sum_incremental()
+        return super()._stat_sum_likelihood()
+
+    @property
+    def _use_incremental_stat(self):
+        return (
+            self._use_incremental_npred
+            and self._supports_incremental_stat
+            and self.stat_type == "cash"
+            and self.counts is not None
+        )
+
+    def _reset_incremental_npred(self):
+        """Reset the running total of the predicted signal counts."""
+        self._npred_signal_total = None
+        self._npred_contributions = {}
+        self._npred_changed_slices = []
+        self._npred_n_updates = 0
+        self._stat_incremental = None
+
+    def _update_npred_signal_incremental(self):
+        """Update the running total of the predicted signal counts.
+
+        Only the contributions of the evaluators whose model parameters changed
+        since the last call are recomputed: their previous contribution is subtracted
+        from the total and the new one is added, within their cutout region.
+
+        Returns
+        -------
+        npred_sig : `gammapy.maps.Map`
+            Running total of the predicted signal counts. It must not be modified.
+        """
+        if getattr(self, "_npred_signal_total", None) is None:
+            self._reset_incremental_npred()
+            self._npred_signal_total = Map.from_geom(self._geom, dtype=float)
+            self._npred_changed_slices = [Ellipsis]
+
+        data = self._npred_signal_total.data
+
+        for name, evaluator in self.evaluators.items():
+            values = evaluator.model.parameters.value
+            previous = self._npred_contributions.get(name)
+
+            if previous is not None and np.all(previous[0] == values):
+                continue
+
+            if evaluator.needs_update:
+                evaluator.update(
+                    self.exposure,
+                    self.psf,
+                    self.edisp,
+                    self._geom,
+                    self.mask_image,
+                )
+
+            if previous is not None and previous[1] is not None:
+                _, slices, contribution = previous
+                data[slices] -= contribution
+                self._npred_changed_slices.append(slices)
+
+            slices, contribution = None, None
+
+            if evaluator.contributes:
+                npred = evaluator.compute_npred()
+                slices, contribution = self._npred_cutout(npred)
+                data[slices] += contribution
+                self._npred_changed_slices.append(slices)
+
+            self._npred_contributions[name] = (values, slices, contribution)
+            self._npred_n_updates += 1
+
+        # rebuild the total from the contributions, to remove the rounding errors
+        # accumulated by the repeated subtractions and additions
+        if self._npred_n_updates > INCREMENTAL_NPRED_MAX_CHANGES:
+            data[...] = 0
+
+            for _, slices, contribution in self._npred_contributions.values():
+                if slices is not None:
+                    data[slices] += contribution
+
+            self._npred_n_updates = 0
+            self._npred_changed_slices = [Ellipsis]
+
+        if len(self._npred_changed_slices) > INCREMENTAL_NPRED_MAX_CHANGES:
+            self._npred_changed_slices = [Ellipsis]
+
+        return self._npred_signal_total
+
+    def _npred_cutout(self, npred):
+        """Slices of the dataset geometry covered by an evaluator npred and its data."""
+        geom = self._geom
+
+        if geom == npred.geom:
+            slices, cutout_slices = Ellipsis, Ellipsis
+        elif geom.is_aligned(npred.geom):
+            cutout_slices = npred.geom.cutout_slices(geom)
+            slices = cutout_slices["parent-slices"]
+            slices = Ellipsis, slices[0], slices[1]
+            cutout_slices = cutout_slices["cutout-slices"]
+            cutout_slices = Ellipsis, cutout_slices[0], cutout_slices[1]
+        else:
+            raise ValueError(
+                "Can only stack equivalent maps or cutout of the same map."
+            )
+
+        contribution = np.nan_to_num(
+            npred.data[cutout_slices].astype(float), nan=0, posinf=0, neginf=0
+        )
+        return slices, contribution
+
+    def _stat_sum_incremental(self):
+        """Cash statistic sum, only recomputed where the predicted counts changed."""
+        npred_signal = self._update_npred_signal_incremental().data
+        background_values = None
+
+        if self.background_model:
+            background_values = self.background_model.parameters.value
+
+        key = (self.counts, self.mask_safe, self.mask_fit, self.background)
+        state = self._stat_incremental
+
+        is_valid = (
+            state is not None
+            and all(a is b for a, b in zip(state["key"], key))
+            and np.all(state["background_values"] == background_values)
+        )
+
+        if is_valid:
+            slices_list = self._npred_changed_slices
+        else:
+            # the background is only recomputed if its parameters or map changed
+            background = self.npred_background()
+            mask = self.mask
+            state = {
+                "key": key,
+                "background_values": background_values,
+                "counts": self.counts.data.astype(float),
+                "background": None if background is None else background.data,
+                "mask": None if mask is None else mask.data.astype(bool),
+                "stat": np.zeros(self._geom.data_shape),
+                "stat_sum": 0.0,
+            }
+            slices_list = [Ellipsis]
+
+        for slices in slices_list:
+            npred = npred_signal[slices]
+
+            if state["background"] is not None:
+                npred = npred + state["background"][slices]
+
+            stat = cash(n_on=state["counts"][slices], mu_on=np.clip(npred, 0, None))
+
+            if state["mask"] is not None:
+                stat = np.where(state["mask"][slices], stat, 0)
+
+            state["stat_sum"] += stat.sum() - state["stat"][slices].sum()
+            state["stat"][slices] = stat
+
+        self._stat_incremental = state
+        self._npred_changed_slices = []
+        return state["stat_sum"]
+
+    @property
+    def has_stat_sum_gradient(self):
+        """Whether the statistic derivatives are available, see `stat_sum_gradient`.
+
+        This requires a WCS or region geometry, the "cash", "cash_weighted" or
+        "wstat" statistic and models providing the derivatives with respect to
+        all their free parameters.
+        """
+        if self._geom.is_hpx or self.stat_type not in STAT_TYPES_GRADIENT:
+            return False
+
+        if not all(_.has_gradient for _ in self.evaluators.values()):
+            return False
+
+        background_model = self.background_model
+        if background_model and background_model.parameters.free_parameters:
+            if self.stat_type == "wstat" or background_model.spatial_model:
+                return False
+            return background_model.spectral_model.has_gradient
+
+        return True
+
+    def stat_sum_gradient(self, parameters):
+        """Derivatives of the total statistic, without the priors.
+
+        The derivatives of the predicted counts are computed by the model
+        evaluators, see `~gammapy.datasets.evaluator.MapEvaluator`, and combined
+        with the derivative of the statistic with respect to the predicted counts.
+
+        Parameters
+        ----------
+        parameters : `~gammapy.modeling.Parameters`
+            Parameters for which the derivatives are computed. The derivatives
+            with respect to parameters not used by the dataset are zero.
+
+        Returns
+        -------
+        gradient : `~numpy.ndarray`
+            Derivatives with respect to the parameter values.
+        """
+        index = {id(par): idx for idx, par in enumerate(parameters)}
+        gradient = np.zeros(len(parameters))
+
+        stat_gradient = self._fit_statistic.stat_gradient_dataset(self)
+
+        for evaluator in self.evaluators.values():
+            if not evaluator.contributes:
+                continue
+
+            for par, npred in evaluator.compute_npred_gradient().items():
+                idx = index.get(id(par))
+                if idx is None:
+                    continue
+                npred_geom = Map.from_geom(self._geom, dtype=float)
+                npred_geom.stack(npred)
+                gradient[idx] += np.sum(stat_gradient * npred_geom.data)
+
+        background_model, background = self.background_model, self.background
+        if (
+            background_model
+            and background
+            and background_model.parameters.free_parameters
+            and self.stat_type != "wstat"
+        ):
+            coords = background.geom.get_coord(sparse=True)
+            spectral_gradient = background_model.spectral_model.gradient(
+                coords["energy"]
+            )
+            for par in background_model.parameters.free_parameters:
+                idx = index.get(id(par))
+                if idx is None:
+                    continue
+                npred = background.quantity * spectral_gradient[par.name]
+                npred = npred.to_value(background.unit / par.unit)
+                gradient[idx] += np.sum(stat_gradient * npred)
+
+        return gradient
+
     @classmethod
     def from_geoms(
         cls,
@@ -2602,6 +2896,7 @@ class MapDatasetOnOff(MapDataset):
     """
 
     tag = "MapDatasetOnOff"
+    _supports_incremental_stat = False
 
     def __init__(
         self,
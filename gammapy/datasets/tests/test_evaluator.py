@@ -6,11 +6,19 @@ from numpy.testing import assert_allclose
 import astropy.units as u
 from astropy.coordinates import SkyCoord
 from regions import CircleSkyRegion
-from gammapy.datasets.evaluator import MapEvaluator
-from gammapy.irf import PSFKernel, RecoPSFMap
+import gammapy.datasets.core
+import gammapy.datasets.map
+from gammapy.datasets import Datasets, MapDataset
+from gammapy.datasets.evaluator import (
+    BatchedMapEvaluator,
+    IRFKernelCache,
+    MapEvaluator,
+)
+from gammapy.irf import EDispKernelMap, PSFKernel, PSFMap, RecoPSFMap
 from gammapy.maps import Map, MapAxis, RegionGeom, RegionNDMap, WcsGeom
 from gammapy.modeling.models import (
     ConstantSpectralModel,
+    FoVBackgroundModel,
     GaussianSpatialModel,
     Models,
     PointSpatialModel,
@@ -164,6 +172,43 @@ def test_compute_npred_sign():
     assert np.all(npred_neg.data <= 0)
 
 
+def test_compute_npred_float32():
+    center = SkyCoord("0 deg", "0 deg", frame="galactic")
+    energy_axis_true = MapAxis.from_energy_bounds(
+        ".1 TeV", "10 TeV", nbin=2, name="energy_true"
+    )
+    geom = WcsGeom.create(
+        skydir=center,
+        width=1 * u.deg,
+        axes=[energy_axis_true],
+        frame="galactic",
+        binsz=0.02 * u.deg,
+    )
+
+    model = SkyModel(
+        spectral_model=PowerLawSpectralModel(amplitude="1e-11 TeV-1 s-1 cm-2"),
+        spatial_model=GaussianSpatialModel(sigma="0.1 deg", frame="galactic"),
+    )
+
+    exposure = Map.from_geom(geom, unit="m2 s", dtype=np.float64)
+    exposure.data += 1e6
+
+    psf = PSFKernel.from_gauss(geom, sigma="0.1 deg")
+
+    evaluator = MapEvaluator(model=model, exposure=exposure, psf=psf)
+    evaluator_32 = MapEvaluator(
+        model=model, exposure=exposure, psf=psf, dtype="float32"
+    )
+
+    flux = evaluator_32.compute_flux_psf_convolved()
+    assert flux.data.dtype == np.float32
+    assert evaluator_32.apply_exposure(flux).data.dtype == np.float32
+
+    npred = evaluator_32.compute_npred()
+    assert npred.data.dtype == np.float32
+    assert_allclose(npred.data, evaluator.compute_npred().data, rtol=1e-5, atol=1e-6)
+
+
 def test_psf_reco():
     center = SkyCoord("0 deg", "0 deg", frame="galactic")
     energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3, name="energy")
@@ -206,6 +251,65 @@ def test_psf_reco():
     assert_allclose(evaluator.compute_npred().data.sum(), 9e-12)
 
 
+def test_irf_kernel_cache():
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "1 TeV", "10 TeV", nbin=2, name="energy_true"
+    )
+    geom_irf = WcsGeom.create(skydir=(0, 0), npix=(4, 4), binsz=0.5, frame="galactic")
+    psf = PSFMap.from_gauss(
+        energy_axis_true=energy_axis_true, sigma=0.1 * u.deg, geom=geom_irf
+    )
+    geom = WcsGeom.create(
+        skydir=(0, 0),
+        width=2 * u.deg,
+        binsz=0.02,
+        frame="galactic",
+        axes=[energy_axis_true],
+    )
+
+    cache = IRFKernelCache(max_size=2)
+    kwargs = dict(psf=psf, geom=geom, containment=0.999, max_radius=None)
+
+    position = SkyCoord(0.3, 0.3, unit="deg", frame="galactic")
+    kernel = cache.get_psf_kernel(position=position, **kwargs)
+
+    position = SkyCoord(0.4, 0.2, unit="deg", frame="galactic")
+    assert cache.get_psf_kernel(position=position, **kwargs) is kernel
+    assert len(cache) == 1
+
+    reference = psf.get_psf_kernel(
+        position=SkyCoord(0.25, 0.25, unit="deg", frame="galactic"), geom=geom
+    )
+    assert_allclose(kernel.data, reference.data)
+
+    position = SkyCoord(-0.3, 0.3, unit="deg", frame="galactic")
+    assert cache.get_psf_kernel(position=position, **kwargs) is not kernel
+
+    position = SkyCoord(-0.3, -0.3, unit="deg", frame="galactic")
+    cache.get_psf_kernel(position=position, **kwargs)
+    assert len(cache) == 2
+
+    position = SkyCoord(0.3, 0.3, unit="deg", frame="galactic")
+    assert cache.get_psf_kernel(position=position, **kwargs) is not kernel
+
+    cache.clear()
+    assert len(cache) == 0
+
+    cache.max_size = 0
+    cache.get_psf_kernel(position=position, **kwargs)
+    assert len(cache) == 0
+
+    energy_axis = energy_axis_true.copy(name="energy")
+    dataset = MapDataset.create(geom.to_image().to_cube([energy_axis]))
+    dataset.models = [
+        SkyModel(spectral_model=PowerLawSpectralModel(), name="a"),
+        SkyModel(spectral_model=PowerLawSpectralModel(), name="b"),
+    ]
+    cache = dataset.irf_kernel_cache
+    assert dataset.evaluators["a"].irf_kernel_cache is cache
+    assert dataset.evaluators["b"].irf_kernel_cache is cache
+
+
 def test_peek_region_geom(evaluator):
     with mpl_plot_check():
         evaluator.peek()
@@ -277,3 +381,103 @@ def test_norm_only_changed():
     spectral_model.amplitude.value *= 2
     spectral_model.index.value *= 2
     assert not evaluator.parameter_norm_only_changed
+
+
+def get_batched_datasets(n_datasets=3, radial_exposure=False):
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    energy_axis_true = MapAxis.from_energy_bounds(
+        "0.5 TeV", "20 TeV", nbin=5, name="energy_true"
+    )
+    geom = WcsGeom.create(
+        skydir=(0, 0), binsz=0.04, width=2, frame="galactic", axes=[energy_axis]
+    )
+
+    datasets = Datasets()
+    for idx in range(n_datasets):
+        dataset = MapDataset.create(
+            geom, energy_axis_true=energy_axis_true, name=f"dataset-{idx}"
+        )
+        dataset.exposure.data += 1e11 * (1 + 0.1 * idx)
+        if radial_exposure:
+            offset = geom.separation(geom.center_skydir).to_value("deg")
+            dataset.exposure.data *= np.exp(-0.5 * (offset / (0.3 + 0.2 * idx)) ** 2)
+        dataset.background.data += 0.5
+        dataset.psf = PSFMap.from_gauss(
+            energy_axis_true, sigma=(0.05 + 0.02 * idx) * u.deg
+        )
+        dataset.edisp = EDispKernelMap.from_gauss(
+            energy_axis, energy_axis_true, sigma=0.1 + 0.02 * idx, bias=0
+        )
+        dataset.mask_safe.data[...] = True
+        dataset.mask_safe.data[0, :5] = False
+        datasets.append(dataset)
+
+    extended = SkyModel(
+        spatial_model=GaussianSpatialModel(
+            lon_0="0.1 deg", lat_0="0.1 deg", sigma="0.2 deg", frame="galactic"
+        ),
+        spectral_model=PowerLawSpectralModel(
+            index=2.5, amplitude="1e-12 cm-2 s-1 TeV-1"
+        ),
+        name="extended",
+    )
+    point = SkyModel(
+        spatial_model=PointSpatialModel(
+            lon_0="-0.3 deg", lat_0="0.2 deg", frame="galactic"
+        ),
+        spectral_model=PowerLawSpectralModel(amplitude="1e-12 cm-2 s-1 TeV-1"),
+        name="point",
+        datasets_names=["dataset-0"],
+    )
+    models = Models([extended, point])
+    models.extend([FoVBackgroundModel(dataset_name=name) for name in datasets.names])
+    datasets.models = models
+
+    for dataset in datasets:
+        dataset.fake(random_state=0)
+
+    return datasets
+
+
+def test_batched_map_evaluator(monkeypatch):
+    monkeypatch.setattr(gammapy.datasets.map, "EVALUATION_MODE", "global")
+    datasets = get_batched_datasets()
+    assert BatchedMapEvaluator.is_supported(datasets)
+
+    evaluator = BatchedMapEvaluator(datasets)
+    npred = evaluator.compute_npred()
+    assert npred.shape == (3, 3, 50, 50)
+
+    for data, dataset in zip(npred, datasets):
+        assert_allclose(data, dataset.npred().data, rtol=1e-5, atol=1e-5)
+
+    models = datasets.models
+    stat_sum = datasets.stat_sum()
+
+    monkeypatch.setattr(gammapy.datasets.core, "USE_BATCHED_EVALUATION", True)
+    assert_allclose(datasets.stat_sum(), stat_sum, rtol=1e-7)
+
+    models["extended"].spatial_model.sigma.value = 0.3
+    models["extended"].spectral_model.amplitude.value = 2e-12
+    models["dataset-1-bkg"].spectral_model.norm.value = 1.1
+    stat_sum = datasets.stat_sum()
+
+    monkeypatch.setattr(gammapy.datasets.core, "USE_BATCHED_EVALUATION", False)
+    assert_allclose(datasets.stat_sum(), stat_sum, rtol=1e-7)
+
+    datasets[1].stat_type = "cash_weighted"
+    assert not BatchedMapEvaluator.is_supported(datasets)
+
+
+def test_batched_map_evaluator_radial_exposure(monkeypatch):
+    datasets = get_batched_datasets(radial_exposure=True)
+    stat_sum = datasets.stat_sum()
+
+    evaluator = BatchedMapEvaluator(datasets)
+    npred = evaluator.compute_npred()
+
+    for data, dataset in zip(npred, datasets):
+        assert_allclose(data, dataset.npred().data, rtol=1e-5, atol=1e-5)
+
+    monkeypatch.setattr(gammapy.datasets.core, "USE_BATCHED_EVALUATION", True)
+    assert_allclose(datasets.stat_sum(), stat_sum, rtol=1e-7)
@@ -11,6 +11,7 @@ from astropy.table import Table
 from astropy.time import Time
 from astropy.utils.exceptions import AstropyUserWarning
 from regions import CircleSkyRegion
+import gammapy.datasets.map
 import gammapy.irf.psf.map as psf_map_module
 from gammapy.catalog import SourceCatalog3FHL
 from gammapy.data import GTI, DataStore, Observation, FixedPointingInfo
@@ -888,6 +889,111 @@ def test_prior_stat_sum(sky_model, geom, geom_etrue):
     assert_allclose(stat_sum_neg, np.inf, rtol=1e-3)
 
 
+@requires_data()
+def test_map_dataset_stat_sum_gradient(sky_model, geom, geom_etrue):
+    dataset = get_map_dataset(geom, geom_etrue, edisp="edispkernelmap", name="test")
+    datasets = Datasets([dataset])
+
+    models = Models(datasets.models)
+    models.insert(0, sky_model)
+    datasets.models = models
+    dataset.counts = dataset.npred()
+
+    models["test-model"].spectral_model.index.value = 2.9
+    models["test-model"].spatial_model.lon_0.value = 0.22
+    models["test-bkg"].spectral_model.norm.value = 1.1
+
+    assert datasets.has_stat_sum_gradient
+    gradient = datasets.stat_sum_gradient()
+
+    parameters = models.parameters.unique_parameters.free_parameters
+    for par, actual in zip(parameters, gradient):
+        value = par.value
+        step = 1e-6 * max(abs(value), 1e-3 * par.scale)
+        par.value = value + step
+        stat_upper = datasets.stat_sum()
+        par.value = value - step
+        stat_lower = datasets.stat_sum()
+        par.value = value
+
+        expected = (stat_upper - stat_lower) / (2 * step)
+        assert_allclose(actual, expected, rtol=1e-2, err_msg=par.name)
+
+
+@requires_data()
+def test_map_dataset_incremental_npred(monkeypatch, sky_model, geom, geom_etrue):
+    dataset = get_map_dataset(geom, geom_etrue, edisp="edispkernelmap", name="test")
+
+    other_model = sky_model.copy(name="other-model")
+    other_model.spatial_model.lon_0.value = 359.7
+    other_model.spatial_model.sigma.value = 0.1
+
+    models = Models(dataset.models)
+    models.extend([sky_model, other_model])
+    dataset.models = models
+    dataset.counts = dataset.npred()
+
+    def check(dataset):
+        monkeypatch.setattr(gammapy.datasets.map, "USE_INCREMENTAL_NPRED", False)
+        npred, stat_sum = dataset.npred(), dataset.stat_sum()
+        monkeypatch.setattr(gammapy.datasets.map, "USE_INCREMENTAL_NPRED", True)
+        assert_allclose(dataset.npred().data, npred.data, rtol=1e-10, atol=1e-12)
+        assert_allclose(dataset.stat_sum(), stat_sum, rtol=1e-10)
+
+    check(dataset)
+    contribution = dataset._npred_contributions["other-model"]
+
+    models["test-model"].spectral_model.index.value = 2.9
+    check(dataset)
+
+    models["test-model"].spatial_model.lon_0.value = 0.25
+    check(dataset)
+    assert dataset._npred_contributions["other-model"] is contribution
+
+    models["test-bkg"].spectral_model.norm.value = 1.1
+    check(dataset)
+
+    dataset.mask_fit = None
+    check(dataset)
+
+    calls = []
+    npred_background = dataset.npred_background
+    monkeypatch.setattr(
+        dataset, "npred_background", lambda: calls.append(1) or npred_background()
+    )
+    models["test-model"].spectral_model.index.value = 2.8
+    dataset.stat_sum()
+    assert not calls
+
+    monkeypatch.setattr(gammapy.datasets.map, "INCREMENTAL_NPRED_MAX_CHANGES", 1)
+    models["test-model"].spectral_model.index.value = 2.7
+    models["other-model"].spectral_model.index.value = 2.1
+    check(dataset)
+    assert dataset._npred_n_updates == 0
+
+
+@requires_data()
+def test_map_dataset_evaluation_float32(monkeypatch, sky_model, geom, geom_etrue):
+    dataset = get_map_dataset(geom, geom_etrue, edisp="edispkernelmap", name="test")
+    models = Models(dataset.models)
+    models.insert(0, sky_model)
+    dataset.models = models
+    dataset.counts = dataset.npred()
+    models["test-model"].spectral_model.index.value = 2.9
+
+    npred, stat_sum = dataset.npred(), dataset.stat_sum()
+
+    monkeypatch.setattr(gammapy.datasets.map, "EVALUATION_DTYPE", "float32")
+    dataset.models = models
+
+    evaluator = dataset.evaluators["test-model"]
+    assert evaluator.compute_npred().data.dtype == np.float32
+    assert dataset.npred().data.dtype == np.float64
+
+    assert_allclose(dataset.npred().data, npred.data, rtol=1e-5, atol=1e-10)
+    assert_allclose(dataset.stat_sum(), stat_sum, rtol=1e-6)
+
+
 @requires_data()
 @requires_dependency("ray")
 def test_map_fit_ray(sky_model, geom, geom_etrue):
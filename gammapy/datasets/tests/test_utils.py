@@ -7,6 +7,7 @@ from astropy.coordinates import SkyCoord
 from gammapy.data import ObservationTable, HDUIndexTable, DataStore
 from gammapy.datasets import Datasets, MapDataset, SpectrumDatasetOnOff
 from gammapy.datasets.utils import (
+    _edisp_blocks,
     apply_edisp,
     set_and_restore_mask_fit,
     split_dataset,
@@ -62,6 +63,29 @@ def test_apply_edisp(region_map_true):
     assert_allclose(e_reco[[0, -1]].value, [1, 10])
 
 
+def test_apply_edisp_banded():
+    e_true = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=100, name="energy_true")
+    e_reco = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=50)
+    edisp = EDispKernel.from_gauss(
+        energy_axis_true=e_true, energy_axis=e_reco, sigma=0.03, bias=0
+    )
+
+    blocks, fill_factor = _edisp_blocks(edisp.pdf_matrix)
+    assert fill_factor < 0.5
+    assert blocks[0][1] == slice(0, 8)
+
+    m = Map.create(npix=(4, 3), binsz=0.1, axes=[e_true])
+    m.data = np.random.RandomState(0).uniform(size=m.data.shape)
+
+    actual = apply_edisp(m, edisp)
+    expected = np.einsum("ijk,il->ljk", m.data, edisp.pdf_matrix)
+    assert_allclose(actual.data, expected, rtol=1e-12)
+
+    m.data[0, 0, 0] = np.nan
+    actual = apply_edisp(m, edisp)
+    assert np.isnan(actual.data[:, 0, 0]).any()
+
+
 @requires_data()
 def test_dataset_split():
     template_diffuse = TemplateSpatialModel.read(
@@ -18,8 +18,73 @@ __all__ = [
 
 log = logging.getLogger(__name__)
 
+EDISP_BLOCK_SIZE = 8
+EDISP_BANDED_FILL_FACTOR = 0.5
 
-def apply_edisp(input_map, edisp):
+
+def _edisp_blocks(pdf_matrix, block_size=None):
+    """Split the non-zero band of an energy dispersion matrix into dense blocks.
+
+    The reconstructed energy bins are grouped in blocks of ``block_size`` bins and
+    each block is restricted to the range of true energy bins with non-zero values.
+
+    Parameters
+    ----------
+    pdf_matrix : `~numpy.ndarray`
+        Energy dispersion matrix, of shape ``(n_true, n_reco)``.
+    block_size : int, optional
+        Number of reconstructed energy bins per block. Default is None, which
+        uses ``EDISP_BLOCK_SIZE``.
+
+    Returns
+    -------
+    blocks : list of tuple of slice
+        True and reconstructed energy slices of the blocks.
+    fill_factor : float
+        Fraction of the matrix covered by the blocks.
+    """
+    block_size = EDISP_BLOCK_SIZE if block_size is None else block_size
+    n_true, n_reco = pdf_matrix.shape
+    nonzero = pdf_matrix != 0
+
+    blocks, size = [], 0
+    for start in range(0, n_reco, block_size):
+        reco = slice(start, min(start + block_size, n_reco))
+        rows = np.flatnonzero(nonzero[:, reco].any(axis=1))
+
+        if rows.size == 0:
+            continue
+
+        true = slice(rows[0], rows[-1] + 1)
+        blocks.append((true, reco))
+        size += (true.stop - true.start) * (reco.stop - reco.start)
+
+    return blocks, size / max(pdf_matrix.size, 1)
+
+
+def _apply_edisp_matrix(data_2d, pdf_matrix):
+    """Matrix product of the data with the energy dispersion matrix.
+
+    When the non-zero band of the matrix covers less than
+    ``EDISP_BANDED_FILL_FACTOR`` of it, the product is computed block by block
+    on the band only. The dense product is used for non-finite data, so that
+    NaN values propagate as before.
+    """
+    blocks, fill_factor = _edisp_blocks(pdf_matrix)
+
+    if fill_factor >= EDISP_BANDED_FILL_FACTOR or not np.all(np.isfinite(data_2d)):
+        return data_2d @ pdf_matrix
+
+    dtype = np.result_type(data_2d, pdf_matrix)
+    out_2d = np.zeros((data_2d.shape[0], pdf_matrix.shape[1]), dtype=dtype)
+
+    for true, reco in blocks:
+        out_2d[:, reco] = data_2d[:, true] @ pdf_matrix[true, reco]
+
+    return out_2d
+
+
+def apply_edisp(input_map, edisp, dtype=None):
     """Apply energy dispersion to map. Requires "energy_true" axis.
 
     Parameters
@@ -29,12 +94,22 @@ def apply_edisp(input_map, edisp):
         It must have an axis named "energy_true".
     edisp : `~gammapy.irf.EDispKernel`
         Energy dispersion matrix.
+    dtype : `~numpy.dtype`, optional
+        Data type of the matrix product, e.g. "float32" for single precision.
+        Default is None, which uses the common type of the map data and matrix.
 
     Returns
     -------
     map : `~gammapy.maps.Map`
         Map with energy dispersion applied.
 
+    Notes
+    -----
+    For finely binned energy axes the energy dispersion matrix is mostly zero
+    away from its diagonal band. When the band covers less than
+    ``EDISP_BANDED_FILL_FACTOR`` of the matrix, the product is only computed on
+    the band, in dense blocks of ``EDISP_BLOCK_SIZE`` reconstructed energy bins.
+
     Examples
     --------
     >>> from gammapy.irf.edisp import EDispKernel
@@ -71,7 +146,13 @@ def apply_edisp(input_map, edisp):
         n_true = data.shape[-1]
 
         data_2d = data.reshape(n_pix, n_true)
-        out_2d = data_2d @ edisp.pdf_matrix
+        pdf_matrix = edisp.pdf_matrix
+
+        if dtype is not None:
+            data_2d = data_2d.astype(dtype, copy=False)
+            pdf_matrix = pdf_matrix.astype(dtype, copy=False)
+
+        out_2d = _apply_edisp_matrix(data_2d, pdf_matrix)
         out = out_2d.reshape(shape_space + (edisp.pdf_matrix.shape[-1],))
 
         out = np.moveaxis(out, -1, loc)
@@ -6,6 +6,7 @@ from astropy.convolution import Tophat2DKernel
 from astropy.coordinates import Angle
 from gammapy.datasets import MapDataset, MapDatasetOnOff
 from gammapy.maps import Map
+from gammapy.maps.hpx.utils import HpxNeighbours
 from gammapy.modeling.models import PowerLawSpectralModel, SkyModel
 from gammapy.stats import CashCountsStatistic, WStatCountsStatistic
 from ..core import Estimator
@@ -17,6 +18,14 @@ __all__ = ["ExcessMapEstimator"]
 log = logging.getLogger(__name__)
 
 
+def _convolve(m, kernel):
+    """Convolve a WCS map with a kernel array, or correlate a HEALPix map."""
+    if isinstance(kernel, HpxNeighbours):
+        return Map.from_geom(m.geom, data=kernel.correlate(m.data), unit=m.unit)
+
+    return m.convolve(kernel)
+
+
 def _get_convolved_maps(dataset, kernel, mask, correlate_off):
     """Return convolved maps.
 
@@ -24,8 +33,8 @@ def _get_convolved_maps(dataset, kernel, mask, correlate_off):
     ----------
     dataset : `~gammapy.datasets.MapDataset` or `~gammapy.datasets.MapDatasetOnOff`
         Map dataset.
-    kernel : `~astropy.convolution.Kernel`
-        Kernel.
+    kernel : `~gammapy.maps.Map` or `~gammapy.maps.hpx.utils.HpxNeighbours`
+        Kernel map, or neighbours of the pixels for a HEALPix dataset.
     mask : `~gammapy.maps.Map`
         Mask map.
     correlate_off : bool
@@ -36,14 +45,17 @@ def _get_convolved_maps(dataset, kernel, mask, correlate_off):
     convolved_maps : dict
         Dictionary of convolved maps.
     """
-    # Kernel is modified later make a copy here
-    kernel = copy.deepcopy(kernel)
-    kernel_data = kernel.data / kernel.data.max()
+    if isinstance(kernel, HpxNeighbours):
+        kernel_data = kernel
+    else:
+        # Kernel is modified later make a copy here
+        kernel = copy.deepcopy(kernel)
+        kernel_data = kernel.data / kernel.data.max()
 
     # fft convolution adds numerical noise, to ensure integer results we call
     # np.rint
     n_on = dataset.counts * mask
-    n_on_conv = np.rint(n_on.convolve(kernel_data).data)
+    n_on_conv = np.rint(_convolve(n_on, kernel_data).data)
 
     convolved_maps = {"n_on_conv": n_on_conv}
 
@@ -52,18 +64,18 @@ def _get_convolved_maps(dataset, kernel, mask, correlate_off):
         npred_sig = dataset.npred_signal() * mask
         acceptance_on = dataset.acceptance * mask
         acceptance_off = dataset.acceptance_off * mask
-        npred_sig_convolve = npred_sig.convolve(kernel_data)
+        npred_sig_convolve = _convolve(npred_sig, kernel_data)
         if correlate_off:
             background = dataset.background * mask
             background.data[dataset.acceptance_off == 0] = 0.0
-            background_conv = background.convolve(kernel_data)
-            n_off = n_off.convolve(kernel_data)
+            background_conv = _convolve(background, kernel_data)
+            n_off = _convolve(n_off, kernel_data)
 
             with np.errstate(invalid="ignore", divide="ignore"):
                 alpha = background_conv / n_off
 
         else:
-            acceptance_on_convolve = acceptance_on.convolve(kernel_data)
+            acceptance_on_convolve = _convolve(acceptance_on, kernel_data)
 
             with np.errstate(invalid="ignore", divide="ignore"):
                 alpha = acceptance_on_convolve / acceptance_off
@@ -78,7 +90,7 @@ def _get_convolved_maps(dataset, kernel, mask, correlate_off):
         )
     else:
         npred = dataset.npred() * mask
-        background_conv = npred.convolve(kernel_data)
+        background_conv = _convolve(npred, kernel_data)
         convolved_maps.update(
             {
                 "background_conv": background_conv,
@@ -327,6 +339,10 @@ class ExcessMapEstimator(Estimator):
     def estimate_kernel(self, dataset):
         """Get the convolution kernel for the input dataset.
 
+        For a HEALPix dataset, the kernel is given by the neighbours of each pixel
+        within the correlation radius. They are computed once and shared by all
+        datasets with the same spatial geometry.
+
         Parameters
         ----------
         dataset : `~gammapy.datasets.MapDataset`
@@ -334,9 +350,14 @@ class ExcessMapEstimator(Estimator):
 
         Returns
         -------
-        kernel : `~astropy.convolution.Tophat2DKernel`
-            Kernel.
+        kernel : `~gammapy.maps.Map` or `~gammapy.maps.hpx.utils.HpxNeighbours`
+            Kernel map, or neighbours of the pixels for a HEALPix dataset.
         """
+        if dataset.counts.geom.is_hpx:
+            return HpxNeighbours.from_geom(
+                dataset.counts.geom, radius=self.correlation_radius
+            )
+
         pixel_size = np.mean(np.abs(dataset.counts.geom.wcs.wcs.cdelt))
         size = self.correlation_radius.deg / pixel_size
         kernel = Tophat2DKernel(size)
@@ -374,8 +395,8 @@ class ExcessMapEstimator(Estimator):
         ----------
         dataset : `~gammapy.datasets.MapDataset`
             Map dataset.
-        kernel : `~astropy.convolution.Tophat2DKernel`
-            Kernel.
+        kernel : `~gammapy.maps.Map` or `~gammapy.maps.hpx.utils.HpxNeighbours`
+            Kernel map, or neighbours of the pixels for a HEALPix dataset.
         mask : `~gammapy.maps.Map`
             Mask map.
 
@@ -384,10 +405,13 @@ class ExcessMapEstimator(Estimator):
         reco_exposure : `~gammapy.maps.Map`
             Reconstructed exposure map.
         """
+        if isinstance(kernel, Map):
+            kernel = kernel.data
+
         if dataset.exposure:
             with np.errstate(invalid="ignore", divide="ignore"):
-                reco_exposure = reco_exposure.convolve(kernel.data) / mask.convolve(
-                    kernel.data
+                reco_exposure = _convolve(reco_exposure, kernel) / _convolve(
+                    mask, kernel
                 )
         else:
             reco_exposure = 1
@@ -3,6 +3,7 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose
 import astropy.units as u
+from astropy.coordinates import SkyCoord
 from gammapy.datasets import MapDataset, MapDatasetOnOff
 from gammapy.estimators import ExcessMapEstimator
 from gammapy.estimators.utils import (
@@ -10,7 +11,8 @@ from gammapy.estimators.utils import (
     get_combined_significance_maps,
 )
 from gammapy.irf import PSFMap
-from gammapy.maps import Map, MapAxis, WcsGeom
+from gammapy.maps import HpxGeom, Map, MapAxis, WcsGeom
+from gammapy.maps.hpx.utils import HpxNeighbours
 from gammapy.modeling.models import (
     GaussianSpatialModel,
     PowerLawSpectralModel,
@@ -253,7 +255,7 @@ def test_significance_map_estimator_map_dataset_exposure(simple_dataset):
     result = estimator.run(simple_dataset)
 
     assert_allclose(result["npred_excess"].data.sum(), 19733.602, rtol=1e-3)
-    assert_allclose(result["sqrt_ts"].data[0, 10, 10], 4.217129, rtol=1e-3)
+    assert_allclose(result["sqrt_ts"].data[0, 10, 10], 4.221712, rtol=1e-3)
     assert_allclose(result["flux_sensitivity"].data[0, 10, 10], 5.742761e-09, rtol=1e-3)
 
     # without mask safe
@@ -269,7 +271,7 @@ def test_significance_map_estimator_map_dataset_exposure(simple_dataset):
 
     result_no_mask = estimator.run(simple_dataset_no_mask)
     assert_allclose(result_no_mask["npred_excess"].data.sum(), 19733.602, rtol=1e-3)
-    assert_allclose(result_no_mask["sqrt_ts"].data[0, 10, 10], 4.217129, rtol=1e-3)
+    assert_allclose(result_no_mask["sqrt_ts"].data[0, 10, 10], 4.221712, rtol=1e-3)
     assert_allclose(result["flux_sensitivity"].data[0, 10, 10], 5.742761e-09, rtol=1e-3)
 
 
@@ -366,10 +368,10 @@ def test_excess_map_estimator_map_dataset_on_off_with_correlation_model(
     result_mod = estimator_mod.run(simple_dataset_on_off)
     assert result_mod["npred"].data.shape == (1, 20, 20)
 
-    assert_allclose(result_mod["sqrt_ts"].data[0, 10, 10], 6.240846, atol=1e-3)
+    assert_allclose(result_mod["sqrt_ts"].data[0, 10, 10], 6.245374, atol=1e-3)
 
     assert_allclose(result_mod["npred"].data[0, 10, 10], 388)
-    assert_allclose(result_mod["npred_excess"].data[0, 10, 10], 148.68057)
+    assert_allclose(result_mod["npred_excess"].data[0, 10, 10], 148.78894)
 
     assert result_mod["flux"].unit == "cm-2s-1"
     assert_allclose(result_mod["flux"].data[0, 10, 10], 1.486806e-08, rtol=1e-3)
@@ -453,15 +455,15 @@ def test_joint_excess_map(simple_dataset):
 
     result = estimator.run(stacked_dataset)
     assert_allclose(result["npred_excess"].data.sum(), 2 * 19733.602, rtol=1e-3)
-    assert_allclose(result["sqrt_ts"].data[0, 10, 10], 5.960441, rtol=1e-3)
+    assert_allclose(result["sqrt_ts"].data[0, 10, 10], 5.970402, rtol=1e-3)
 
     result = get_combined_significance_maps(
         estimator, [simple_dataset, simple_dataset2]
     )
 
     assert_allclose(result["npred_excess"].data.sum(), 2 * 19733.602, rtol=1e-3)
-    assert_allclose(result["significance"].data[10, 10], 5.618187, rtol=1e-3)
-    assert_allclose(result["ts"].data[10, 10], 35.526888, rtol=1e-3)
+    assert_allclose(result["significance"].data[10, 10], 5.628468, rtol=1e-3)
+    assert_allclose(result["ts"].data[10, 10], 35.645701, rtol=1e-3)
     assert_allclose(
         result["df"].data, 2 * (~np.isnan(result["significance"].data)), rtol=1e-3
     )
@@ -476,3 +478,26 @@ def test_maps_alpha(simple_dataset_on_off):
     assert_allclose(result["acceptance_on"].data[:, 10, 10], 2, atol=1e-3)
     assert_allclose(result["acceptance_off"].data[:, 10, 10], 2, atol=1e-3)
     assert_allclose(result["alpha"].data[:, 10, 10], 1, atol=1e-3)
+
+
+def test_excess_map_estimator_hpx():
+    axis = MapAxis.from_energy_bounds(0.1, 10, 1, unit="TeV")
+    geom = HpxGeom.create(nside=256, region="DISK(0,0,2)", axes=[axis])
+    dataset = MapDataset.create(geom)
+    dataset.mask_safe += np.ones(dataset.data_shape, dtype=bool)
+    dataset.counts += 2
+    dataset.background += 1
+    dataset.exposure = None
+
+    estimator = ExcessMapEstimator(0.5 * u.deg)
+    result = estimator.run(dataset)
+
+    neighbours = HpxNeighbours.from_geom(geom, radius=0.5 * u.deg)
+    position = SkyCoord(0, 0, unit="deg", frame=geom.frame)
+    idx = np.argmin(geom.to_image().separation(position))
+    n_pix = np.diff(neighbours.indptr)[idx]
+
+    assert result["npred"].geom.is_hpx
+    assert_allclose(result["npred"].data[0, idx], 2 * n_pix)
+    assert_allclose(result["npred_excess"].data[0, idx], n_pix)
+    assert np.all(np.isfinite(result["sqrt_ts"].data))
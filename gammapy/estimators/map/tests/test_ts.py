@@ -16,7 +16,7 @@ from gammapy.estimators.utils import (
     get_flux_map_from_profile,
 )
 from gammapy.irf import EDispKernelMap, PSFMap
-from gammapy.maps import Map, MapAxis, WcsGeom
+from gammapy.maps import HpxGeom, Map, MapAxis, WcsGeom
 from gammapy.modeling.models import (
     ConstantSpatialModel,
     DiskSpatialModel,
@@ -902,3 +902,118 @@ def test_excess_map_compatibility():
         0.85,
         rtol=1e-2,
     )
+
+
+def test_ts_map_shared_memory(fake_dataset):
+    kernel_model = fake_dataset.models["source"]
+    dataset = fake_dataset.copy()
+    dataset.models = []
+
+    kwargs = dict(
+        kernel_model=kernel_model,
+        kernel_width="0.3 deg",
+        selection_optional=["ul"],
+        energy_edges=[200, 3500] * u.GeV,
+    )
+    maps = TSMapEstimator(**kwargs).run(dataset)
+
+    estimator = TSMapEstimator(
+        **kwargs, n_jobs=2, parallel_backend="multiprocessing", shared_memory=True
+    )
+    assert estimator._use_shared_memory
+
+    maps_shared = estimator.run(dataset)
+
+    for name in ["ts", "flux", "flux_err", "flux_ul", "npred_excess"]:
+        assert_allclose(maps_shared[name].data, maps[name].data)
+
+
+def test_ts_map_batch_size(fake_dataset):
+    kernel_model = fake_dataset.models["source"]
+    dataset = fake_dataset.copy()
+    dataset.models = []
+
+    kwargs = dict(
+        kernel_model=kernel_model,
+        kernel_width="0.3 deg",
+        selection_optional=["ul", "errn-errp"],
+        energy_edges=[200, 3500] * u.GeV,
+        threshold=1,
+    )
+    maps = TSMapEstimator(**kwargs).run(dataset)
+
+    estimator = TSMapEstimator(**kwargs, batch_size=500)
+    maps_batch = estimator.run(dataset)
+
+    names = ["ts", "niter", "flux", "flux_err", "flux_ul", "flux_errn", "flux_errp"]
+    for name in names:
+        assert_allclose(maps_batch[name].data, maps[name].data, rtol=1e-6)
+
+    assert_allclose(maps_batch["success"].data, maps["success"].data)
+
+
+def test_ts_map_tiles(fake_dataset):
+    kernel_model = fake_dataset.models["source"]
+    dataset = fake_dataset.copy()
+    dataset.models = []
+
+    kwargs = dict(
+        kernel_model=kernel_model,
+        kernel_width="0.3 deg",
+        selection_optional=[],
+        energy_edges=[200, 3500] * u.GeV,
+        downsampling_factor=2,
+    )
+    maps = TSMapEstimator(**kwargs).run(dataset)
+    maps_tiled = TSMapEstimator(**kwargs, tile_size=10).run(dataset)
+
+    assert maps_tiled["ts"].geom == maps["ts"].geom
+    for name in ["ts", "flux", "flux_err", "niter", "success"]:
+        assert_allclose(maps_tiled[name].data, maps[name].data)
+
+    # tiles submitted in batches of two
+    maps_tiled = TSMapEstimator(
+        **kwargs, tile_size=10, n_jobs=2, parallel_backend="threading"
+    ).run(dataset)
+    assert_allclose(maps_tiled["ts"].data, maps["ts"].data)
+
+    with pytest.raises(ValueError):
+        TSMapEstimator(kernel_model=kernel_model, tile_size=10).run(dataset)
+
+
+def test_ts_map_hpx():
+    axis = MapAxis.from_energy_bounds(0.1, 10, 2, unit="TeV", name="energy")
+    axis_true = MapAxis.from_energy_bounds(0.05, 20, 4, unit="TeV", name="energy_true")
+
+    geom = HpxGeom.create(nside=256, region="DISK(0,0,3)", axes=[axis], frame="icrs")
+    dataset = MapDataset.create(geom, energy_axis_true=axis_true)
+    dataset.psf = PSFMap.from_gauss(axis_true, sigma="0.3 deg")
+    dataset.mask_safe += np.ones(dataset.data_shape, dtype=bool)
+    dataset.background += 1
+    dataset.exposure += 1e12 * u.cm**2 * u.s
+
+    model = SkyModel(
+        spatial_model=PointSpatialModel(lon_0="0 deg", lat_0="0 deg", frame="icrs"),
+        spectral_model=PowerLawSpectralModel(amplitude="1e-11 cm-2s-1TeV-1"),
+        name="source",
+    )
+    dataset.models = [model]
+    dataset.fake(random_state=42)
+    dataset.models = []
+
+    estimator = TSMapEstimator(kernel_model=model, kernel_width="1.5 deg")
+    result = estimator.run(dataset)
+
+    position = SkyCoord(0, 0, unit="deg", frame="icrs")
+    idx = np.argmin(geom.to_image().separation(position))
+
+    assert result["ts"].geom.is_hpx
+    assert result["ts"].data[0, idx] > 100
+    assert_allclose(result["norm"].data[0, idx], 1, rtol=0.2)
+    assert result["success"].data.dtype == bool
+
+    with pytest.raises(ValueError):
+        TSMapEstimator(downsampling_factor=2, kernel_width="1.5 deg").run(dataset)
+
+    with pytest.raises(ValueError):
+        TSMapEstimator().run(dataset)
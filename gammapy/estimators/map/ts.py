@@ -1,26 +1,29 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Functions to compute test statistic images."""
 
+import logging
 import warnings
 import astropy.units as u
-from itertools import repeat
+from functools import partial
+from itertools import chain, repeat
 import numpy as np
 import scipy.optimize
 from scipy.interpolate import InterpolatedUnivariateSpline
-from astropy.coordinates import Angle
+from astropy.coordinates import Angle, SkyCoord
 from astropy.utils import lazyproperty
 import gammapy.utils.parallel as parallel
 from gammapy.datasets import Datasets
 from gammapy.datasets.map import MapEvaluator
 from gammapy.datasets.utils import get_nearest_valid_exposure_position
-from gammapy.maps import Map, MapAxis, Maps
+from gammapy.maps import Map, MapAxis, Maps, WcsGeom
+from gammapy.maps.hpx.utils import HpxNeighbours
 from gammapy.modeling.models import PointSpatialModel, PowerLawSpectralModel, SkyModel
 from gammapy.stats.utils import ts_to_sigma
 from gammapy.stats import cash
 from gammapy.utils.array import shape_2N, symmetric_crop_pad_width
 from gammapy.utils.compilation import get_fit_statistics_compiled
 from gammapy.utils.pbar import progress_bar
-from gammapy.utils.roots import find_roots
+from gammapy.utils.roots import find_roots, find_roots_vectorized
 from gammapy.utils.deprecation import deprecated_renamed_argument
 
 from ..core import Estimator
@@ -34,6 +37,8 @@ from .core import FluxMaps
 
 __all__ = ["TSMapEstimator"]
 
+log = logging.getLogger(__name__)
+
 
 def _extract_array(array, shape, position):
     """Helper function to extract parts of a larger array.
@@ -87,12 +92,13 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         Default is None.
     kernel_width : `~astropy.coordinates.Angle`, optional
         Width of the kernel to use: the kernel will be truncated at this size.
-        Default is None.
+        Required for HEALPix datasets, where the kernel covers the pixels within
+        half of this width. Default is None.
     downsampling_factor : int, optional
         Sample down the input maps to speed up the computation. Only integer
         values that are a multiple of 2 are allowed. Note that the kernel is
         not sampled down, but must be provided with the downsampled bin size.
-        Default is None.
+        Not supported for HEALPix datasets. Default is None.
     n_sigma : float, optional
         Number of sigma for flux error. Must be a positive value.
         Default is 1.
@@ -145,6 +151,26 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
     max_niter : int, optional
         Maximal number of iterations used by the root finding algorithm.
         Default is 100.
+    shared_memory : bool, optional
+        Whether to place the input maps once into shared memory when running
+        with the multiprocessing backend and more than one job. The workers
+        then only receive blocks of pixel positions instead of full copies of
+        the input maps for every pixel. Default is False.
+    batch_size : int, optional
+        Number of pixels for which the norm is solved together, using a
+        vectorized root finder. This also applies to the upper limits, asymmetric
+        errors and sensitivity. Default is None, which solves pixels one at a time.
+    tile_size : int, optional
+        Size in pixels of square tiles in which the spatial geometry is split.
+        The tiles are extended by a margin covering the kernel width and
+        processed one at a time, or in batches of ``n_jobs`` tiles in parallel.
+        The results are stitched together, so that the memory used for the
+        intermediate maps is bounded by the tile size. The kernel is computed
+        for each tile separately and ``kernel_width`` must be set. If
+        ``downsampling_factor`` is set, the tile size refers to the downsampled
+        pixels. Not supported for HEALPix datasets, which are processed at once
+        using the neighbours of each pixel. Default is None, which processes the
+        full geometry at once.
 
     Notes
     -----
@@ -212,6 +238,9 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         parallel_backend=None,
         norm=None,
         max_niter=100,
+        shared_memory=False,
+        batch_size=None,
+        tile_size=None,
     ):
         if kernel_width is not None:
             kernel_width = Angle(kernel_width)
@@ -240,10 +269,16 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         self.parallel_backend = parallel_backend
         self.sum_over_energy_groups = sum_over_energy_groups
         self.max_niter = max_niter
+        self.shared_memory = shared_memory
+        self.batch_size = batch_size
+        self.tile_size = tile_size
 
         self.selection_optional = selection_optional
         self.energy_edges = energy_edges
-        self._flux_estimator = BrentqFluxEstimator(
+        flux_estimator_cls = (
+            BatchedBrentqFluxEstimator if batch_size else BrentqFluxEstimator
+        )
+        self._flux_estimator = flux_estimator_cls(
             rtol=self.rtol,
             n_sigma=self.n_sigma,
             n_sigma_ul=self.n_sigma_ul,
@@ -292,6 +327,9 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         Convolves the model with the IRFs at the center of the dataset,
         or at the nearest position with non-zero exposure.
 
+        For a HEALPix dataset, the kernel is computed on a local WCS geometry of
+        width ``kernel_width``, with half of the HEALPix pixel size.
+
         Parameters
         ----------
         dataset : `~gammapy.datasets.MapDataset`
@@ -304,8 +342,26 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
 
         """
         geom = dataset.exposure.geom
+        geom_counts = dataset.counts.geom
+        mask = dataset.mask_image
+
+        if geom.is_hpx:
+            if self.kernel_width is None:
+                raise ValueError(
+                    "A kernel_width must be set to run TSMapEstimator on HEALPix maps."
+                )
 
-        if self.kernel_width is not None:
+            geom = WcsGeom.create(
+                skydir=get_nearest_valid_exposure_position(dataset.exposure),
+                binsz=np.min(geom.pixel_scales.to_value("deg")) / 2,
+                width=self.kernel_width,
+                frame=geom.frame,
+                axes=geom.axes,
+            )
+            geom = geom.to_odd_npix(max_radius=self.kernel_width / 2)
+            geom_counts = geom.to_image().to_cube(geom_counts.axes)
+            mask = Map.from_geom(geom_counts.to_image(), data=True, dtype=bool)
+        elif self.kernel_width is not None:
             geom = geom.to_odd_npix(max_radius=self.kernel_width / 2)
 
         kernel_model = self.kernel_model.copy()
@@ -330,8 +386,8 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
             exposure=exposure,
             psf=dataset.psf,
             edisp=dataset.edisp,
-            geom=dataset.counts.geom,
-            mask=dataset.mask_image,
+            geom=geom_counts,
+            mask=mask,
         )
 
         kernel = evaluator.compute_npred()
@@ -341,6 +397,17 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
             kernel.data[~np.isfinite(kernel.data)] = 0
         return kernel
 
+    def _estimate_kernel_array(self, dataset):
+        """Kernel map, converted to a `HpxKernel` for a HEALPix dataset."""
+        kernel = self.estimate_kernel(dataset)
+
+        if dataset.counts.geom.is_hpx:
+            kernel = HpxKernel.from_map(
+                kernel, geom=dataset.counts.geom, radius=self.kernel_width / 2
+            )
+
+        return kernel
+
     def estimate_flux_default(self, dataset, kernel=None, exposure=None):
         """Estimate default flux map using a given kernel.
 
@@ -349,13 +416,13 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         dataset : `~gammapy.datasets.MapDataset`
             Input dataset.
         kernel : `~gammapy.maps.WcsNDMap`
-            Source model kernel.
-        exposure : `~gammapy.maps.WcsNDMap`
+            Source model kernel, or HEALPix kernel for a HEALPix dataset.
+        exposure : `~gammapy.maps.Map`
             Exposure map on reconstructed energy.
 
         Returns
         -------
-        flux : `~gammapy.maps.WcsNDMap`
+        flux : `~gammapy.maps.Map`
             Approximate flux map.
         """
         if exposure is None:
@@ -364,16 +431,21 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
             )
 
         if kernel is None:
-            kernel = self.estimate_kernel(dataset=dataset)
-
-        kernel = kernel.data / np.sum(kernel.data**2)
+            kernel = self._estimate_kernel_array(dataset=dataset)
 
         with np.errstate(invalid="ignore", divide="ignore"):
             flux = (dataset.counts - dataset.npred()) / exposure
             flux.data = np.nan_to_num(flux.data)
 
         flux.quantity = flux.quantity.to("1 / (cm2 s)")
-        flux = flux.convolve(kernel)
+
+        if isinstance(kernel, HpxKernel):
+            flux = Map.from_geom(
+                flux.geom, data=kernel.correlate(flux.data), unit=flux.unit
+            )
+        else:
+            flux = flux.convolve(kernel.data / np.sum(kernel.data**2))
+
         if dataset.mask:
             flux *= dataset.mask
         return flux.sum_over_axes()
@@ -452,7 +524,7 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
             dataset, self.kernel_model.spectral_model, normalize=False
         )
 
-        kernel = self.estimate_kernel(dataset)
+        kernel = self._estimate_kernel_array(dataset)
 
         mask = self.estimate_mask_default(dataset=dataset)
 
@@ -498,6 +570,47 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         mask_2d &= map_dict["background"].reduce_over_axes() > 0
         return mask_2d.data
 
+    @property
+    def _use_shared_memory(self):
+        """Whether the input maps are passed to the workers via shared memory."""
+        return (
+            self.shared_memory
+            and self.n_jobs > 1
+            and parallel.ParallelBackendEnum.from_str(self.parallel_backend)
+            == parallel.ParallelBackendEnum.multiprocessing
+        )
+
+    def _run_shared_memory(self, positions, arrays):
+        """Run the pixel loop with the input arrays placed into shared memory."""
+        n_datasets = len(arrays["counts"])
+
+        flat = {
+            f"{name}_{idx}": arrays[name][idx]
+            for name in _TS_VALUE_INPUTS
+            for idx in range(n_datasets)
+        }
+
+        n_blocks = min(len(positions), _N_BLOCKS_PER_JOB * self.n_jobs)
+        blocks = np.array_split(np.array(positions), n_blocks)
+
+        with parallel.SharedMemoryArrays(flat) as specs:
+            inputs = zip(
+                blocks,
+                repeat(specs),
+                repeat(n_datasets),
+                repeat(self._flux_estimator),
+                repeat(self.batch_size),
+            )
+            results = parallel.run_multiprocessing(
+                _ts_value_block,
+                inputs,
+                backend=self.parallel_backend,
+                pool_kwargs=dict(processes=self.n_jobs),
+                task_name="TS map",
+            )
+
+        return list(chain.from_iterable(results))
+
     def estimate_flux_map(self, datasets):
         """Estimate flux and test statistic maps for single dataset.
 
@@ -519,31 +632,54 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
             """
             )
 
-        x, y = np.nonzero(np.squeeze(mask_2d))
-        positions = list(zip(x, y))
-
-        inputs = zip(
-            positions,
-            repeat([_["counts"].data.astype(float) for _ in maps]),
-            repeat([_["exposure"].data.astype(float) for _ in maps]),
-            repeat([_["background"].data.astype(float) for _ in maps]),
-            repeat([_["kernel"].data for _ in maps]),
-            repeat([_["norm"].data for _ in maps]),
-            repeat([_["weights"] for _ in maps]),
-            repeat(self._flux_estimator),
-        )
+        # pixel positions are (lat, lon) for WCS and (pix,) for HEALPix maps
+        positions = list(zip(*np.nonzero(np.squeeze(mask_2d))))
+
+        arrays = {
+            "counts": [_["counts"].data.astype(float) for _ in maps],
+            "exposure": [_["exposure"].data.astype(float) for _ in maps],
+            "background": [_["background"].data.astype(float) for _ in maps],
+            "kernel": [_kernel_data(_["kernel"]) for _ in maps],
+            "norm": [_["norm"].data for _ in maps],
+            "weights": [
+                _["weights"].data if _["weights"] is not None else None for _ in maps
+            ],
+        }
 
-        results = parallel.run_multiprocessing(
-            _ts_value,
-            inputs,
-            backend=self.parallel_backend,
-            pool_kwargs=dict(processes=self.n_jobs),
-            task_name="TS map",
-        )
+        is_hpx = maps[0]["counts"].geom.is_hpx
+
+        if self._use_shared_memory and not is_hpx:
+            results = self._run_shared_memory(positions, arrays)
+        else:
+            if self.batch_size:
+                func = _ts_value_batch
+                tasks = [
+                    positions[idx : idx + self.batch_size]
+                    for idx in range(0, len(positions), self.batch_size)
+                ]
+            else:
+                func, tasks = _ts_value, positions
+
+            inputs = zip(
+                tasks,
+                *[repeat(arrays[name]) for name in _TS_VALUE_INPUTS],
+                repeat(self._flux_estimator),
+            )
+
+            results = parallel.run_multiprocessing(
+                func,
+                inputs,
+                backend=self.parallel_backend,
+                pool_kwargs=dict(processes=self.n_jobs),
+                task_name="TS map",
+            )
+
+            if self.batch_size:
+                results = list(chain.from_iterable(results))
 
         result = {}
 
-        j, i = zip(*positions)
+        idx = tuple(zip(*positions))
 
         geom = maps[0]["counts"].geom.squash(axis_name="energy")
         energy_axis = geom.axes["energy"]
@@ -569,11 +705,12 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
                     factor = 1
 
                 m = Map.from_geom(geom_scan, data=np.nan, unit=unit)
-                m.data[:, 0, j, i] = np.array([_[name] for _ in results]).T * factor
+                values = np.array([_[name] for _ in results]).T * factor
+                m.data[(slice(None), 0) + idx] = values
 
             else:
                 m = Map.from_geom(geom=geom, data=np.nan, unit="")
-                m.data[0, j, i] = [_[name] for _ in results]
+                m.data[(0,) + idx] = [_[name] for _ in results]
             result[name] = m
 
         return result
@@ -620,8 +757,54 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
             if dataset.counts.geom.to_image() != geom_ref.to_image():
                 raise TypeError("Datasets geometries must match")
 
-        datasets_models = datasets.models
+        if geom_ref.is_hpx and (self.downsampling_factor or self.tile_size):
+            raise ValueError(
+                "Downsampling and tiles are not supported for HEALPix maps."
+            )
+
+        if self.tile_size is not None:
+            maps = self._estimate_maps_tiled(datasets)
+        else:
+            maps = self._estimate_maps(datasets)
 
+        meta = {"n_sigma": self.n_sigma, "n_sigma_ul": self.n_sigma_ul}
+        return FluxMaps(
+            data=maps,
+            reference_model=self.kernel_model,
+            gti=datasets[-1].gti,
+            meta=meta,
+        )
+
+    def _pad_and_downsample(self, datasets):
+        """Pad the datasets by the kernel size and downsample them.
+
+        Parameters
+        ----------
+        datasets : `~gammapy.datasets.Datasets`
+            Map datasets.
+
+        Returns
+        -------
+        datasets : `~gammapy.datasets.Datasets`
+            Padded and downsampled datasets.
+        pad_width : tuple
+            Padding width.
+        """
+        pad_width = self._datasets_pad_width(datasets)
+
+        datasets_padded = Datasets()
+        for dataset in datasets:
+            dataset = dataset.pad(pad_width, name=dataset.name)
+            dataset = dataset.downsample(self.downsampling_factor, name=dataset.name)
+            datasets_padded.append(dataset)
+
+        return datasets_padded, pad_width
+
+    def _datasets_pad_width(self, datasets):
+        """Pad width covering the kernels of all datasets.
+
+        Also sets the ``kernel_width`` to the largest kernel width, if not defined.
+        """
         pad_width = (0, 0)
         kernel_width = 0 * u.deg
         for dataset in datasets:
@@ -633,12 +816,31 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         if self.kernel_width is None:
             self.kernel_width = kernel_width
 
-        datasets_padded = Datasets()
-        for dataset in datasets:
-            dataset = dataset.pad(pad_width, name=dataset.name)
-            dataset = dataset.downsample(self.downsampling_factor, name=dataset.name)
-            datasets_padded.append(dataset)
-        datasets = datasets_padded
+        return pad_width
+
+    def _upsample_and_crop(self, maps, pad_width):
+        """Upsample the maps to the original resolution and crop the padding."""
+        maps_cropped = Maps()
+
+        for name in self.selection_all:
+            order = 0 if name in ["niter", "success"] else 1
+            m = maps[name].upsample(
+                factor=self.downsampling_factor, preserve_counts=False, order=order
+            )
+            maps_cropped[name] = m.crop(crop_width=pad_width)
+
+        maps_cropped["success"].data = maps_cropped["success"].data.astype(bool)
+        return maps_cropped
+
+    def _estimate_maps(self, datasets):
+        """Estimate the maps of all quantities for the full dataset geometry."""
+        datasets_models = datasets.models
+
+        if datasets[0].counts.geom.is_hpx:
+            # HEALPix maps are not padded, kernels only use the existing neighbours
+            pad_width = None
+        else:
+            datasets, pad_width = self._pad_and_downsample(datasets)
 
         energy_axis = self._get_energy_axis(dataset=datasets[0])
 
@@ -664,26 +866,326 @@ class TSMapEstimator(Estimator, parallel.ParallelMixin):
         maps = Maps()
 
         for name in self.selection_all:
-            m = Map.from_stack(maps=[_[name] for _ in results], axis_name="energy")
+            maps[name] = Map.from_stack(
+                maps=[_[name] for _ in results], axis_name="energy"
+            )
 
-            order = 0 if name in ["niter", "success"] else 1
-            m = m.upsample(
-                factor=self.downsampling_factor, preserve_counts=False, order=order
+        if pad_width is None:
+            maps["success"].data = maps["success"].data.astype(bool)
+            return maps
+
+        return self._upsample_and_crop(maps, pad_width)
+
+    def _tiles_slices(self, geom):
+        """Compute the pixel slices of the tiles.
+
+        Parameters
+        ----------
+        geom : `~gammapy.maps.WcsGeom`
+            Image geometry of the datasets.
+
+        Returns
+        -------
+        slices : list of tuple of slice
+            Core (lat, lon) slices of the tiles.
+        """
+        ny, nx = geom.data_shape[-2:]
+        return [
+            (
+                slice(y, min(y + self.tile_size, ny)),
+                slice(x, min(x + self.tile_size, nx)),
             )
+            for y in range(0, ny, self.tile_size)
+            for x in range(0, nx, self.tile_size)
+        ]
 
-            maps[name] = m.crop(crop_width=pad_width)
+    def _tiles_margin(self, geom):
+        """Margin of the tiles in pixels (lat, lon), covering the kernel half width."""
+        margin = (self.kernel_width / 2 / geom.pixel_scales).to_value("")
+        # one additional pixel accounts for the rounding of the cutout size
+        return np.ceil(margin[::-1]).astype(int) + 1
+
+    def _tile_datasets(self, datasets, slices, pad_width=None):
+        """Create the datasets of a single tile.
+
+        Parameters
+        ----------
+        datasets : `~gammapy.datasets.Datasets`
+            Map datasets.
+        slices : tuple of slice
+            Pixel (lat, lon) slices of the tile, including the margin. If
+            ``pad_width`` is given, the slices refer to the padded and downsampled
+            geometry.
+        pad_width : tuple, optional
+            Padding width of the datasets before downsampling. Default is None,
+            which cuts the tile out of the datasets as they are.
+
+        Returns
+        -------
+        tile : `~gammapy.datasets.Datasets`
+            Tile datasets.
+        """
+        geom = datasets[0].counts.geom.to_image()
+        lo = np.array([_.start for _ in slices])
+        hi = np.array([_.stop for _ in slices])
+
+        if pad_width is not None:
+            # the pixels outside of the datasets are filled with zeros, as for
+            # the padding of the datasets
+            lo = lo * self.downsampling_factor - pad_width[::-1]
+            hi = hi * self.downsampling_factor - pad_width[::-1]
+
+        center = geom.pix_to_coord(((lo[1] + hi[1] - 1) / 2, (lo[0] + hi[0] - 1) / 2))
+        position = SkyCoord(center[0], center[1], frame=geom.frame)
+        width = ((hi - lo) * geom.pixel_scales[::-1])[::-1]
+        mode = "trim" if pad_width is None else "partial"
+
+        tile = Datasets()
+        for dataset in datasets:
+            cutout = dataset.cutout(
+                position=position, width=width, mode=mode, name=dataset.name
+            )
+            if pad_width is not None:
+                # the IRF maps are not padded, as for the padding of the datasets
+                kwargs = dict(position=position, width=width, mode="trim")
+                if dataset.psf is not None:
+                    cutout.psf = dataset.psf.cutout(**kwargs)
+                if dataset.edisp is not None:
+                    cutout.edisp = dataset.edisp.cutout(**kwargs)
+                cutout = cutout.downsample(self.downsampling_factor, name=dataset.name)
+            cutout.models = dataset.models
+            tile.append(cutout)
+
+        return tile
+
+    def _estimate_maps_tiled(self, datasets):
+        """Estimate the maps of all quantities tile by tile and stitch them.
+
+        The tiles are created and submitted in batches of ``n_jobs``, so that only
+        the tiles of one batch and their results are kept in memory at a time.
+        """
+        if self.kernel_width is None:
+            raise ValueError(
+                "A kernel_width must be set to run TSMapEstimator in tiles."
+            )
+
+        estimator = self.copy()
+        estimator.tile_size = None
+
+        geom = datasets[0].counts.geom.to_image()
+
+        pad_width = None
+        if self.downsampling_factor:
+            # the tiles are padded and downsampled one at a time, on the pixel grid
+            # of the padded and downsampled datasets
+            pad_width = self._datasets_pad_width(datasets)
+            geom = geom.pad(pad_width, axis_name=None)
+            geom = geom.downsample(self.downsampling_factor)
+            estimator.downsampling_factor = None
+
+        margin = self._tiles_margin(geom)
+        tiles_slices = self._tiles_slices(geom)
+
+        if self.n_jobs > 1:
+            # tiles are distributed to the workers, each tile is run in a single process
+            estimator.n_jobs = 1
+
+        maps = None
+
+        for idx in range(0, len(tiles_slices), self.n_jobs):
+            batch_slices = tiles_slices[idx : idx + self.n_jobs]
+            inputs = []
+
+            for slices in batch_slices:
+                slices_margin = tuple(
+                    slice(max(_.start - m, 0), min(_.stop + m, n))
+                    for _, m, n in zip(slices, margin, geom.data_shape)
+                )
+                tile = self._tile_datasets(datasets, slices_margin, pad_width)
+                inputs.append((estimator, tile))
+
+            results = parallel.run_multiprocessing(
+                _estimate_maps_tile,
+                inputs,
+                backend=self.parallel_backend,
+                pool_kwargs=dict(processes=self.n_jobs),
+                task_name="TS map tiles",
+            )
+
+            for slices, maps_tile in zip(batch_slices, results):
+                if maps_tile is None:
+                    continue
+
+                if maps is None:
+                    maps = Maps()
+                    for name in self.selection_all:
+                        m = maps_tile[name]
+                        geom_full = geom.to_cube(m.geom.axes)
+                        maps[name] = Map.from_geom(geom_full, data=np.nan, unit=m.unit)
+
+                self._stitch_tile(maps, maps_tile, slices, geom)
+
+        if maps is None:
+            raise ValueError(
+                "No valid positions found in any tile. Check that the dataset "
+                "background and exposure are defined and that the mask is not all False."
+            )
+
+        if pad_width is not None:
+            return self._upsample_and_crop(maps, pad_width)
 
         maps["success"].data = maps["success"].data.astype(bool)
+        return maps
 
-        meta = {"n_sigma": self.n_sigma, "n_sigma_ul": self.n_sigma_ul}
-        return FluxMaps(
-            data=maps,
-            reference_model=self.kernel_model,
-            gti=dataset.gti,
-            meta=meta,
+    def _stitch_tile(self, maps, maps_tile, slices, geom):
+        """Copy the core pixels of the maps of a tile into the full maps."""
+        geom_tile = maps_tile[self.selection_all[0]].geom.to_image()
+        cutout_slices = geom_tile.cutout_slices(geom, mode="trim")
+
+        slices_tile = tuple(
+            slice(
+                _.start - parent.start + cutout.start,
+                _.stop - parent.start + cutout.start,
+            )
+            for _, parent, cutout in zip(
+                slices,
+                cutout_slices["parent-slices"],
+                cutout_slices["cutout-slices"],
+            )
+        )
+
+        for name in self.selection_all:
+            maps[name].data[..., slices[0], slices[1]] = maps_tile[name].data[
+                ..., slices_tile[0], slices_tile[1]
+            ]
+
+
+class HpxKernel:
+    """Radially symmetric source kernel on the neighbours of HEALPix pixels.
+
+    The kernel values of the neighbours of a pixel are interpolated from the radial
+    profile at their angular separation, so that the kernel follows the curvature
+    and the varying pixel shapes of the HEALPix grid. The neighbour lists are shared
+    by all energy bins and datasets with the same spatial geometry.
+
+    Parameters
+    ----------
+    neighbours : `~gammapy.maps.hpx.utils.HpxNeighbours`
+        Neighbours of the pixels within the kernel radius.
+    radius : `~numpy.ndarray`
+        Radii of the profile in radians.
+    profile : `~numpy.ndarray`
+        Radial profile of the kernel, of shape ``(n_energy, n_radius)``.
+    """
+
+    def __init__(self, neighbours, radius, profile):
+        self.neighbours = neighbours
+        self.radius = radius
+        self.profile = profile
+
+    @classmethod
+    def from_map(cls, kernel, geom, radius):
+        """Create from the radial profile of a kernel map around its center.
+
+        Parameters
+        ----------
+        kernel : `~gammapy.maps.WcsNDMap`
+            Kernel map, with one non-spatial axis.
+        geom : `~gammapy.maps.HpxGeom`
+            HEALPix geometry.
+        radius : `~astropy.coordinates.Angle`
+            Radius of the kernel.
+
+        Returns
+        -------
+        kernel : `HpxKernel`
+            HEALPix kernel.
+        """
+        neighbours = HpxNeighbours.from_geom(geom, radius=radius)
+
+        step = np.min(kernel.geom.pixel_scales.to_value("rad")) / 4
+        radius = Angle(radius).rad
+        radius = np.linspace(0, radius, int(np.ceil(radius / step)) + 1)
+
+        positions = kernel.geom.center_skydir.directional_offset_by(
+            0 * u.rad, radius * u.rad
+        )
+        axis = kernel.geom.axes[0]
+        coords = {"skycoord": positions, axis.name: axis.center[:, np.newaxis]}
+        profile = kernel.interp_by_coord(coords, fill_value=0)
+        return cls(neighbours=neighbours, radius=radius, profile=profile)
+
+    def _values(self, separation):
+        return np.stack([np.interp(separation, self.radius, _) for _ in self.profile])
+
+    def get(self, idx):
+        """Kernel of a pixel, normalized in each energy bin.
+
+        Parameters
+        ----------
+        idx : int
+            Local pixel index.
+
+        Returns
+        -------
+        kernel : `~numpy.ndarray`
+            Kernel values of the neighbours, of shape ``(n_energy, n_neighbours)``.
+        """
+        indptr = self.neighbours.indptr
+        values = self._values(self.neighbours.separation[indptr[idx] : indptr[idx + 1]])
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values /= values.sum(axis=1, keepdims=True)
+
+        values[~np.isfinite(values)] = 0
+        return values
+
+    def extract(self, data, idx):
+        """Data of the neighbours of a pixel, see `HpxNeighbours.extract`."""
+        return self.neighbours.extract(data, idx=idx)
+
+    def correlate(self, data):
+        """Correlate data with the kernel, normalized by the sum of its squares.
+
+        This is the HEALPix equivalent of the convolution used for the default
+        flux estimate, see `TSMapEstimator.estimate_flux_default`.
+
+        Parameters
+        ----------
+        data : `~numpy.ndarray`
+            Data of shape ``(n_energy, npix)``.
+
+        Returns
+        -------
+        data : `~numpy.ndarray`
+            Correlated data.
+        """
+        indptr = self.neighbours.indptr
+        rows = np.repeat(np.arange(self.neighbours.npix), np.diff(indptr))
+        values = self._values(self.neighbours.separation)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            values /= np.add.reduceat(values, indptr[:-1], axis=1)[:, rows]
+            values /= np.add.reduceat((values**2).sum(axis=0), indptr[:-1])[rows]
+
+        values[~np.isfinite(values)] = 0
+
+        return np.stack(
+            [
+                self.neighbours.correlate(plane, values=value)
+                for plane, value in zip(data, values)
+            ]
         )
 
 
+def _kernel_data(kernel):
+    """Kernel array of a kernel map, HEALPix kernels are used as they are."""
+    if isinstance(kernel, HpxKernel):
+        return kernel
+
+    return kernel.data
+
+
 # TODO: merge with MapDataset?
 class SimpleMapDataset:
     """Simple map dataset.
@@ -746,19 +1248,25 @@ class SimpleMapDataset:
 
     @classmethod
     def from_arrays(cls, counts, background, exposure, norm, position, kernel, weights):
-        if weights:
+        if isinstance(kernel, HpxKernel):
+            extract = partial(kernel.extract, idx=position[0])
+            kernel = kernel.get(idx=position[0])
+        else:
+            extract = partial(_extract_array, shape=kernel.shape, position=position)
+
+        if weights is not None:
             # compute mask weighted kernel for the sum_over_axes case
-            weights = _extract_array(weights.data, kernel.shape, position)
+            weights = extract(weights)
             kernel = (kernel * weights).sum(axis=0, keepdims=True)
             with np.errstate(invalid="ignore", divide="ignore"):
                 kernel /= weights.sum(axis=0, keepdims=True)
                 kernel[~np.isfinite(kernel)] = 0
 
-        counts_cutout = _extract_array(counts, kernel.shape, position)
-        background_cutout = _extract_array(background, kernel.shape, position)
-        exposure_cutout = _extract_array(exposure, kernel.shape, position)
+        counts_cutout = extract(counts)
+        background_cutout = extract(background)
+        exposure_cutout = extract(exposure)
         model = kernel * exposure_cutout
-        norm_guess = norm[0, position[0], position[1]]
+        norm_guess = norm[(0,) + tuple(position)]
         mask_invalid = (counts_cutout == 0) & (background_cutout == 0) & (model == 0)
         return cls(
             counts=counts_cutout[~mask_invalid],
@@ -768,6 +1276,193 @@ class SimpleMapDataset:
         )
 
 
+class SimpleMapDatasetBatch:
+    """Batch of simple map datasets evaluated together.
+
+    The arrays of the individual datasets are stacked along the first axis
+    and padded with zeros to the same length. All methods take and return
+    arrays with one entry per dataset.
+
+    Parameters
+    ----------
+    model : `~numpy.ndarray`
+        Kernel arrays, with shape (n_datasets, n_bins).
+    counts : `~numpy.ndarray`
+        Counts arrays, with shape (n_datasets, n_bins).
+    background : `~numpy.ndarray`
+        Background arrays, with shape (n_datasets, n_bins).
+    norm_guess : `~numpy.ndarray`
+        Norm guesses, with shape (n_datasets,).
+    valid : `~numpy.ndarray`
+        Mask of the bins which are not padding, with shape (n_datasets, n_bins).
+    """
+
+    def __init__(self, model, counts, background, norm_guess, valid):
+        self.model = model
+        self.counts = counts
+        self.background = background
+        self.norm_guess = norm_guess
+        self.valid = valid
+
+    def __len__(self):
+        return len(self.norm_guess)
+
+    def __getitem__(self, idx):
+        valid = self.valid[idx]
+        return SimpleMapDataset(
+            model=self.model[idx][valid],
+            counts=self.counts[idx][valid],
+            background=self.background[idx][valid],
+            norm_guess=self.norm_guess[idx],
+        )
+
+    @classmethod
+    def from_datasets(cls, datasets):
+        """Create batch from a list of simple map datasets.
+
+        Parameters
+        ----------
+        datasets : list of `SimpleMapDataset`
+            Simple map datasets.
+
+        Returns
+        -------
+        dataset : `SimpleMapDatasetBatch`
+            Batch of simple map datasets.
+        """
+        n_bins = max([len(d.counts) for d in datasets] + [1])
+        shape = (len(datasets), n_bins)
+
+        counts, background, model = np.zeros(shape), np.zeros(shape), np.zeros(shape)
+        valid = np.zeros(shape, dtype=bool)
+
+        for idx, d in enumerate(datasets):
+            n = len(d.counts)
+            counts[idx, :n] = d.counts
+            background[idx, :n] = d.background
+            model[idx, :n] = d.model
+            valid[idx, :n] = True
+
+        return cls(
+            model=model,
+            counts=counts,
+            background=background,
+            norm_guess=np.array([d.norm_guess for d in datasets], dtype=float),
+            valid=valid,
+        )
+
+    def select(self, index):
+        """Select a subset of the batch.
+
+        Parameters
+        ----------
+        index : `~numpy.ndarray`
+            Indices of the datasets to select.
+
+        Returns
+        -------
+        dataset : `SimpleMapDatasetBatch`
+            Batch of selected datasets.
+        """
+        return self.__class__(
+            model=self.model[index],
+            counts=self.counts[index],
+            background=self.background[index],
+            norm_guess=self.norm_guess[index],
+            valid=self.valid[index],
+        )
+
+    def _arrays(self, index):
+        if index is None or len(index) == len(self):
+            return self.counts, self.background, self.model, self.valid
+
+        return (
+            self.counts[index],
+            self.background[index],
+            self.model[index],
+            self.valid[index],
+        )
+
+    @lazyproperty
+    def norm_bounds(self):
+        """Bounds for x."""
+        counts, background, model = self.counts, self.background, self.model
+
+        has_counts, has_model = counts > 0, model > 0
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            sn = np.where(has_model, background / np.where(has_model, model, 1), np.inf)
+
+        s_counts = np.sum(counts, axis=1, where=has_counts)
+        s_model = np.sum(model, axis=1, where=has_model)
+
+        sn_counts = np.where(has_counts, sn, np.inf)
+        idx_min = np.argmin(sn_counts, axis=1)[:, np.newaxis]
+        sn_min = np.take_along_axis(sn_counts, idx_min, axis=1)[:, 0]
+        c_min = np.take_along_axis(counts, idx_min, axis=1)[:, 0]
+
+        found = sn_min < 1e14
+        sn_min = np.where(found, sn_min, 1e14)
+        c_min = np.where(found, c_min, 1.0)
+        sn_min_total = np.min(sn, axis=1, initial=1e14)
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            s_model = np.where(np.abs(s_model) > 0, s_model, np.nan)
+            norm_min = c_min / s_model - sn_min
+            norm_max = s_counts / s_model - sn_min
+
+        return norm_min, norm_max, -sn_min_total
+
+    def npred(self, norm, index=None):
+        """Predicted number of counts."""
+        _, background, model, _ = self._arrays(index)
+        return background + np.asarray(norm)[:, np.newaxis] * model
+
+    def _cash_sum(self, counts, npred, valid):
+        return np.sum(cash(counts, npred), axis=1, where=valid)
+
+    def stat_sum(self, norm, index=None):
+        """Statistics sum."""
+        counts, _, _, valid = self._arrays(index)
+        return self._cash_sum(counts, self.npred(norm, index=index), valid)
+
+    def stat_sum_asimov(self, norm, index=None):
+        """Statistics sum."""
+        npred = self.npred(norm, index=index)
+        return self._cash_sum(npred, npred, self._arrays(index)[-1])
+
+    def stat_sum_asimov_null(self, norm, index=None):
+        """Statistics sum."""
+        _, background, _, valid = self._arrays(index)
+        return self._cash_sum(self.npred(norm, index=index), background, valid)
+
+    def stat_derivative(self, norm, index=None):
+        """Statistics derivative."""
+        counts, background, model, _ = self._arrays(index)
+        denom = np.asarray(norm)[:, np.newaxis] * model + background
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            term = model * (1.0 - counts / denom)
+
+        term = np.where(np.abs(denom) > 0, term, 0)
+        term = np.where(counts > 0, term, model)
+        # 2 is required to maintain the correct normalization of the
+        # derivative of the likelihood function. It doesn't change the result of
+        # the fit.
+        return 2 * np.sum(term, axis=1, where=model > 0)
+
+    def stat_2nd_derivative(self, norm, index=None):
+        """Statistics 2nd derivative."""
+        counts, background, model, _ = self._arrays(index)
+        term_top = model**2 * counts
+        term_bottom = (background + np.asarray(norm)[:, np.newaxis] * model) ** 2
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            term = term_top / term_bottom
+
+        return np.sum(term, axis=1, where=term_bottom != 0)
+
+
 # TODO: merge with `FluxEstimator`?
 class BrentqFluxEstimator(Estimator):
     """Single parameter flux estimator."""
@@ -1074,33 +1769,248 @@ class BrentqFluxEstimator(Estimator):
         return result
 
 
-def _ts_value(
-    position, counts, exposure, background, kernel, norm, weights, flux_estimator
-):
-    """Compute test statistic value at a given pixel position.
+class BatchedBrentqFluxEstimator(BrentqFluxEstimator):
+    """Single parameter flux estimator solving a batch of datasets together.
 
-    Uses approach described in Stewart (2009).
+    Same as `BrentqFluxEstimator`, but operates on a `SimpleMapDatasetBatch`.
+    The root finding problems of all datasets are solved together using
+    `~gammapy.utils.roots.find_roots_vectorized` and all results are arrays
+    with one entry per dataset.
+    """
+
+    tag = "BatchedBrentqFluxEstimator"
+
+    def _estimate_result(self, dataset, norm, niter, success):
+        with np.errstate(invalid="ignore", divide="ignore"):
+            norm_err = np.sqrt(1 / dataset.stat_2nd_derivative(norm)) * self.n_sigma
+
+        stat = dataset.stat_sum(norm=norm)
+        stat_null = dataset.stat_sum(norm=np.zeros(len(dataset)))
+
+        return {
+            "norm": norm,
+            "norm_err": norm_err,
+            "niter": niter,
+            "ts": stat_null - stat,
+            "stat": stat,
+            "stat_null": stat_null,
+            "success": success,
+        }
+
+    def estimate_best_fit(self, dataset):
+        """Estimate best fit norm parameter.
+
+        Parameters
+        ----------
+        dataset : `SimpleMapDatasetBatch`
+            Batch of simple map datasets.
+
+        Returns
+        -------
+        result : dict
+            Result dictionary including 'norm' and 'norm_err'.
+        """
+        norm_min, norm_max, norm_min_total = dataset.norm_bounds
+
+        norm = norm_min_total.copy()
+        niter = np.zeros(len(dataset), dtype=int)
+        success = np.ones(len(dataset), dtype=bool)
+
+        is_empty = (dataset.counts.sum(axis=1) <= 0) | (dataset.model.sum(axis=1) <= 0)
+        index = np.nonzero(~is_empty)[0]
+
+        def f(x, idx):
+            return dataset.stat_derivative(x, index=index[idx])
+
+        roots, iterations, converged = find_roots_vectorized(
+            f,
+            norm_min[index],
+            norm_max[index],
+            rtol=self.rtol,
+            maxiter=self.max_niter,
+        )
+
+        norm[index] = np.where(
+            converged, np.maximum(roots, norm_min_total[index]), norm_min_total[index]
+        )
+        niter[index] = np.where(converged, iterations, self.max_niter)
+        success[index] = converged
+        return self._estimate_result(dataset, norm=norm, niter=niter, success=success)
+
+    def _confidence(self, dataset, n_sigma, result, positive):
+        stat_best = result["stat"]
+        norm = result["norm"]
+        norm_err = result["norm_err"]
+
+        def ts_diff(x, idx):
+            return (stat_best[idx] + n_sigma**2) - dataset.stat_sum(x, index=idx)
+
+        if positive:
+            min_norm = norm
+            max_norm = norm + 1e2 * norm_err
+            factor = 1
+        else:
+            min_norm = norm - 1e2 * norm_err
+            max_norm = norm
+            factor = -1
+
+        roots, _, converged = find_roots_vectorized(
+            ts_diff, min_norm, max_norm, rtol=self.rtol, maxiter=self.max_niter
+        )
+        # Where the root finding fails NaN is set as norm
+        roots = np.where(converged, roots, np.nan)
+        return (roots - norm) * factor
+
+    def estimate_sensitivity(self, dataset, result):
+        norm = result["norm"]
+
+        def sigma_diff(x, idx):
+            ts_asimov = dataset.stat_sum_asimov_null(
+                x, index=idx
+            ) - dataset.stat_sum_asimov(x, index=idx)
+            return (
+                ts_to_sigma(ts_asimov, ts_asimov=ts_asimov) - self.n_sigma_sensitivity
+            )
+
+        roots, _, converged = find_roots_vectorized(
+            sigma_diff,
+            norm / 1000.0,
+            norm * 1000.0,
+            rtol=self.rtol,
+            maxiter=self.max_niter,
+        )
+        # Where the root finding fails NaN is set as norm
+        return {"norm_sensitivity": np.where(converged, roots, np.nan)}
+
+    def estimate_scan(self, dataset, result):
+        """Compute likelihood profile.
+
+        The profiles are sampled at different norm values for each dataset,
+        therefore they are computed one dataset at a time.
+
+        Parameters
+        ----------
+        dataset : `SimpleMapDatasetBatch`
+            Batch of simple map datasets.
+
+        Returns
+        -------
+        result : dict
+            Result dictionary including 'stat_scan'.
+        """
+        results = []
+
+        for idx in range(len(dataset)):
+            result_idx = {name: value[idx] for name, value in result.items()}
+            results.append(super().estimate_scan(dataset[idx], result_idx))
+
+        return {name: np.array([_[name] for _ in results]) for name in results[0]}
+
+    def estimate_default(self, dataset):
+        """Estimate default norm.
+
+        Parameters
+        ----------
+        dataset : `SimpleMapDatasetBatch`
+            Batch of simple map datasets.
+
+        Returns
+        -------
+        result : dict
+            Result dictionary including 'norm', 'norm_err' and "niter".
+        """
+        return self._estimate_result(
+            dataset,
+            norm=dataset.norm_guess.copy(),
+            niter=np.zeros(len(dataset), dtype=int),
+            success=np.ones(len(dataset), dtype=bool),
+        )
+
+    def run(self, dataset):
+        """Run flux estimator.
+
+        Parameters
+        ----------
+        dataset : `SimpleMapDatasetBatch`
+            Batch of simple map datasets.
+
+        Returns
+        -------
+        result : dict
+            Result dictionary.
+        """
+        if self.ts_threshold is not None:
+            result = self.estimate_default(dataset)
+            index = np.nonzero(result["ts"] > self.ts_threshold)[0]
+            if len(index):
+                result_fit = self.estimate_best_fit(dataset.select(index))
+                for name, value in result_fit.items():
+                    result[name][index] = value
+        else:
+            result = self.estimate_best_fit(dataset)
+
+        if "ul" in self.selection_optional:
+            result.update(self.estimate_ul(dataset, result))
+
+        if "errn-errp" in self.selection_optional:
+            result.update(self.estimate_errn_errp(dataset, result))
+
+        if "stat_scan" in self.selection_optional:
+            result.update(self.estimate_scan(dataset, result))
+
+        if "sensitivity" in self.selection_optional:
+            result.update(self.estimate_sensitivity(dataset, result))
+
+        norm = result["norm"]
+        result["npred"] = dataset.npred(norm=norm).sum(axis=1)
+        result["npred_excess"] = result["npred"] - dataset.npred(
+            norm=np.zeros(len(dataset))
+        ).sum(axis=1)
+        result["stat"] = dataset.stat_sum(norm=norm)
+
+        return result
+
+
+def _estimate_maps_tile(estimator, datasets):
+    """Estimate the maps of all quantities for a single tile.
+
+    Returns None if the tile contains no valid exposure or mask.
+    """
+    for dataset in datasets:
+        if np.any(dataset.exposure.data > 0) and (
+            dataset.mask is None or np.any(dataset.mask.data)
+        ):
+            return estimator._estimate_maps(datasets)
+
+    log.debug("Skipping tile without valid exposure or mask.")
+    return None
+
+
+def _simple_map_dataset(position, counts, exposure, background, kernel, norm, weights):
+    """Create the joint simple map dataset of all datasets at a given pixel position.
 
     Parameters
     ----------
     position : tuple (i, j)
         Pixel position.
-    counts : `~numpy.ndarray`
-        Counts image.
-    background : `~numpy.ndarray`
-        Background image.
-    exposure : `~numpy.ndarray`
-        Exposure image.
-    kernel : `astropy.convolution.Kernel2D`
-        Source model kernel.
-    norm : `~numpy.ndarray`
-        Norm image. The flux value at the given pixel position is used as
-        starting value for the minimization.
+    counts : list of `~numpy.ndarray`
+        Counts images.
+    exposure : list of `~numpy.ndarray`
+        Exposure images.
+    background : list of `~numpy.ndarray`
+        Background images.
+    kernel : list of `~numpy.ndarray`
+        Source model kernels.
+    norm : list of `~numpy.ndarray`
+        Norm images. The mean flux value at the given pixel position is used
+        as starting value for the minimization.
+    weights : list of `~numpy.ndarray` or None
+        Mask weights used to compute the kernel for the sum over energy groups.
 
     Returns
     -------
-    TS : float
-        Test statistic value at the given pixel position.
+    dataset : `SimpleMapDataset`
+        Simple map dataset.
     """
     datasets = []
     nd = len(counts)
@@ -1123,10 +2033,171 @@ def _ts_value(
         norm_guess = np.mean(norm_guess[mask_valid])
     else:
         norm_guess = 1.0
-    dataset = SimpleMapDataset(
+    return SimpleMapDataset(
         counts=np.concatenate([d.counts for d in datasets]),
         background=np.concatenate([d.background for d in datasets]),
         model=np.concatenate([d.model for d in datasets]),
         norm_guess=norm_guess,
     )
+
+
+def _ts_value(
+    position, counts, exposure, background, kernel, norm, weights, flux_estimator
+):
+    """Compute test statistic value at a given pixel position.
+
+    Uses approach described in Stewart (2009).
+
+    Parameters
+    ----------
+    position : tuple (i, j)
+        Pixel position.
+    counts : list of `~numpy.ndarray`
+        Counts images.
+    exposure : list of `~numpy.ndarray`
+        Exposure images.
+    background : list of `~numpy.ndarray`
+        Background images.
+    kernel : list of `~numpy.ndarray`
+        Source model kernels.
+    norm : list of `~numpy.ndarray`
+        Norm images. The flux value at the given pixel position is used as
+        starting value for the minimization.
+    weights : list of `~numpy.ndarray` or None
+        Mask weights used to compute the kernel for the sum over energy groups.
+    flux_estimator : `BrentqFluxEstimator`
+        Flux estimator.
+
+    Returns
+    -------
+    result : dict
+        Test statistic results at the given pixel position.
+    """
+    dataset = _simple_map_dataset(
+        position=position,
+        counts=counts,
+        exposure=exposure,
+        background=background,
+        kernel=kernel,
+        norm=norm,
+        weights=weights,
+    )
     return flux_estimator.run(dataset)
+
+
+def _ts_value_batch(
+    positions, counts, exposure, background, kernel, norm, weights, flux_estimator
+):
+    """Compute test statistic values for a batch of pixel positions.
+
+    The norm of all positions is solved together, see `BatchedBrentqFluxEstimator`.
+
+    Parameters
+    ----------
+    positions : list of tuple (i, j)
+        Pixel positions.
+    counts, exposure, background, kernel, norm, weights : list of `~numpy.ndarray`
+        Input arrays, see `_ts_value`.
+    flux_estimator : `BatchedBrentqFluxEstimator`
+        Flux estimator.
+
+    Returns
+    -------
+    results : list of dict
+        Test statistic results for each position.
+    """
+    datasets = [
+        _simple_map_dataset(
+            position=tuple(position),
+            counts=counts,
+            exposure=exposure,
+            background=background,
+            kernel=kernel,
+            norm=norm,
+            weights=weights,
+        )
+        for position in positions
+    ]
+
+    dataset = SimpleMapDatasetBatch.from_datasets(datasets)
+    result = flux_estimator.run(dataset)
+    return [
+        {name: value[idx] for name, value in result.items()}
+        for idx in range(len(dataset))
+    ]
+
+
+def _ts_values(
+    positions,
+    counts,
+    exposure,
+    background,
+    kernel,
+    norm,
+    weights,
+    flux_estimator,
+    batch_size=None,
+):
+    """Compute test statistic values for a list of pixel positions.
+
+    Positions are processed one at a time or, if ``batch_size`` is given,
+    in batches using `_ts_value_batch`.
+    """
+    inputs = dict(
+        counts=counts,
+        exposure=exposure,
+        background=background,
+        kernel=kernel,
+        norm=norm,
+        weights=weights,
+        flux_estimator=flux_estimator,
+    )
+
+    if not batch_size:
+        return [_ts_value(tuple(position), **inputs) for position in positions]
+
+    results = []
+    for idx in range(0, len(positions), batch_size):
+        results += _ts_value_batch(positions[idx : idx + batch_size], **inputs)
+    return results
+
+
+_TS_VALUE_INPUTS = ["counts", "exposure", "background", "kernel", "norm", "weights"]
+
+_N_BLOCKS_PER_JOB = 4
+
+
+def _ts_value_block(positions, specs, n_datasets, flux_estimator, batch_size=None):
+    """Compute test statistic values for a block of pixel positions.
+
+    The input arrays are read from shared memory, see `~gammapy.utils.parallel.SharedMemoryArrays`.
+
+    Parameters
+    ----------
+    positions : list of tuple (i, j)
+        Pixel positions.
+    specs : dict
+        Shared memory description of the input arrays.
+    n_datasets : int
+        Number of datasets.
+    flux_estimator : `BrentqFluxEstimator`
+        Flux estimator.
+    batch_size : int, optional
+        Number of pixels solved together. Default is None.
+
+    Returns
+    -------
+    results : list of dict
+        Test statistic results for each position.
+    """
+    with parallel.attach_shared_memory_arrays(specs) as arrays:
+        inputs = {
+            name: [arrays[f"{name}_{idx}"] for idx in range(n_datasets)]
+            for name in _TS_VALUE_INPUTS
+        }
+        results = _ts_values(
+            positions, flux_estimator=flux_estimator, batch_size=batch_size, **inputs
+        )
+        del inputs
+
+    return results
@@ -312,7 +312,9 @@ def estimate_exposure_reco_energy(dataset, spectral_model=None, normalize=True):
         ref_flux = spectral_model.integral(
             energy_axis.edges[:-1], energy_axis.edges[1:]
         )
-        reco_exposure = reco_exposure / ref_flux[:, np.newaxis, np.newaxis]
+        # WCS data have two spatial dimensions, HEALPix data a single one
+        shape = (-1,) + (1,) * (reco_exposure.data.ndim - 1)
+        reco_exposure = reco_exposure / ref_flux.reshape(shape)
 
     return reco_exposure
 
@@ -1,13 +1,18 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import html
+from collections import OrderedDict
 import numpy as np
+import scipy.fft
 import astropy.units as u
 import matplotlib.pyplot as plt
+import gammapy.utils.profiling as profiling
 from gammapy.maps import Map
 from gammapy.modeling.models import PowerLawSpectralModel
 
 __all__ = ["PSFKernel"]
 
+FFT_CACHE_SIZE = 4
+
 
 class PSFKernel:
     """PSF kernel for `~gammapy.maps.Map`.
@@ -57,6 +62,8 @@ class PSFKernel:
 
     def __init__(self, psf_kernel_map, normalize=True):
         self._psf_kernel_map = psf_kernel_map
+        self._fft_data = None
+        self._fft_cache = OrderedDict()
 
         if normalize:
             self.normalize()
@@ -89,6 +96,49 @@ class PSFKernel:
         """The map object holding the kernel as a `~gammapy.maps.Map`."""
         return self._psf_kernel_map
 
+    def get_fft(self, fft_shape):
+        """Real FFT of the kernel images, zero padded to a given shape.
+
+        The FFT is computed in single precision over the two spatial axes with
+        `~scipy.fft.rfftn`. It is cached for the last ``FFT_CACHE_SIZE`` shapes,
+        so that repeated convolutions of maps of the same shape, e.g. in a fit,
+        only compute the FFT of the map. The cache is reset when the kernel data
+        is replaced, e.g. by `PSFKernel.normalize`, but not when it is modified
+        in place.
+
+        Parameters
+        ----------
+        fft_shape : tuple of int
+            Shape of the zero padded kernel images.
+
+        Returns
+        -------
+        spectrum : `~numpy.ndarray`
+            Kernel spectrum.
+        """
+        data = self.psf_kernel_map.data
+
+        if self._fft_data is not data:
+            self._fft_data = data
+            self._fft_cache = OrderedDict()
+
+        fft_shape = tuple(int(n) for n in fft_shape)
+        spectrum = self._fft_cache.get(fft_shape)
+
+        if spectrum is None:
+            profiling.count("PSFKernel.fft.miss")
+            data = data.astype(np.float32, copy=False)
+            spectrum = scipy.fft.rfftn(data, s=fft_shape, axes=(-2, -1))
+            self._fft_cache[fft_shape] = spectrum
+
+            while len(self._fft_cache) > FFT_CACHE_SIZE:
+                self._fft_cache.popitem(last=False)
+        else:
+            profiling.count("PSFKernel.fft.hit")
+            self._fft_cache.move_to_end(fft_shape)
+
+        return spectrum
+
     @classmethod
     def read(cls, *args, **kwargs):
         """Read kernel Map from file."""
@@ -10,6 +10,7 @@ from .background import (
     RingBackgroundMaker,
     WobbleRegionsFinder,
 )
+from .cache import ReductionCache
 from .core import Maker
 from .map import MapDatasetMaker
 from .reduce import DatasetsMaker
@@ -39,6 +40,7 @@ __all__ = [
     "MAKER_REGISTRY",
     "MapDatasetMaker",
     "PhaseBackgroundMaker",
+    "ReductionCache",
     "ReflectedRegionsBackgroundMaker",
     "ReflectedRegionsFinder",
     "RegionsFinder",
@@ -0,0 +1,261 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Persistent cache for data reduction products."""
+
+import hashlib
+import logging
+import os
+import numpy as np
+import astropy.units as u
+from gammapy.utils.fits import HDULocation
+from gammapy.utils.scripts import make_path
+
+__all__ = ["ReductionCache"]
+
+log = logging.getLogger(__name__)
+
+IRF_NAMES = ["aeff", "edisp", "psf", "_bkg"]
+
+
+def _update_hash_array(hasher, value):
+    """Update hash with the values of an array like object."""
+    value = getattr(value, "value", value)
+    hasher.update(np.ascontiguousarray(value).tobytes())
+
+
+def _geom_token(geom):
+    """Hash of a geometry, including its axes."""
+    hasher = hashlib.sha256()
+    hasher.update(geom.__class__.__name__.encode())
+    hasher.update(str(geom.data_shape).encode())
+
+    if geom.is_region:
+        hasher.update(str(geom.region).encode())
+
+    if geom.is_hpx:
+        hasher.update(str(sorted(geom.to_header().items())).encode())
+    else:
+        hasher.update(geom.wcs.to_header_string().encode())
+
+    for axis in geom.axes:
+        hasher.update(f"{axis.name}-{axis.node_type}-{axis.unit}".encode())
+        edges = getattr(axis, "edges", None)
+        _update_hash_array(hasher, axis.center if edges is None else edges)
+
+    return hasher.hexdigest()
+
+
+class ReductionCache:
+    """Content-addressed on-disk cache for data reduction products.
+
+    The exposure, background, PSF and energy dispersion maps computed by
+    `~gammapy.makers.MapDatasetMaker` are stored as FITS files under ``path``.
+    Each product is addressed by a key derived from the observation id, its GTIs,
+    live time, dead-time fraction and pointing, the checksums of the IRF files,
+    the geometry and the maker configuration. A product is therefore recomputed
+    as soon as any of these changes.
+
+    Only observations whose IRFs are read from files, e.g. obtained from a
+    `~gammapy.data.DataStore`, can be cached. When the total size of the cache
+    exceeds ``max_size``, the least recently used products are removed.
+
+    Parameters
+    ----------
+    path : str or `~pathlib.Path`
+        Cache directory. Created if it does not exist.
+    max_size : str or `~astropy.units.Quantity`, optional
+        Maximum total size of the cached files. Default is "10 GB".
+
+    Examples
+    --------
+    >>> from gammapy.makers import MapDatasetMaker, ReductionCache
+    >>> cache = ReductionCache("reduction-cache", max_size="2 GB")
+    >>> maker = MapDatasetMaker(cache=cache)
+    """
+
+    def __init__(self, path, max_size="10 GB"):
+        self.path = make_path(path)
+        self.max_size = u.Quantity(max_size)
+        self._checksums = {}
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={self.path}, max_size={self.max_size})"
+
+    @property
+    def size(self):
+        """Total size of the cached files as a `~astropy.units.Quantity`."""
+        return sum(_.stat().st_size for _ in self._files()) * u.byte
+
+    def _files(self):
+        if not self.path.exists():
+            return []
+        return list(self.path.glob("*.fits"))
+
+    def _filename(self, key):
+        return self.path / f"{key}.fits"
+
+    def _checksum(self, filename):
+        """SHA-256 checksum of a file, memoized on its size and modification time."""
+        stat = filename.stat()
+        token = (str(filename), stat.st_size, stat.st_mtime_ns)
+
+        if token not in self._checksums:
+            hasher = hashlib.sha256()
+            with open(filename, "rb") as fh:
+                for chunk in iter(lambda: fh.read(2**20), b""):
+                    hasher.update(chunk)
+            self._checksums[token] = hasher.hexdigest()
+
+        return self._checksums[token]
+
+    def _irf_tokens(self, observation):
+        """Checksums of the IRF files, None if an IRF is not read from a file."""
+        tokens = []
+        for name in IRF_NAMES:
+            if name in observation.__dict__:
+                return None
+
+            hdu_location = observation.__dict__.get(f"_{name}_hdu")
+
+            if hdu_location is None:
+                tokens.append(f"{name}-none")
+                continue
+
+            if not isinstance(hdu_location, HDULocation):
+                return None
+
+            filename = hdu_location.path(abs_path=True)
+
+            if not filename.exists():
+                return None
+
+            checksum = self._checksum(filename)
+            tokens.append(f"{name}-{hdu_location.hdu_name}-{checksum}")
+
+        return tokens
+
+    def key(self, name, geom, observation, config=None):
+        """Cache key of a reduction product.
+
+        Parameters
+        ----------
+        name : str
+            Product name, e.g. "exposure".
+        geom : `~gammapy.maps.Geom`
+            Geometry of the product.
+        observation : `~gammapy.data.Observation`
+            Observation.
+        config : dict, optional
+            Configuration of the maker computing the product. Default is None.
+
+        Returns
+        -------
+        key : str or None
+            Cache key, None if the product cannot be cached.
+        """
+        irf_tokens = self._irf_tokens(observation)
+
+        if irf_tokens is None:
+            log.debug(
+                f"Observation {observation.obs_id}: IRFs are not read from files, "
+                "reduction products are not cached."
+            )
+            return None
+
+        hasher = hashlib.sha256()
+        hasher.update(f"{name}-{observation.obs_id}".encode())
+
+        for token in irf_tokens:
+            hasher.update(token.encode())
+
+        gti = observation.gti
+        _update_hash_array(hasher, gti.time_start.mjd)
+        _update_hash_array(hasher, gti.time_stop.mjd)
+
+        livetime = float(observation.observation_live_time_duration.to_value("s"))
+        deadtime_fraction = float(observation.observation_dead_time_fraction)
+        hasher.update(f"{livetime!r}-{deadtime_fraction!r}".encode())
+
+        pointing = observation.pointing.to_fits_header()
+        hasher.update(str(sorted(pointing.items())).encode())
+
+        hasher.update(_geom_token(geom).encode())
+
+        config = config or {}
+        hasher.update(str(sorted(config.items())).encode())
+
+        return f"{name}-{hasher.hexdigest()}"
+
+    def read(self, key, reader):
+        """Read a cached product.
+
+        Parameters
+        ----------
+        key : str
+            Cache key, see `ReductionCache.key`.
+        reader : callable
+            Function reading the product from a filename, e.g. `~gammapy.maps.Map.read`.
+
+        Returns
+        -------
+        product : object or None
+            Cached product, None if it is not in the cache.
+        """
+        filename = self._filename(key)
+
+        if not filename.exists():
+            return None
+
+        try:
+            product = reader(filename)
+        except (OSError, ValueError, KeyError):
+            log.warning(f"Invalid cache file {filename}, ignoring it.")
+            return None
+
+        # mark as recently used
+        os.utime(filename)
+        log.debug(f"Read {key} from cache")
+        return product
+
+    def write(self, key, product):
+        """Write a product to the cache and evict the least recently used ones.
+
+        Parameters
+        ----------
+        key : str
+            Cache key, see `ReductionCache.key`.
+        product : `~gammapy.maps.Map` or `~gammapy.irf.IRFMap`
+            Product to cache.
+        """
+        self.path.mkdir(parents=True, exist_ok=True)
+        filename = self._filename(key)
+
+        # write to a temporary file first, parallel workers may write the same key
+        filename_tmp = filename.with_name(f"{key}.{os.getpid()}.tmp")
+        product.write(filename_tmp, overwrite=True)
+        os.replace(filename_tmp, filename)
+
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used products until the size is below the maximum."""
+        max_size = self.max_size.to_value("byte")
+
+        files = [(_.stat(), _) for _ in self._files()]
+        size = sum(stat.st_size for stat, _ in files)
+
+        for stat, filename in sorted(files, key=lambda _: _[0].st_mtime_ns):
+            if size <= max_size:
+                break
+
+            try:
+                filename.unlink()
+            except FileNotFoundError:
+                continue
+
+            size -= stat.st_size
+            log.debug(f"Removed {filename.name} from cache")
+
+    def clear(self):
+        """Remove all cached products."""
+        for filename in self._files():
+            filename.unlink(missing_ok=True)
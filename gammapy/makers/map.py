@@ -4,10 +4,12 @@ import astropy.units as u
 from astropy.table import Table
 import numpy as np
 from regions import PointSkyRegion
+import gammapy.utils.profiling as profiling
 from gammapy.datasets import MapDatasetMetaData
-from gammapy.irf import EDispKernelMap, PSFMap
+from gammapy.irf import EDispKernelMap, EDispMap, PSFMap
 from gammapy.data import Observation
 from gammapy.maps import Map
+from .cache import ReductionCache
 from .core import Maker
 from .utils import (
     make_counts_rad_max,
@@ -45,6 +47,18 @@ class MapDatasetMaker(Maker):
         Maximum error on the rotation angle between AltAz and RaDec frames during background evaluation.
         Used only when the Background IRF has an AltAz alignment.
         Default is 1.0 deg.
+    cache : str, `~pathlib.Path` or `~gammapy.makers.ReductionCache`, optional
+        On-disk cache for the exposure, background, PSF and energy dispersion
+        maps. If a path is given, a `~gammapy.makers.ReductionCache` with
+        default settings is created in this directory. Products are reused
+        when the observation, IRF files, geometry and maker configuration are
+        unchanged. Default is None, no cache.
+    counts_chunk_size : int, optional
+        Number of events binned at once when making the counts map, see
+        `~gammapy.maps.Map.fill_events`. The memory used for large event lists is
+        only bounded together with lazy loading of the event list columns, see
+        ``gammapy.data.event_list.EVENTS_LAZY_LOADING``. Default is None, which
+        bins all events at once.
 
     Examples
     --------
@@ -118,8 +132,11 @@ class MapDatasetMaker(Maker):
         background_interp_missing_data=True,
         background_pad_offset=True,
         fov_rotation_step=1.0 * u.deg,
+        cache=None,
+        counts_chunk_size=None,
     ):
         self.background_oversampling = background_oversampling
+        self.counts_chunk_size = counts_chunk_size
         self.background_interp_missing_data = background_interp_missing_data
         self.background_pad_offset = background_pad_offset
         self.fov_rotation_step = fov_rotation_step
@@ -133,9 +150,57 @@ class MapDatasetMaker(Maker):
             raise ValueError(f"{difference} is not a valid method.")
 
         self.selection = selection
+        self.cache = cache
+
+    @property
+    def cache(self):
+        """Reduction products cache (`~gammapy.makers.ReductionCache`)."""
+        return self._cache
+
+    @cache.setter
+    def cache(self, value):
+        if value is not None and not isinstance(value, ReductionCache):
+            value = ReductionCache(path=value)
+        self._cache = value
+
+    def _cache_config(self):
+        """Maker configuration entering the cache keys."""
+        config = {"tag": self.tag}
+        for name, value in vars(self).items():
+            if name in ["_cache", "selection", "counts_chunk_size"]:
+                continue
+            config[name] = str(value)
+        return config
+
+    def _make_cached(self, name, geom, observation, make, reader):
+        """Make a reduction product, reading it from the cache if available."""
+        key = None
+
+        if self.cache is not None and isinstance(observation, Observation):
+            key = self.cache.key(
+                name=name,
+                geom=geom,
+                observation=observation,
+                config=self._cache_config(),
+            )
+
+        if key is not None:
+            product = self.cache.read(key, reader=reader)
+            if product is not None:
+                profiling.count(f"{self.tag}.{name}.cache_hit")
+                return product
+
+        size = np.prod(geom.data_shape)
+        with profiling.stage(f"{self.tag}.{name}", size=size):
+            product = make(geom, observation)
+
+        if key is not None:
+            self.cache.write(key, product)
+
+        return product
 
     @staticmethod
-    def make_counts(geom, observation):
+    def make_counts(geom, observation, chunk_size=None):
         """Make counts map.
 
         Parameters
@@ -144,6 +209,9 @@ class MapDatasetMaker(Maker):
             Reference map geometry.
         observation : `~gammapy.data.Observation`
             Observation container.
+        chunk_size : int, optional
+            Number of events binned at once, see `~gammapy.maps.Map.fill_events`.
+            Default is None, which bins all events at once.
 
         Returns
         -------
@@ -154,7 +222,7 @@ class MapDatasetMaker(Maker):
             counts = make_counts_rad_max(geom, observation.rad_max, observation.events)
         else:
             counts = Map.from_geom(geom)
-            counts.fill_events(observation.events)
+            counts.fill_events(observation.events, chunk_size=chunk_size)
         return counts
 
     @staticmethod
@@ -460,32 +528,58 @@ class MapDatasetMaker(Maker):
         kwargs["mask_safe"] = mask_safe
 
         if "counts" in self.selection:
-            counts = self.make_counts(dataset.counts.geom, observation)
+            geom = dataset.counts.geom
+            size = np.prod(geom.data_shape)
+            with profiling.stage(f"{self.tag}.counts", size=size):
+                counts = self.make_counts(
+                    geom, observation, chunk_size=self.counts_chunk_size
+                )
         else:
             counts = Map.from_geom(dataset.counts.geom, data=0)
         kwargs["counts"] = counts
 
         if "exposure" in self.selection:
-            exposure = self.make_exposure(dataset.exposure.geom, observation)
+            exposure = self._make_cached(
+                "exposure",
+                dataset.exposure.geom,
+                observation,
+                make=self.make_exposure,
+                reader=Map.read,
+            )
             kwargs["exposure"] = exposure
 
         if "background" in self.selection:
-            kwargs["background"] = self.make_background(
-                dataset.counts.geom, observation
+            kwargs["background"] = self._make_cached(
+                "background",
+                dataset.counts.geom,
+                observation,
+                make=self.make_background,
+                reader=Map.read,
             )
 
         if "psf" in self.selection:
-            psf = self.make_psf(dataset.psf.psf_map.geom, observation)
+            psf = self._make_cached(
+                "psf",
+                dataset.psf.psf_map.geom,
+                observation,
+                make=self.make_psf,
+                reader=PSFMap.read,
+            )
             kwargs["psf"] = psf
 
         if "edisp" in self.selection:
             if dataset.edisp.edisp_map.geom.axes[0].name.upper() == "MIGRA":
-                edisp = self.make_edisp(dataset.edisp.edisp_map.geom, observation)
+                make_edisp = self.make_edisp
             else:
-                edisp = self.make_edisp_kernel(
-                    dataset.edisp.edisp_map.geom, observation
-                )
-
+                make_edisp = self.make_edisp_kernel
+
+            edisp = self._make_cached(
+                "edisp",
+                dataset.edisp.edisp_map.geom,
+                observation,
+                make=make_edisp,
+                reader=EDispMap.read,
+            )
             kwargs["edisp"] = edisp
 
         return dataset.__class__(name=dataset.name, **kwargs)
@@ -1,10 +1,15 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import logging
+from copy import copy
+from functools import partial
 from astropy.coordinates import Angle
 from astropy.nddata import NoOverlapError
 import gammapy.utils.parallel as parallel
+import gammapy.utils.profiling as profiling
 from gammapy.datasets import Datasets, MapDataset, MapDatasetOnOff, SpectrumDataset
+from .cache import ReductionCache
 from .core import Maker
+from .map import MapDatasetMaker
 from .safe import SafeMaskMaker
 
 log = logging.getLogger(__name__)
@@ -38,9 +43,13 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         If None it returns an error, except if the list of makers includes a `SafeMaskMaker`
         with the offset-max method defined. In that case it is set to two times `offset_max`.
         Default is None.
-    parallel_backend : {'multiprocessing', 'ray'}, optional
+    parallel_backend : {'multiprocessing', 'ray', 'futures', 'threading'}, optional
         Which backend to use for multiprocessing.
         Default is None.
+    cache : str, `~pathlib.Path` or `~gammapy.makers.ReductionCache`, optional
+        On-disk cache of the reduction products, consulted before reducing each
+        observation. It is used by the `~gammapy.makers.MapDatasetMaker` instances
+        of the chain which do not define their own cache. Default is None.
     """
 
     tag = "DatasetsMaker"
@@ -53,8 +62,18 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         cutout_mode="trim",
         cutout_width=None,
         parallel_backend=None,
+        cache=None,
     ):
         self.log = logging.getLogger(__name__)
+
+        if cache is not None and not isinstance(cache, ReductionCache):
+            cache = ReductionCache(path=cache)
+
+        self.cache = cache
+
+        if cache is not None:
+            makers = [self._with_cache(maker, cache) for maker in makers]
+
         self.makers = makers
         self.cutout_mode = cutout_mode
 
@@ -77,6 +96,14 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         self._datasets = []
         self._error = False
 
+    @staticmethod
+    def _with_cache(maker, cache):
+        """Copy of a `MapDatasetMaker` without cache, using the given one."""
+        if isinstance(maker, MapDatasetMaker) and maker.cache is None:
+            maker = copy(maker)
+            maker.cache = cache
+        return maker
+
     @property
     def offset_max(self):
         maker = self.safe_mask_maker
@@ -107,9 +134,10 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
                 "mode": self.cutout_mode,
             }
             try:
-                dataset_obs = dataset.cutout(
-                    **cutouts_kwargs,
-                )
+                with profiling.stage("DatasetsMaker.cutout"):
+                    dataset_obs = dataset.cutout(
+                        **cutouts_kwargs,
+                    )
             except NoOverlapError:
                 log.warning(
                     f"{observation.obs_id} discarded because"
@@ -129,7 +157,10 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
 
         for maker in self.makers:
             log.info(f"Running {maker.tag}")
-            dataset_obs = maker.run(dataset=dataset_obs, observation=observation)
+            with profiling.stage(f"{maker.tag}.run") as record:
+                dataset_obs = maker.run(dataset=dataset_obs, observation=observation)
+                if dataset_obs.counts is not None:
+                    record.size = dataset_obs.counts.data.size
 
         return dataset_obs
 
@@ -141,6 +172,12 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
         else:
             self._datasets.append(dataset)
 
+    def _callback_profiled(self, output):
+        dataset, records = output
+
+        profiling.merge_records(records)
+        self.callback(dataset)
+
     def error_callback(self, dataset):
         # parallel run could cause a memory error with non-explicit message.
         self._error = True
@@ -179,18 +216,27 @@ class DatasetsMaker(Maker, parallel.ParallelMixin):
 
         n_jobs = min(self.n_jobs, len(observations))
 
-        parallel.run_multiprocessing(
-            self.make_dataset,
-            zip(datasets, observations),
-            backend=self.parallel_backend,
-            pool_kwargs=dict(processes=n_jobs),
-            method="apply_async",
-            method_kwargs=dict(
-                callback=self.callback,
-                error_callback=self.error_callback,
-            ),
-            task_name="Data reduction",
-        )
+        func, callback = self.make_dataset, self.callback
+
+        # records of process based backends are returned and merged by the callback
+        backend = parallel.ParallelBackendEnum.from_str(self.parallel_backend)
+        if profiling.is_active() and backend != parallel.ParallelBackendEnum.threading:
+            func = partial(profiling._run_profiled, self.make_dataset)
+            callback = self._callback_profiled
+
+        with profiling.stage("DatasetsMaker.run"):
+            parallel.run_multiprocessing(
+                func,
+                zip(datasets, observations),
+                backend=self.parallel_backend,
+                pool_kwargs=dict(processes=n_jobs),
+                method="apply_async",
+                method_kwargs=dict(
+                    callback=callback,
+                    error_callback=self.error_callback,
+                ),
+                task_name="Data reduction",
+            )
 
         if self._error:
             raise RuntimeError("Execution of a sub-process failed")
@@ -92,7 +92,7 @@ class SpectrumDatasetMaker(MapDatasetMaker):
         return exposure
 
     @staticmethod
-    def make_counts(geom, observation):
+    def make_counts(geom, observation, chunk_size=None):
         """Make counts map.
 
         If the `~gammapy.maps.RegionGeom` is built from a `~regions.CircleSkyRegion`,
@@ -106,6 +106,9 @@ class SpectrumDatasetMaker(MapDatasetMaker):
             Reference map geometry.
         observation : `~gammapy.data.Observation`
             Observation container.
+        chunk_size : int, optional
+            Number of events binned at once, see `~gammapy.maps.Map.fill_events`.
+            Default is None, which bins all events at once.
 
         Returns
         -------
@@ -113,7 +116,7 @@ class SpectrumDatasetMaker(MapDatasetMaker):
             Counts map.
         """
         return super(SpectrumDatasetMaker, SpectrumDatasetMaker).make_counts(
-            geom, observation
+            geom, observation, chunk_size=chunk_size
         )
 
     def run(self, dataset, observation):
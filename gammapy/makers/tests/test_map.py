@@ -19,7 +19,12 @@ from gammapy.data import (
 from gammapy.datasets import MapDataset, MapDatasetMetaData
 from gammapy.datasets.map import RAD_AXIS_DEFAULT
 from gammapy.irf import Background2D, EDispKernelMap, EDispMap, PSFMap
-from gammapy.makers import FoVBackgroundMaker, MapDatasetMaker, SafeMaskMaker
+from gammapy.makers import (
+    FoVBackgroundMaker,
+    MapDatasetMaker,
+    ReductionCache,
+    SafeMaskMaker,
+)
 from gammapy.maps import HpxGeom, Map, MapAxis, WcsGeom
 from gammapy.utils.testing import requires_data, requires_dependency
 from gammapy.utils.scripts import make_path
@@ -230,6 +235,62 @@ def test_map_maker_obs_with_migra(observations):
     assert map_dataset.edisp.exposure_map.data.shape == (3, 1, 5, 10)
 
 
+@requires_data()
+def test_map_maker_cache(observations, tmp_path):
+    geom_reco = geom(ebounds=[0.1, 1, 10])
+    reference = MapDataset.create(geom=geom_reco, binsz_irf=1.0)
+
+    cache = ReductionCache(tmp_path / "cache")
+    maker = MapDatasetMaker(cache=cache)
+
+    dataset = maker.run(reference, observations[0])
+    assert len(list(cache.path.glob("*.fits"))) == 4
+    assert cache.size > 0
+
+    dataset_cached = maker.run(reference, observations[0])
+    assert len(list(cache.path.glob("*.fits"))) == 4
+
+    assert_allclose(dataset_cached.exposure.data, dataset.exposure.data)
+    assert_allclose(dataset_cached.background.data, dataset.background.data)
+    assert_allclose(dataset_cached.psf.psf_map.data, dataset.psf.psf_map.data)
+    assert_allclose(dataset_cached.edisp.edisp_map.data, dataset.edisp.edisp_map.data)
+    assert isinstance(dataset_cached.edisp, EDispKernelMap)
+
+    # changing the configuration or the observation invalidates the keys
+    MapDatasetMaker(cache=cache, background_oversampling=2).run(
+        reference, observations[0]
+    )
+    assert len(list(cache.path.glob("*.fits"))) == 5
+
+    maker.run(reference, observations[1])
+    assert len(list(cache.path.glob("*.fits"))) == 9
+
+    # so does a corrected dead-time fraction
+    observation = observations[0]
+    key = cache.key("exposure", geom_reco, observation)
+    deadtime_fraction = observation.meta.deadtime_fraction
+    observation.meta.deadtime_fraction = deadtime_fraction + 0.01
+    assert cache.key("exposure", geom_reco, observation) != key
+    observation.meta.deadtime_fraction = deadtime_fraction
+
+    cache.max_size = 1 * u.byte
+    cache.evict()
+    assert cache.size == 0
+
+
+@requires_data()
+def test_map_maker_counts_chunked(observations):
+    geom_reco = geom(ebounds=[0.1, 1, 10])
+
+    counts = MapDatasetMaker.make_counts(geom_reco, observations[0])
+    counts_chunked = MapDatasetMaker.make_counts(
+        geom_reco, observations[0], chunk_size=10000
+    )
+
+    assert counts_chunked.data.sum() > 0
+    assert_allclose(counts_chunked.data, counts.data)
+
+
 @requires_data()
 def test_make_meta_table(observations):
     maker_obs = MapDatasetMaker()
@@ -300,6 +300,33 @@ def test_datasets_maker_map_cutout_width(observations_cta, makers_map, map_datas
     assert_allclose(exposure.data.mean(), 1.350841e09, rtol=3e-3)
 
 
+@requires_data()
+def test_datasets_maker_map_cache(observations_cta, makers_map, map_dataset, tmp_path):
+    makers = DatasetsMaker(
+        makers_map,
+        stack_datasets=True,
+        cutout_mode="partial",
+        cutout_width="5 deg",
+        n_jobs=1,
+        cache=tmp_path,
+    )
+    assert makers.makers[0].cache is makers.cache
+    assert makers_map[0].cache is None
+
+    datasets = makers.run(map_dataset.copy(), observations_cta)
+    assert len(list(tmp_path.glob("*.fits"))) == 12
+
+    datasets_cached = makers.run(map_dataset.copy(), observations_cta)
+    assert len(list(tmp_path.glob("*.fits"))) == 12
+
+    assert_allclose(datasets_cached[0].counts.data, datasets[0].counts.data)
+    assert_allclose(datasets_cached[0].exposure.data, datasets[0].exposure.data)
+    assert_allclose(
+        datasets_cached[0].npred_background().data.sum(),
+        datasets[0].npred_background().data.sum(),
+    )
+
+
 @requires_data()
 def test_datasets_maker_map_2_steps(observations_cta, map_dataset):
     makers = DatasetsMaker(
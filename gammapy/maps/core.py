@@ -20,6 +20,7 @@ from gammapy.utils.units import energy_unit_format
 from .axes import MapAxis
 from .coord import MapCoord
 from .geom import pix_tuple_to_idx
+from .utils import INVALID_INDEX
 
 __all__ = ["Map"]
 
@@ -1186,6 +1187,13 @@ class Map(abc.ABC):
         -------
         output_map : `Map`
             Reprojected Map.
+
+        Notes
+        -----
+        The images are reprojected in parallel using threads, see
+        `~gammapy.utils.parallel.multiprocessing_manager` to set the number of jobs.
+        Threads are used unless a backend other than "multiprocessing" is
+        configured, in which case that backend is used.
         """
         if not geom.is_image:
             raise TypeError("This method is only valid for 2d geom")
@@ -1199,6 +1207,7 @@ class Map(abc.ABC):
                 repeat(preserve_counts),
                 repeat(precision_factor),
             ),
+            backend=parallel._array_backend(),
             task_name="Reprojection",
         )
         for idx in ndindex(self.geom.shape_axes):
@@ -1211,7 +1220,7 @@ class Map(abc.ABC):
             geom, precision_factor=precision_factor, preserve_counts=preserve_counts
         )
 
-    def fill_events(self, events, weights=None):
+    def fill_events(self, events, weights=None, chunk_size=None):
         """Fill the map from an `~gammapy.data.EventList` object.
 
         Parameters
@@ -1221,8 +1230,66 @@ class Map(abc.ABC):
         weights : `~numpy.ndarray`, optional
             Weights vector. The weights vector must be of the same length
             as the events column length. If None, weights are set to 1. Default is None.
+        chunk_size : int, optional
+            If given, the events are binned in chunks of ``chunk_size`` rows, so
+            that the memory used does not depend on the number of events. Events
+            outside the non-spatial axes bounds are discarded before the sky
+            coordinates are converted. Combined with a lazy `~gammapy.data.EventList`
+            only the rows of the current chunk are read from disk.
+            Default is None, which fills all events at once.
         """
-        self.fill_by_coord(events.map_coord(self.geom), weights=weights)
+        if chunk_size is None:
+            self.fill_by_coord(events.map_coord(self.geom), weights=weights)
+            return
+
+        if self.geom.is_hpx:
+            for start in range(0, len(events), chunk_size):
+                rows = slice(start, start + chunk_size)
+                coords = events.select_row_subset(rows).map_coord(self.geom)
+                self.fill_by_coord(
+                    coords, weights=None if weights is None else weights[rows]
+                )
+            return
+
+        shape = self.data.T.shape
+        counts = np.zeros(self.data.size)
+
+        for start in range(0, len(events), chunk_size):
+            rows = slice(start, start + chunk_size)
+            coords = events.select_row_subset(rows).map_coord(self.geom)
+
+            mask = self._axes_bounds_mask(coords)
+            coords = coords.apply_mask(mask)
+
+            idx = self.geom.coord_to_idx(coords)
+            valid = np.all(np.stack([_ != INVALID_INDEX.int for _ in idx]), axis=0)
+            idx_flat = np.ravel_multi_index([_[valid] for _ in idx], shape)
+
+            chunk_weights = None
+            if weights is not None:
+                chunk_weights = weights[rows][mask][valid]
+                if isinstance(chunk_weights, u.Quantity):
+                    chunk_weights = chunk_weights.to_value(self.unit)
+
+            counts += np.bincount(
+                idx_flat, weights=chunk_weights, minlength=counts.size
+            )
+
+        self.data += counts.reshape(shape).T.astype(self.data.dtype)
+
+    def _axes_bounds_mask(self, coords):
+        """Mask of the coordinates within the bounds of the non-spatial axes."""
+        mask = np.ones(coords.shape, dtype=bool)
+
+        for axis in self.geom.axes:
+            if not isinstance(axis, MapAxis) or axis.node_type != "edges":
+                continue
+
+            values = u.Quantity(coords[axis.name], axis.unit).value
+            edges = axis.edges.to_value(axis.unit)
+            mask &= (values >= edges.min()) & (values <= edges.max())
+
+        return mask
 
     def fill_by_coord(self, coords, weights=None):
         """Fill pixels at ``coords`` with given ``weights``.
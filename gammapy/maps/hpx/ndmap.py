@@ -467,10 +467,82 @@ class HpxNDMap(HpxMap):
         else:
             self.data[..., idx] += data
 
-    def smooth(self, width, kernel="gauss"):
+    def _iter_full_sky_images(self):
+        """Iterate over image planes as full sky images in RING ordering.
+
+        Partial-sky maps are filled into a single full sky buffer, which is
+        reused for all image planes.
+
+        Yields
+        ------
+        (image, idx) : tuple
+            Full sky image as float array and index of the image plane.
+        """
+        import healpy as hp
+
+        nside = self.geom.nside.item()
+        ipix = self.geom._ipix
+
+        if not self.geom.is_allsky:
+            buffer = np.zeros(hp.nside2npix(nside))
+
+        for img, idx in self.iter_by_image_data():
+            if self.geom.is_allsky:
+                image = img.astype(float)
+            else:
+                buffer[...] = 0
+                buffer[ipix] = img
+                image = buffer
+
+            if self.geom.nest:
+                image = hp.pixelfunc.reorder(image, n2r=True)
+
+            yield image, idx
+
+    def _convolve_harmonic(self, get_window_beam, lmax, n_iter=3):
+        """Convolve image planes by multiplying their spherical harmonic coefficients.
+
+        Parameters
+        ----------
+        get_window_beam : callable
+            Function returning the window function of the kernel, up to ``lmax``,
+            for a given image plane index.
+        lmax : int
+            Maximum multipole.
+        n_iter : int, optional
+            Number of iterations of `~healpy.sphtfunc.map2alm`. Default is 3.
+
+        Returns
+        -------
+        map : `HpxNDMap`
+            Convolved map.
+        """
+        import healpy as hp
+
+        nside = self.geom.nside.item()
+        ipix = self.geom._ipix
+        convolved_data = np.empty(self.data.shape, dtype=float)
+
+        for img, idx in self._iter_full_sky_images():
+            alm = hp.sphtfunc.map2alm(img, lmax=lmax, iter=n_iter, pol=False)
+            alm = hp.sphtfunc.almxfl(alm, get_window_beam(idx), inplace=True)
+            data = hp.sphtfunc.alm2map(alm, nside=nside, lmax=lmax, pol=False)
+
+            if self.geom.nest:
+                # reorder back to nest after the convolution
+                data = hp.pixelfunc.reorder(data, r2n=True)
+
+            convolved_data[idx] = data if self.geom.is_allsky else data[ipix]
+
+        return self._init_copy(data=convolved_data)
+
+    def smooth(self, width, kernel="gauss", lmax=None, n_iter=3):
         """Smooth the map.
 
-        Iterates over 2D image planes, processing one at a time.
+        The smoothing is done natively on the sphere, by multiplying the spherical
+        harmonic coefficients of each image plane with the window function of the
+        kernel. Partial-sky maps are embedded into a full sky image, one image
+        plane at a time.
 
         Parameters
         ----------
@@ -482,6 +554,12 @@ class HpxNDMap(HpxMap):
             and the radius in case of a disk kernel.
         kernel : {'gauss', 'disk'}, optional
             Kernel shape. Default is "gauss".
+        lmax : int, optional
+            Maximum multipole of the spherical harmonic transforms. Lower values are
+            faster and sufficient for kernels much wider than the pixel size. Default
+            is None, which uses ``3 * nside - 1``.
+        n_iter : int, optional
+            Number of iterations of `~healpy.sphtfunc.map2alm`. Default is 3.
 
         Returns
         -------
@@ -494,23 +572,6 @@ class HpxNDMap(HpxMap):
             raise NotImplementedError("smooth is not supported for an irregular map.")
 
         nside = self.geom.nside.item()
-        lmax = int(3 * nside - 1)  # maximum l of the power spectrum
-        ipix = self.geom._ipix
-
-        if not self.geom.is_allsky:
-            # stack into an all sky map
-            full_sky_geom = HpxGeom.create(
-                nside=self.geom.nside,
-                nest=self.geom.nest,
-                frame=self.geom.frame,
-                axes=self.geom.axes,
-            )
-            full_sky_map = HpxNDMap.from_geom(full_sky_geom)
-
-            for img, idx in self.iter_by_image_data():
-                full_sky_map.data[idx][ipix] = img
-        else:
-            full_sky_map = self
 
         # The smoothing width is expected by healpy in radians
         if isinstance(width, (u.Quantity, str)):
@@ -521,45 +582,32 @@ class HpxNDMap(HpxMap):
             width = width * binsz
             width = np.deg2rad(width)
 
-        smoothed_data = np.empty(self.data.shape, dtype=float)
-
-        for img, idx in full_sky_map.iter_by_image_data():
-            img = img.astype(float)
-
-            if self.geom.nest:
-                # reorder to ring to do the smoothing
-                img = hp.pixelfunc.reorder(img, n2r=True)
-
-            if kernel == "gauss":
-                data = hp.sphtfunc.smoothing(img, sigma=width, pol=False, lmax=lmax)
-            elif kernel == "disk":
-                # create the step function in angular space
-                theta = np.linspace(0, width)
-                beam = np.ones(len(theta))
-                beam[theta > width] = 0
-                # convert to the spherical harmonics space
-                window_beam = hp.sphtfunc.beam2bl(beam, theta, lmax)
-                # normalize the window beam
-                window_beam = window_beam / window_beam.max()
-                data = hp.sphtfunc.smoothing(
-                    img, beam_window=window_beam, pol=False, lmax=lmax
-                )
-            else:
-                raise ValueError(f"Invalid kernel: {kernel!r}")
-
-            if self.geom.nest:
-                # reorder back to nest after the smoothing
-                data = hp.pixelfunc.reorder(data, r2n=True)
-
-            smoothed_data[idx] = data[ipix]
+        if lmax is None:
+            lmax = int(3 * nside - 1)  # maximum l of the power spectrum
+
+        if kernel == "gauss":
+            fwhm = width * np.sqrt(8 * np.log(2))
+            window_beam = hp.sphtfunc.gauss_beam(fwhm, lmax=lmax)
+        elif kernel == "disk":
+            # create the step function in angular space
+            theta = np.linspace(0, width)
+            beam = np.ones(len(theta))
+            beam[theta > width] = 0
+            # convert to the spherical harmonics space
+            window_beam = hp.sphtfunc.beam2bl(beam, theta, lmax)
+            # normalize the window beam
+            window_beam = window_beam / window_beam.max()
+        else:
+            raise ValueError(f"Invalid kernel: {kernel!r}")
 
-        return self._init_copy(data=smoothed_data)
+        return self._convolve_harmonic(lambda idx: window_beam, lmax, n_iter=n_iter)
 
     def convolve(self, kernel, convolution_method="wcs-tan", **kwargs):
         """Convolve map with a WCS kernel.
 
-        Project the map into a WCS geometry, convolve with a WCS kernel and
-        project back into the initial HEALPix geometry.
+        Either project the map into a WCS geometry, convolve with a WCS kernel and
+        project back into the initial HEALPix geometry, or convolve natively on the
+        sphere with the radial profile of the kernel.
 
         If the kernel is two-dimensional, it is applied to all image planes likewise.
         If the kernel is higher dimensional it must match the map in the number of
@@ -570,13 +618,16 @@ class HpxNDMap(HpxMap):
         kernel : `~gammapy.irf.PSFKernel`
             Convolution kernel. The pixel size must be upsampled by a factor 2 or bigger
             with respect to the input map to prevent artifacts in the projection.
-        convolution_method : {"wcs-tan", ""}
+        convolution_method : {"wcs-tan", "healpix", ""}, optional
             Convolution method. If "wcs-tan", project on WCS geometry and
             convolve with WCS kernel. See `~gammapy.maps.HpxNDMap.convolve_wcs`.
-            If "", convolve map with a symmetrical WCS kernel. See `~gammapy.maps.HpxNDMap.convolve_full`.
-            Default is "wcs-tan".
+            If "healpix" (or "" for backwards compatibility), convolve map natively with
+            a symmetrical WCS kernel, which is suited for large and all-sky maps. See
+            `~gammapy.maps.HpxNDMap.convolve_full`. Default is "wcs-tan".
         **kwargs : dict
-            Keyword arguments passed to `~gammapy.maps.WcsNDMap.convolve`.
+            Keyword arguments passed to `~gammapy.maps.WcsNDMap.convolve` for
+            "wcs-tan". For "healpix", only ``lmax`` and ``n_iter`` are passed to
+            `~gammapy.maps.HpxNDMap.convolve_full` and other arguments are ignored.
 
         Returns
         -------
@@ -585,8 +636,11 @@ class HpxNDMap(HpxMap):
         """
         if convolution_method == "wcs-tan":
             return self.convolve_wcs(kernel, **kwargs)
-        elif convolution_method == "":
-            return self.convolve_full(kernel)
+        elif convolution_method in ["healpix", ""]:
+            kwargs = {
+                key: value for key, value in kwargs.items() if key in ["lmax", "n_iter"]
+            }
+            return self.convolve_full(kernel, **kwargs)
         else:
             raise ValueError(
                 f"Not a valid method for HPX convolution: {convolution_method}"
@@ -661,12 +715,14 @@ class HpxNDMap(HpxMap):
         )
         return HpxNDMap.from_geom(target_geom, data=data)
 
-    def convolve_full(self, kernel):
+    def convolve_full(self, kernel, lmax=None, n_iter=3):
         """Convolve map with a symmetrical WCS kernel.
 
         Extract the radial profile of the kernel (assuming radial symmetry) and
-        convolve via `~healpy.sphtfunc.smoothing`. Since no projection is applied, this is
-        suited for full-sky and large maps.
+        convolve by multiplying the spherical harmonic coefficients of the map with
+        the window function of the profile. Since no projection is applied, this is
+        suited for full-sky and large maps. Partial-sky maps are embedded into a full
+        sky image, one image plane at a time.
 
         If the kernel is two-dimensional, it is applied to all image planes likewise.
         If the kernel is higher dimensional it must match the map in the number of
@@ -677,7 +733,12 @@ class HpxNDMap(HpxMap):
         kernel : `~gammapy.irf.PSFKernel`
             Convolution kernel. The pixel size must be upsampled by a factor 2 or bigger
             with respect to the input map to prevent artifacts in the projection.
-
+        lmax : int, optional
+            Maximum multipole of the spherical harmonic transforms. Lower values are
+            faster and sufficient for kernels much wider than the pixel size. Default
+            is None, which uses ``3 * nside - 1``.
+        n_iter : int, optional
+            Number of iterations of `~healpy.sphtfunc.map2alm`. Default is 3.
 
         Returns
         -------
@@ -691,25 +752,8 @@ class HpxNDMap(HpxMap):
                 "convolve_full() is not supported for an irregular map."
             )
 
-        nside = self.geom.nside.item()
-        lmax = int(3 * nside - 1)  # maximum l of the power spectrum
-        nest = self.geom.nest
-        allsky = self.geom.is_allsky
-        ipix = self.geom._ipix
-
-        if not allsky:
-            # stack into an all sky map
-            full_sky_geom = HpxGeom.create(
-                nside=self.geom.nside,
-                nest=self.geom.nest,
-                frame=self.geom.frame,
-                axes=self.geom.axes,
-            )
-            full_sky_map = HpxNDMap.from_geom(full_sky_geom)
-            for img, idx in self.iter_by_image_data():
-                full_sky_map.data[idx][ipix] = img
-        else:
-            full_sky_map = self
+        if lmax is None:
+            lmax = int(3 * self.geom.nside.item() - 1)
 
         # Get radial profile from the kernel
         psf_kernel = kernel.psf_kernel_map
@@ -728,27 +772,22 @@ class HpxNDMap(HpxMap):
         angles = coordinates.separation(psf_kernel.geom.center_skydir).rad
         values = psf_kernel.get_by_pix(pixels)
 
-        # Do the convolution in each image plane
-        convolved_data = np.empty(self.data.shape, dtype=float)
-        for img, idx in full_sky_map.iter_by_image_data():
-            img = img.astype(float)
-            if nest:
-                # reorder to ring to do the convolution
-                img = hp.pixelfunc.reorder(img, n2r=True)
+        window_beams = {}
+
+        def get_window_beam(idx):
             radial_profile = np.reshape(values[:, idx], (values.shape[0],))
-            window_beam = hp.sphtfunc.beam2bl(
-                np.flip(radial_profile), np.flip(angles), lmax
-            )
-            window_beam = window_beam / window_beam.max()
-            data = hp.sphtfunc.smoothing(
-                img, beam_window=window_beam, pol=False, lmax=lmax
-            )
-            if nest:
-                # reorder back to nest after the convolution
-                data = hp.pixelfunc.reorder(data, r2n=True)
+            key = radial_profile.tobytes()
 
-            convolved_data[idx] = data[ipix]
-        return self._init_copy(data=convolved_data)
+            # identical kernel planes share the same window function
+            if key not in window_beams:
+                window_beam = hp.sphtfunc.beam2bl(
+                    np.flip(radial_profile), np.flip(angles), lmax
+                )
+                window_beams[key] = window_beam / window_beam.max()
+
+            return window_beams[key]
+
+        return self._convolve_harmonic(get_window_beam, lmax=lmax, n_iter=n_iter)
 
     def get_by_idx(self, idx):
         # inherited docstring
@@ -8,6 +8,7 @@ from astropy.io import fits
 from regions import CircleSkyRegion
 from gammapy.maps import HpxGeom, MapAxis, MapCoord
 from gammapy.maps.hpx.utils import (
+    HpxNeighbours,
     HpxToWcsMapping,
     get_pix_size_from_nside,
     get_subpixels,
@@ -858,6 +859,37 @@ def test_hpx_geom_separation():
     assert_allclose(separation.value[0], 9.978725)
 
 
+@pytest.mark.parametrize("region", [None, "DISK(10,20,15)"])
+def test_hpx_neighbours(region):
+    import healpy as hp
+
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    geom = HpxGeom.create(nside=16, nest=True, region=region, axes=[axis])
+    neighbours = HpxNeighbours.from_geom(geom, radius="10 deg")
+
+    npix = geom.to_image().npix.item()
+    assert neighbours.npix == npix
+    assert_allclose(np.diff(neighbours.indptr).sum(), neighbours.nnz)
+
+    ipix = np.arange(npix) if geom.is_allsky else geom._ipix
+    idx = npix // 2
+    vec = hp.pix2vec(16, ipix[idx], nest=True)
+    desired = np.intersect1d(hp.query_disc(16, vec, np.radians(10), nest=True), ipix)
+
+    indices = neighbours.indices[neighbours.indptr[idx] : neighbours.indptr[idx + 1]]
+    assert indices[0] == idx
+    assert_allclose(np.sort(ipix[indices]), desired)
+    assert np.all(neighbours.separation <= np.radians(10))
+
+    # cached and shared between geometries with the same pixels
+    assert HpxNeighbours.from_geom(geom.to_image(), radius="10 deg") is neighbours
+
+    data = np.ones(geom.data_shape)
+    correlated = neighbours.correlate(data)
+    assert correlated.shape == geom.data_shape
+    assert_allclose(correlated[1, idx], len(desired))
+
+
 def test_check_nside():
     with pytest.raises(ValueError):
         HpxGeom.create(nside=3)
@@ -588,6 +588,42 @@ def test_convolve_full(region):
     assert_allclose(convolved_map.data.sum(), 14.0, rtol=2e-5)
 
 
+def test_convolve_healpix():
+    energy = MapAxis.from_bounds(1, 100, unit="TeV", nbin=2, name="energy_true")
+    geom = HpxGeom(nside=64, axes=[energy], nest=True, frame="icrs")
+
+    hpx_map = Map.from_geom(geom)
+    hpx_map.set_by_coord((0, 0, [2, 90]), 1)
+    hpx_map.set_by_coord((60, 30, [2, 90]), 1)
+
+    wcs_geom = WcsGeom.create(width=10, binsz=0.2, axes=[energy])
+    psf = PSFMap.from_gauss(energy_axis_true=energy, sigma=[1.5, 2] * u.deg)
+    kernel = psf.get_psf_kernel(geom=wcs_geom, max_radius=4 * u.deg)
+
+    # the WCS projection remains the default, it does not support all-sky maps
+    with pytest.raises(ValueError):
+        hpx_map.convolve(kernel)
+
+    # WCS convolution arguments are ignored by the native convolution
+    convolved_map = hpx_map.convolve(
+        kernel, convolution_method="healpix", method="fft", mode="same"
+    )
+    desired = hpx_map.convolve_full(kernel)
+    assert_allclose(convolved_map.data, desired.data)
+    assert_allclose(convolved_map.data.sum(axis=1), 2, rtol=1e-3)
+
+    convolved_lmax = hpx_map.convolve(kernel, convolution_method="healpix", lmax=128)
+    assert_allclose(convolved_lmax.data.sum(axis=1), 2, rtol=1e-3)
+
+    cutout = hpx_map.cutout(position=SkyCoord(60, 30, unit="deg"), width=40 * u.deg)
+    convolved_cutout = cutout.convolve(kernel, convolution_method="healpix")
+    desired = convolved_map.data[:, cutout.geom._ipix].sum(axis=1)
+    assert_allclose(convolved_cutout.data.sum(axis=1), desired, rtol=1e-3)
+
+    with pytest.raises(ValueError):
+        hpx_map.convolve(kernel, convolution_method="fft")
+
+
 def test_hpxmap_read_healpy(tmp_path):
     import healpy as hp
 
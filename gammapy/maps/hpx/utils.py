@@ -1,7 +1,12 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import hashlib
 import html
 import re
+from collections import OrderedDict
 import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.spatial import cKDTree
+from astropy.coordinates import Angle
 from astropy.utils import lazyproperty
 from gammapy.utils.array import is_power2
 from ..utils import INVALID_INDEX
@@ -12,6 +17,11 @@ HPX_ORDER_TO_PIXSIZE = np.array(
     [32.0, 16.0, 8.0, 4.0, 2.0, 1.0, 0.50, 0.25, 0.1, 0.05, 0.025, 0.01, 0.005, 0.002]
 )
 
+# Maximum number of neighbour lists kept in memory by `HpxNeighbours.from_geom`.
+NEIGHBOURS_CACHE_SIZE = 4
+
+_NEIGHBOURS_CACHE = OrderedDict()
+
 
 def unravel_hpx_index(idx, npix):
     """Convert flattened global map index to an index tuple.
@@ -480,3 +490,185 @@ class HpxToWcsMapping:
             hpx_data[hpx_slice] = wcs_data[wcs_slice]
 
         return hpx_data
+
+
+class HpxNeighbours:
+    """Neighbours within a given radius of each pixel of a HEALPix image geometry.
+
+    The neighbour lists are stored in compressed sparse row format: the neighbours
+    of the pixel ``idx`` are ``indices[indptr[idx]:indptr[idx + 1]]``, with angular
+    separations ``separation[indptr[idx]:indptr[idx + 1]]`` in radians. Indices
+    refer to the local pixel index of the geometry, i.e. to the last axis of the
+    map data. Each pixel is its own first neighbour.
+
+    Parameters
+    ----------
+    indptr : `~numpy.ndarray`
+        Index pointer of the neighbours of each pixel, of length ``npix + 1``.
+    indices : `~numpy.ndarray`
+        Local pixel indices of the neighbours.
+    separation : `~numpy.ndarray`
+        Angular separation of the neighbours in radians.
+    """
+
+    def __init__(self, indptr, indices, separation):
+        self.indptr = indptr
+        self.indices = indices
+        self.separation = separation
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(npix={self.npix}, nnz={self.nnz})"
+
+    @property
+    def npix(self):
+        """Number of pixels."""
+        return len(self.indptr) - 1
+
+    @property
+    def nnz(self):
+        """Total number of neighbours."""
+        return len(self.indices)
+
+    @staticmethod
+    def _cache_key(geom, radius):
+        if geom.is_allsky:
+            pixels_key = "allsky"
+        else:
+            data = np.ascontiguousarray(geom._ipix).tobytes()
+            pixels_key = hashlib.sha1(data).hexdigest()
+
+        return int(geom.nside.item()), bool(geom.nest), pixels_key, float(radius)
+
+    @classmethod
+    def from_geom(cls, geom, radius):
+        """Compute the neighbours of all pixels of a geometry.
+
+        The pixel centers within ``radius`` are found with a k-d tree of their unit
+        vectors. The result is cached by nside, ordering, pixels and radius, so that
+        the neighbour lists are shared between energy bins, maps and datasets with
+        the same spatial geometry.
+
+        Parameters
+        ----------
+        geom : `~gammapy.maps.HpxGeom`
+            HEALPix geometry. Only the spatial part is used.
+        radius : `~astropy.coordinates.Angle` or str
+            Radius of the disk.
+
+        Returns
+        -------
+        neighbours : `HpxNeighbours`
+            Neighbours.
+        """
+        import healpy as hp
+
+        if not geom.is_regular:
+            raise NotImplementedError(
+                "Neighbours are not supported for an irregular map."
+            )
+
+        radius = Angle(radius).rad
+        key = cls._cache_key(geom, radius)
+
+        if key in _NEIGHBOURS_CACHE:
+            _NEIGHBOURS_CACHE.move_to_end(key)
+            return _NEIGHBOURS_CACHE[key]
+
+        nside = geom.nside.item()
+
+        if geom.is_allsky:
+            ipix = np.arange(hp.nside2npix(nside))
+        else:
+            ipix = geom._ipix
+
+        vec = np.stack(hp.pix2vec(nside, ipix, nest=geom.nest), axis=-1)
+        tree = cKDTree(vec)
+
+        # k-d tree distances are chord lengths on the unit sphere
+        pairs = tree.sparse_distance_matrix(
+            tree, max_distance=2 * np.sin(radius / 2), output_type="ndarray"
+        )
+        pairs = pairs[pairs["i"] != pairs["j"]]
+
+        npix = len(ipix)
+        idx = np.concatenate([np.arange(npix), pairs["i"]])
+        indices = np.concatenate([np.arange(npix), pairs["j"]])
+        separation = np.concatenate(
+            [np.zeros(npix), 2 * np.arcsin(np.clip(pairs["v"] / 2, 0, 1))]
+        )
+
+        # stable sort keeps each pixel as its own first neighbour
+        order = np.argsort(idx, kind="stable")
+        indptr = np.zeros(npix + 1, dtype=np.int64)
+        indptr[1:] = np.cumsum(np.bincount(idx, minlength=npix))
+
+        neighbours = cls(
+            indptr=indptr, indices=indices[order], separation=separation[order]
+        )
+
+        if NEIGHBOURS_CACHE_SIZE > 0:
+            _NEIGHBOURS_CACHE[key] = neighbours
+
+            while len(_NEIGHBOURS_CACHE) > NEIGHBOURS_CACHE_SIZE:
+                _NEIGHBOURS_CACHE.popitem(last=False)
+
+        return neighbours
+
+    def to_matrix(self, values=None):
+        """Sparse matrix with the neighbour values of each pixel in its row.
+
+        Parameters
+        ----------
+        values : `~numpy.ndarray`, optional
+            Value of each neighbour, of length ``nnz``. Default is None, which
+            uses one for all neighbours.
+
+        Returns
+        -------
+        matrix : `~scipy.sparse.csr_matrix`
+            Matrix of shape ``(npix, npix)``.
+        """
+        if values is None:
+            values = np.ones(self.nnz)
+
+        return csr_matrix(
+            (values, self.indices, self.indptr), shape=(self.npix, self.npix)
+        )
+
+    def correlate(self, data, values=None):
+        """Sum the data of the neighbours of each pixel, weighted by the given values.
+
+        Parameters
+        ----------
+        data : `~numpy.ndarray`
+            Data, with the pixels along the last axis.
+        values : `~numpy.ndarray`, optional
+            Weight of each neighbour, of length ``nnz``. Default is None, which
+            uses one for all neighbours, i.e. a disk correlation.
+
+        Returns
+        -------
+        data : `~numpy.ndarray`
+            Correlated data, with the same shape as the input.
+        """
+        data = np.asarray(data, dtype=float)
+        planes = data.reshape((-1, self.npix)).T
+        correlated = self.to_matrix(values=values) @ planes
+        return correlated.T.reshape(data.shape)
+
+    def extract(self, data, idx):
+        """Data of the neighbours of a pixel.
+
+        Parameters
+        ----------
+        data : `~numpy.ndarray`
+            Data, with the pixels along the last axis.
+        idx : int
+            Local pixel index.
+
+        Returns
+        -------
+        data : `~numpy.ndarray`
+            Data of the neighbours, along the last axis.
+        """
+        return data[..., self.indices[self.indptr[idx] : self.indptr[idx + 1]]]
@@ -40,6 +40,29 @@ def test_map_fill_events_wcs(events):
     assert_allclose(m.data.sum(), 0.5)
 
 
+@pytest.mark.parametrize("chunk_size", [1, 2, 10])
+def test_map_fill_events_wcs_chunked(events, chunk_size):
+    axis = MapAxis.from_edges([9, 11, 13], name="energy", unit="TeV")
+    m = Map.create(npix=(4, 2), binsz=6, axes=[axis])
+    m.fill_events(events)
+
+    m_chunked = Map.create(npix=(4, 2), binsz=6, axes=[axis])
+    m_chunked.fill_events(events, chunk_size=chunk_size)
+    assert_allclose(m_chunked.data, m.data)
+    assert m_chunked.data.sum() == 2
+
+    weights = np.array([0.5, 1])
+    m_chunked = Map.create(npix=(4, 2), binsz=6, axes=[axis])
+    m_chunked.fill_events(events, weights=weights, chunk_size=chunk_size)
+    assert_allclose(m_chunked.data.sum(), 1.5)
+
+    # events outside the energy range are discarded
+    axis = MapAxis.from_edges([1, 11], name="energy", unit="TeV")
+    m_chunked = Map.create(npix=(4, 2), binsz=6, axes=[axis])
+    m_chunked.fill_events(events, chunk_size=chunk_size)
+    assert m_chunked.data.sum() == 1
+
+
 @requires_dependency("healpy")
 def test_map_fill_events_hpx(events):
     # 2D map
@@ -59,6 +82,10 @@ def test_map_fill_events_hpx(events):
     m.fill_events(events, weights=weights)
     assert_allclose(m.data.sum(), 1.5)
 
+    m = Map.from_geom(HpxGeom(1, axes=[axis]))
+    m.fill_events(events, weights=weights, chunk_size=1)
+    assert_allclose(m.data.sum(), 1.5)
+
 
 def test_map_fill_events_keyerror(events):
     axis = MapAxis([0, 1, 2], name="nokey")
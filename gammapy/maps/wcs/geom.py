@@ -20,6 +20,7 @@ from astropy.wcs.utils import (
 from regions import RectangleSkyRegion
 from gammapy.utils.array import round_up_to_even, round_up_to_odd
 from gammapy.utils.compat import COPY_IF_NEEDED
+from gammapy.utils.interpolation import InterpolationMatrix
 from ..axes import MapAxes
 from ..coord import MapCoord, skycoord_to_lonlat
 from ..geom import Geom, get_shape, pix_tuple_to_idx
@@ -700,6 +701,60 @@ class WcsGeom(Geom, CacheInstanceMixin):
 
         return tuple(idx_spatial) + idx_non_spatial
 
+    def interp_matrix(
+        self, coords, method="linear", fill_value=None, values_scale="lin"
+    ):
+        """Precompute the interpolation of map data at the given coordinates.
+
+        The returned `~gammapy.utils.interpolation.InterpolationMatrix` applies to
+        the data of any map with this geometry and gives the same result as
+        `~gammapy.maps.WcsNDMap.interp_by_coord`. Interpolating new data at the
+        same coordinates then only requires a sparse matrix product.
+
+        Parameters
+        ----------
+        coords : tuple, dict or `~gammapy.maps.MapCoord`
+            Coordinate arrays for each dimension of the map.
+        method : {"linear", "nearest"}
+            Method to interpolate data values. Default is "linear".
+        fill_value : None or float value
+            The value to use for points outside of the interpolation domain.
+            If None, values outside the domain are extrapolated.
+        values_scale : {"lin", "log", "sqrt"}
+            Optional value scaling. Default is "lin".
+
+        Returns
+        -------
+        interp_matrix : `~gammapy.utils.interpolation.InterpolationMatrix`
+            Interpolation matrix, to be called with the map data.
+
+        Examples
+        --------
+        >>> from gammapy.maps import Map
+        >>> m = Map.create(npix=10, binsz=0.1)
+        >>> interp = m.geom.interp_matrix({"lon": [0.05, 0.15], "lat": [0, 0]})
+        >>> values = interp(m.data)
+        """
+        if not self.is_regular:
+            raise ValueError("interp_matrix only supported for regular geom.")
+
+        pix = self.coord_to_pix(coords)
+
+        mask_outside = None
+        if fill_value is not None:
+            idxs = self.pix_to_idx(pix, clip=False)
+            invalid = np.broadcast_arrays(*[idx == -1 for idx in idxs])
+            mask_outside = np.any(invalid, axis=0)
+
+        return InterpolationMatrix.from_pix(
+            self.data_shape,
+            pix[::-1],
+            method=method,
+            values_scale=values_scale,
+            fill_value=fill_value,
+            mask_outside=mask_outside,
+        )
+
     def contains(self, coords):
         idx = self.coord_to_idx(coords)
         return np.all(np.stack([t != INVALID_INDEX.int for t in idx]), axis=0)
@@ -4,6 +4,7 @@ from itertools import repeat
 import numpy as np
 import scipy.interpolate
 import scipy.ndimage as ndi
+import scipy.fft
 import scipy.signal
 import astropy.units as u
 from astropy.convolution import Tophat2DKernel
@@ -941,6 +942,16 @@ class WcsNDMap(WcsMap):
         -------
         map : `WcsNDMap`
             Convolved map.
+
+        Notes
+        -----
+        The image planes are convolved in parallel using threads, see
+        `~gammapy.utils.parallel.multiprocessing_manager` to set the number of jobs.
+        Threads are used unless a backend other than "multiprocessing" is
+        configured, in which case that backend is used.
+        For a `~gammapy.irf.PSFKernel` and the "fft" method, all image planes are
+        transformed in a single batched FFT and the FFT of the kernel is cached on
+        the kernel, see `~gammapy.irf.PSFKernel.get_fft`.
         """
         from gammapy.irf import PSFKernel
 
@@ -951,8 +962,10 @@ class WcsNDMap(WcsMap):
                 )
 
         geom = self.geom.copy()
+        psf_kernel = None
 
         if isinstance(kernel, PSFKernel):
+            psf_kernel = kernel
             kmap = kernel.psf_kernel_map
             if not np.allclose(
                 self.geom.pixel_scales.deg, kmap.geom.pixel_scales.deg, rtol=1e-5
@@ -979,6 +992,15 @@ class WcsNDMap(WcsMap):
                     " and kernel {shape_axes_kernel}"
                 )
 
+        if psf_kernel is not None and method == "fft" and self.data.dtype.kind == "f":
+            image = self.data
+            if self.geom.is_image and kernel.ndim == 3:
+                image = image.astype(np.float32)
+
+            data = np.empty(geom.data_shape, dtype=np.float32)
+            data[...] = self._convolve_fft(image, psf_kernel, mode=mode)
+            return self._init_copy(data=data, geom=geom)
+
         if self.geom.is_image and kernel.ndim == 3:
             indexes = range(kernel.shape[0])
             images = repeat(self.data.astype(np.float32))
@@ -997,6 +1019,7 @@ class WcsNDMap(WcsMap):
                 repeat(method),
                 repeat(mode),
             ),
+            backend=parallel._array_backend(),
             task_name="Convolution",
         )
         data = np.empty(geom.data_shape, dtype=np.float32)
@@ -1004,6 +1027,30 @@ class WcsNDMap(WcsMap):
             data[idx] = convolved[idx_res]
         return self._init_copy(data=data, geom=geom)
 
+    @staticmethod
+    def _convolve_fft(image, psf_kernel, mode):
+        """Convolve all image planes with a PSF kernel in a single batched FFT.
+
+        This gives the same result as `~scipy.signal.fftconvolve` applied to each
+        image plane, but reuses the kernel FFT cached by `~gammapy.irf.PSFKernel`.
+        """
+        shape_image = np.array(image.shape[-2:])
+        shape_full = shape_image + np.array(psf_kernel.data.shape[-2:]) - 1
+        fft_shape = tuple(scipy.fft.next_fast_len(int(n), True) for n in shape_full)
+
+        workers = parallel.N_JOBS_DEFAULT
+        spectrum = scipy.fft.rfftn(image, s=fft_shape, axes=(-2, -1), workers=workers)
+        spectrum = spectrum * psf_kernel.get_fft(fft_shape)
+        result = scipy.fft.irfftn(spectrum, s=fft_shape, axes=(-2, -1), workers=workers)
+
+        if mode == "same":
+            start = (shape_full - shape_image) // 2
+            stop = start + shape_image
+        else:
+            start, stop = np.zeros(2, dtype=int), shape_full
+
+        return result[..., start[0] : stop[0], start[1] : stop[1]]
+
     @staticmethod
     def _convolve(image, kernel, method, mode):
         """Convolve using `~scipy.signal.convolve` without kwargs for parallel evaluation."""
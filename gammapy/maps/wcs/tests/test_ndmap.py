@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import pytest
 import numpy as np
+import scipy.signal
 from numpy.testing import assert_allclose, assert_equal
 import astropy.units as u
 from astropy.convolution import Box2DKernel, Gaussian2DKernel
@@ -357,6 +358,32 @@ def test_wcsndmap_interp_by_coord_fill_value():
     assert_allclose(m.interp_by_coord((99, 0)), 42)
 
 
+@pytest.mark.parametrize("method", ["linear", "nearest"])
+@pytest.mark.parametrize("values_scale", ["lin", "log"])
+@pytest.mark.parametrize("fill_value", [None, 0])
+def test_wcsgeom_interp_matrix(method, values_scale, fill_value):
+    axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=3)
+    m = Map.create(npix=(6, 5), binsz=0.1, axes=[axis])
+    m.data = np.random.RandomState(0).uniform(1, 2, m.data.shape)
+    m.data[0, 1, 1] = np.nan
+
+    coords = {
+        "lon": np.linspace(-0.4, 0.4, 7),
+        "lat": np.linspace(-0.3, 0.2, 7),
+        "energy": [[1], [3], [20]] * u.TeV,
+    }
+    kwargs = dict(method=method, values_scale=values_scale, fill_value=fill_value)
+
+    interp = m.geom.interp_matrix(coords, **kwargs)
+    assert interp.shape == (3, 7)
+
+    expected = m.interp_by_coord(coords, **kwargs)
+    assert_allclose(interp(m.data), expected, rtol=1e-6)
+
+    m.data *= 2
+    assert_allclose(interp(m.data), 2 * expected, rtol=1e-6)
+
+
 @pytest.mark.parametrize(
     ("npix", "binsz", "frame", "proj", "skydir", "axes"), wcs_test_geoms
 )
@@ -675,6 +702,36 @@ def test_convolve_nd():
     assert_allclose(values_full, values_same, rtol=1e-5)
 
 
+@pytest.mark.parametrize("mode", ["same", "full"])
+def test_convolve_psf_kernel_fft(mode):
+    energy_axis = MapAxis.from_energy_bounds(
+        "1 TeV", "10 TeV", nbin=3, name="energy_true"
+    )
+    geom = WcsGeom.create(binsz=0.05 * u.deg, width=(2, 1.5), axes=[energy_axis])
+    m = Map.from_geom(geom)
+    m.data = np.random.RandomState(0).uniform(size=m.data.shape)
+
+    psf = PSFMap.from_gauss(energy_axis, sigma=[0.1, 0.2, 0.3] * u.deg)
+    psf_kernel = psf.get_psf_kernel(geom=geom, max_radius=0.5 * u.deg)
+    kernel = psf_kernel.psf_kernel_map.data.astype(np.float32)
+
+    mc = m.convolve(psf_kernel, mode=mode)
+    for data, image, kernel_image in zip(mc.data, m.data, kernel):
+        expected = scipy.signal.fftconvolve(image, kernel_image, mode=mode)
+        assert_allclose(data, expected, rtol=1e-5, atol=1e-6)
+
+    spectrum = next(iter(psf_kernel._fft_cache.values()))
+    mc_2 = m.convolve(psf_kernel, mode=mode)
+    assert_allclose(mc_2.data, mc.data)
+    assert next(iter(psf_kernel._fft_cache.values())) is spectrum
+
+    image = m.reduce_over_axes()
+    mc = image.convolve(psf_kernel, mode=mode)
+    assert mc.data.shape[0] == 3
+    expected = scipy.signal.fftconvolve(image.data, kernel[2], mode=mode)
+    assert_allclose(mc.data[2], expected, rtol=1e-5, atol=1e-6)
+
+
 def test_convolve_pixel_scale_error():
     m = WcsNDMap.create(binsz=0.05 * u.deg, width=5 * u.deg)
     kgeom = WcsGeom.create(binsz=0.04 * u.deg, width=0.5 * u.deg)
@@ -862,9 +919,9 @@ def test_map_sampling():
     coords = nmap.sample_coord(n_events=2, random_state=0)
 
     assert len(coords["lon"]) == 2
-    assert_allclose(coords.skycoord.icrs.ra.deg, [266.204197, 266.451241], rtol=1e-5)
-    assert_allclose(coords.skycoord.icrs.dec.deg, [-28.862369, -29.075469], rtol=1e-5)
-    assert_allclose(coords["energy_true"].data, [2.363293, 2.342388], rtol=1e-5)
+    assert_allclose(coords.skycoord.icrs.ra.deg, [266.405455, 266.327612], rtol=1e-5)
+    assert_allclose(coords.skycoord.icrs.dec.deg, [-28.688931, -28.868824], rtol=1e-5)
+    assert_allclose(coords["energy_true"].data, [2.026987, 2.342388], rtol=1e-5)
 
     assert coords["lon"].unit == "deg"
     assert coords["lat"].unit == "deg"
@@ -1,9 +1,12 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import copy
 import html
 import itertools
 import logging
 import numpy as np
 from astropy.table import Table
+import gammapy.utils.parallel as parallel
+import gammapy.utils.profiling as profiling
 from gammapy.utils.pbar import progress_bar
 from gammapy.modeling.utils import _parse_datasets
 from .covariance import Covariance
@@ -66,7 +69,120 @@ class Registry:
 registry = Registry()
 
 
-class Fit:
+def _scan_branches(values, value_start):
+    """Indices of 1D scan values, in two branches walking outward from the start value."""
+    values = np.asarray(values, dtype=float)[:, 0]
+    order = np.argsort(values)
+    above = order[values[order] >= value_start]
+    below = order[values[order] < value_start][::-1]
+    return [branch for branch in [above, below] if len(branch)]
+
+
+def _seed_errors(parameters, optimize_result):
+    """Set the errors of the free parameters from the Minuit estimate of the last optimization."""
+    minuit = optimize_result.minuit
+
+    if minuit is None:
+        return
+
+    for par, error in zip(parameters.free_parameters, minuit.errors):
+        par.error = error * par.scale
+
+
+def _stat_scan_values(
+    fit, datasets, idx, values, reoptimize=False, warm_start=False, desc=None
+):
+    """Evaluate the fit statistic on a list of scan values.
+
+    Parameters
+    ----------
+    fit : `Fit`
+        Fit instance used to re-optimize.
+    datasets : `~gammapy.datasets.Datasets`
+        Datasets.
+    idx : list of int
+        Indices of the scanned parameters in ``datasets.parameters``.
+    values : list of tuple
+        Values of the scanned parameters, one tuple per scan point.
+    reoptimize : bool, optional
+        Re-optimize the other parameters at each scan point. Default is False.
+    warm_start : bool, optional
+        Walk a 1D scan outward from the current value of the scanned parameter, in
+        two branches, and start each optimization from the solution and Minuit
+        errors of the previous point. Default is False.
+    desc : str, optional
+        Description of the progress bar. Default is None.
+
+    Returns
+    -------
+    stats, fit_results : list
+        Fit statistic values and optimize results for each scan point, in the
+        order of ``values``.
+    """
+    parameters = datasets.parameters
+    scan_parameters = [parameters[_] for _ in idx]
+
+    warm_start = warm_start and reoptimize and len(scan_parameters) == 1
+
+    if warm_start:
+        branches = _scan_branches(values, scan_parameters[0].value)
+    else:
+        branches = [np.arange(len(values))]
+
+    branch_starts = {branch[0] for branch in branches[1:]}
+    order = np.concatenate(branches)
+
+    stats = [None] * len(values)
+    fit_results = [None] * len(values) if reoptimize else []
+
+    values_start = [par.value for par in parameters]
+    errors_start = [par.error for par in parameters]
+
+    with parameters.restore_status():
+        for ind in progress_bar(order, desc=desc):
+            if ind in branch_starts:
+                # the next branch starts again from the best fit
+                for par, value, error in zip(parameters, values_start, errors_start):
+                    par.value, par.error = value, error
+
+            for par, val in zip(scan_parameters, values[ind]):
+                par.value = val
+
+            if reoptimize:
+                for par in scan_parameters:
+                    par.frozen = True
+                result = fit.optimize(datasets=datasets)
+                stat = result.total_stat
+                fit_results[ind] = result
+
+                if warm_start:
+                    _seed_errors(parameters, result)
+            else:
+                stat = datasets.stat_sum()
+
+            stats[ind] = stat
+
+    if warm_start:
+        for par, error in zip(parameters, errors_start):
+            par.error = error
+
+    return stats, fit_results
+
+
+def _stat_scan_values_chunk(fit, datasets, idx, values, reoptimize, warm_start):
+    """Evaluate a chunk of scan values in a worker, see `_stat_scan_values`."""
+    stats, fit_results = _stat_scan_values(
+        fit, datasets, idx, values, reoptimize=reoptimize, warm_start=warm_start
+    )
+
+    # avoid sending the Minuit objects, which reference the datasets, back to the main process
+    for result in fit_results:
+        result._minuit = None
+
+    return stats, fit_results
+
+
+class Fit(parallel.ParallelMixin):
     """Fit class.
 
     The fit class provides a uniform interface to multiple fitting backends.
@@ -81,6 +197,9 @@ class Fit:
         see https://iminuit.readthedocs.io/en/stable/reference.html#iminuit.Minuit
         for a detailed description of the available options. If there is an entry
         'migrad_opts', those options will be passed to `iminuit.Minuit.migrad()`.
+        If the entry 'use_gradient' is True, the analytical derivatives of the
+        statistic, see `~gammapy.datasets.Datasets.stat_sum_gradient`, are passed
+        to Minuit instead of using numerical derivatives.
 
         For the `"sherpa"` backend you can from the options:
 
@@ -103,7 +222,8 @@ class Fit:
         https://docs.scipy.org/doc/scipy/reference/generated/scipy.optimize.minimize.html
 
     covariance_opts : dict
-        Covariance options passed to the given backend.
+        Covariance options passed to the given backend. For the `"minuit"` backend
+        the 'use_gradient' entry is supported as for ``optimize_opts``.
     confidence_opts : dict
         Extra arguments passed to the backend. E.g. `iminuit.Minuit.minos` supports
         a ``maxcall`` option. For the scipy backend ``confidence_opts`` are forwarded
@@ -111,6 +231,13 @@ class Fit:
         interval can be adapted by modifying the upper bound of the interval (``b``) value.
     store_trace : bool
         Whether to store the trace of the fit.
+    n_jobs : int, optional
+        Number of processes used to compute the points of `Fit.stat_profile`
+        and `Fit.stat_surface` in parallel.
+        Default is one, unless `~gammapy.utils.parallel.N_JOBS_DEFAULT` was modified.
+    parallel_backend : {'multiprocessing', 'ray', 'futures', 'threading'}, optional
+        Which backend to use for multiprocessing.
+        Default is None.
     """
 
     def __init__(
@@ -120,9 +247,13 @@ class Fit:
         covariance_opts=None,
         confidence_opts=None,
         store_trace=False,
+        n_jobs=None,
+        parallel_backend=None,
     ):
         self.store_trace = store_trace
         self.backend = backend
+        self.n_jobs = n_jobs
+        self.parallel_backend = parallel_backend
 
         if optimize_opts is None:
             optimize_opts = {"backend": backend}
@@ -180,6 +311,78 @@ class Fit:
             covariance_result=covariance_result,
         )
 
+    @staticmethod
+    def _get_gradient(datasets, use_gradient):
+        """Statistic gradient function passed to the minuit backend, if requested."""
+        if not use_gradient:
+            return None
+
+        if not datasets.has_stat_sum_gradient:
+            log.warning(
+                "Statistic gradient not available for the given datasets and models, "
+                "using numerical derivatives instead."
+            )
+            return None
+
+        return datasets.stat_sum_gradient
+
+    def _stat_scan(
+        self, datasets, scan_parameters, values, reoptimize, desc, warm_start=False
+    ):
+        """Evaluate the fit statistic on the scan values, in parallel if ``n_jobs > 1``.
+
+        The scan values are split in ``n_jobs`` contiguous chunks, each processed
+        on its own copy of the datasets. The results are returned in scan order.
+        """
+        parameters = datasets.parameters
+        idx = [parameters.index(par) for par in scan_parameters]
+        n_jobs = min(self.n_jobs, len(values))
+
+        if n_jobs <= 1:
+            return _stat_scan_values(
+                self,
+                datasets,
+                idx,
+                values,
+                reoptimize=reoptimize,
+                warm_start=warm_start,
+                desc=desc,
+            )
+
+        backend = parallel.ParallelBackendEnum.from_str(self.parallel_backend)
+
+        inputs = []
+        for chunk in np.array_split(np.arange(len(values)), n_jobs):
+            fit = copy.copy(self)
+            fit._minuit = None
+
+            # process based backends copy the datasets when pickling the inputs
+            datasets_chunk = datasets
+            if backend == parallel.ParallelBackendEnum.threading:
+                datasets_chunk = datasets.copy()
+
+            values_chunk = [values[_] for _ in chunk]
+            inputs.append(
+                (fit, datasets_chunk, idx, values_chunk, reoptimize, warm_start)
+            )
+
+        results = parallel.run_multiprocessing(
+            _stat_scan_values_chunk,
+            inputs,
+            backend=self.parallel_backend,
+            pool_kwargs=dict(processes=n_jobs),
+            method="starmap",
+            task_name=desc,
+        )
+
+        stats, fit_results = [], []
+
+        for chunk_stats, chunk_fit_results in results:
+            stats.extend(chunk_stats)
+            fit_results.extend(chunk_fit_results)
+
+        return stats, fit_results
+
     def optimize(self, datasets):
         """Run the optimization.
 
@@ -204,16 +407,21 @@ class Fit:
         kwargs = self.optimize_opts.copy()
         backend = kwargs.pop("backend", self.backend)
 
+        if backend == "minuit":
+            use_gradient = kwargs.pop("use_gradient", False)
+            kwargs["gradient"] = self._get_gradient(datasets, use_gradient)
+
         compute = registry.get("optimize", backend)
         # TODO: change this calling interface!
         # probably should pass a fit statistic, which has a model, which has parameters
         # and return something simpler, not a tuple of three things
-        factors, info, optimizer = compute(
-            parameters=parameters,
-            function=datasets.stat_sum,
-            store_trace=self.store_trace,
-            **kwargs,
-        )
+        with profiling.stage("Fit.optimize"):
+            factors, info, optimizer = compute(
+                parameters=parameters,
+                function=datasets.stat_sum,
+                store_trace=self.store_trace,
+                **kwargs,
+            )
 
         if backend == "minuit":
             self._minuit = optimizer
@@ -273,15 +481,20 @@ class Fit:
         backend = kwargs.pop("backend", self.backend)
         compute = registry.get("covariance", backend)
 
+        if backend == "minuit":
+            use_gradient = kwargs.pop("use_gradient", False)
+            kwargs["gradient"] = self._get_gradient(datasets, use_gradient)
+
         with unique_pars.restore_status():
             if self.backend == "minuit":
                 method = "hesse"
             else:
                 method = ""
 
-            factor_matrix, info = compute(
-                parameters=unique_pars, function=datasets.stat_sum, **kwargs
-            )
+            with profiling.stage("Fit.covariance"):
+                factor_matrix, info = compute(
+                    parameters=unique_pars, function=datasets.stat_sum, **kwargs
+                )
 
             matrix = Covariance.from_factor_matrix(
                 parameters=parameters, matrix=factor_matrix
@@ -348,7 +561,7 @@ class Fit:
         result["errn"] *= parameter.scale
         return result
 
-    def stat_profile(self, datasets, parameter, reoptimize=False):
+    def stat_profile(self, datasets, parameter, reoptimize=False, warm_start=False):
         """Compute fit statistic profile.
 
         The method used is to vary one parameter, keeping all others fixed.
@@ -358,6 +571,16 @@ class Fit:
         -----
         The progress bar can be displayed for this function.
 
+        If ``n_jobs > 1``, the scan values are distributed to ``n_jobs`` workers, each
+        working on its own copy of the datasets. In that case the ``minuit`` attribute
+        of the fit results is None.
+
+        With ``warm_start=True`` the scan walks outward from the current value of the
+        parameter, usually the best fit, first towards larger and then towards smaller
+        values. Each optimization starts from the solution of the neighbouring scan
+        point and uses its Minuit errors as initial step sizes, which reduces the number
+        of function evaluations. With ``n_jobs > 1`` this applies within each chunk.
+
         Parameters
         ----------
         datasets : `Datasets` or list of `Dataset`
@@ -367,6 +590,10 @@ class Fit:
             and number of values is taken from the parameter object.
         reoptimize : bool, optional
             Re-optimize other parameters, when computing the confidence region. Default is False.
+        warm_start : bool, optional
+            Start each re-optimization from the solution of the neighbouring scan point,
+            walking outward from the current parameter value. Only used if ``reoptimize``
+            is True. Default is False.
 
         Returns
         -------
@@ -398,19 +625,14 @@ class Fit:
         parameter = parameters[parameter]
         values = parameter.scan_values
 
-        stats = []
-        fit_results = []
-        with parameters.restore_status():
-            for value in progress_bar(values, desc="Scan values"):
-                parameter.value = value
-                if reoptimize:
-                    parameter.frozen = True
-                    result = self.optimize(datasets=datasets)
-                    stat = result.total_stat
-                    fit_results.append(result)
-                else:
-                    stat = datasets.stat_sum()
-                stats.append(stat)
+        stats, fit_results = self._stat_scan(
+            datasets=datasets,
+            scan_parameters=[parameter],
+            values=[(value,) for value in values],
+            reoptimize=reoptimize,
+            desc="Scan values",
+            warm_start=warm_start,
+        )
 
         idx = datasets.parameters.index(parameter)
         name = datasets.models.parameters_unique_names[idx]
@@ -435,6 +657,10 @@ class Fit:
         -----
         The progress bar can be displayed for this function.
 
+        If ``n_jobs > 1``, the grid points are distributed to ``n_jobs`` workers, each
+        working on its own copy of the datasets. In that case the ``minuit`` attribute
+        of the fit results is None.
+
         Parameters
         ----------
         datasets : `Datasets` or list of `Dataset`
@@ -482,24 +708,13 @@ class Fit:
         x = parameters[x]
         y = parameters[y]
 
-        stats = []
-        fit_results = []
-
-        with parameters.restore_status():
-            for x_value, y_value in progress_bar(
-                itertools.product(x.scan_values, y.scan_values), desc="Trial values"
-            ):
-                x.value, y.value = x_value, y_value
-
-                if reoptimize:
-                    x.frozen, y.frozen = True, True
-                    result = self.optimize(datasets=datasets)
-                    stat = result.total_stat
-                    fit_results.append(result)
-                else:
-                    stat = datasets.stat_sum()
-
-                stats.append(stat)
+        stats, fit_results = self._stat_scan(
+            datasets=datasets,
+            scan_parameters=[x, y],
+            values=list(itertools.product(x.scan_values, y.scan_values)),
+            reoptimize=reoptimize,
+            desc="Trial values",
+        )
 
         shape = (len(x.scan_values), len(y.scan_values))
         stats = np.array(stats).reshape(shape)
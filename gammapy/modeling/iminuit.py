@@ -30,13 +30,20 @@ class MinuitLikelihood(Likelihood):
 
         return total_stat
 
+    def grad(self, *factors):
+        self.parameters.set_parameter_factors(factors)
+        return self._gradient_factors()
+
 
-def setup_iminuit(parameters, function, store_trace=False, **kwargs):
-    minuit_func = MinuitLikelihood(function, parameters, store_trace=store_trace)
+def setup_iminuit(parameters, function, store_trace=False, gradient=None, **kwargs):
+    minuit_func = MinuitLikelihood(
+        function, parameters, store_trace=store_trace, gradient=gradient
+    )
 
     pars, errors, limits = make_minuit_par_kwargs(parameters)
 
-    minuit = Minuit(minuit_func.fcn, name=list(pars.keys()), **pars)
+    grad = minuit_func.grad if gradient is not None else None
+    minuit = Minuit(minuit_func.fcn, name=list(pars.keys()), grad=grad, **pars)
     minuit.tol = kwargs.pop("tol", 0.1)
     minuit.errordef = kwargs.pop("errordef", 1)
     minuit.print_level = kwargs.pop("print_level", 0)
@@ -51,7 +58,7 @@ def setup_iminuit(parameters, function, store_trace=False, **kwargs):
     return minuit, minuit_func
 
 
-def optimize_iminuit(parameters, function, store_trace=False, **kwargs):
+def optimize_iminuit(parameters, function, store_trace=False, gradient=None, **kwargs):
     """iminuit optimization.
 
     Parameters
@@ -62,6 +69,10 @@ def optimize_iminuit(parameters, function, store_trace=False, **kwargs):
         Likelihood function.
     store_trace : bool, optional
         Store trace of the fit. Default is False.
+    gradient : callable, optional
+        Derivatives of the likelihood function with respect to the values of
+        the free parameters, passed to `iminuit.Minuit` as ``grad``.
+        Default is None, the derivatives are then computed numerically by Minuit.
     **kwargs : dict
         Options passed to `iminuit.Minuit` constructor. If there is an entry
         'migrad_opts', those options will be passed to `iminuit.Minuit.migrad()`.
@@ -74,7 +85,11 @@ def optimize_iminuit(parameters, function, store_trace=False, **kwargs):
     migrad_opts = kwargs.pop("migrad_opts", {})
 
     minuit, minuit_func = setup_iminuit(
-        parameters=parameters, function=function, store_trace=store_trace, **kwargs
+        parameters=parameters,
+        function=function,
+        store_trace=store_trace,
+        gradient=gradient,
+        **kwargs,
     )
 
     minuit.migrad(**migrad_opts)
@@ -91,12 +106,16 @@ def optimize_iminuit(parameters, function, store_trace=False, **kwargs):
     return factors, info, optimizer
 
 
-def covariance_iminuit(parameters, function, **kwargs):
+def covariance_iminuit(parameters, function, gradient=None, **kwargs):
     minuit = kwargs.get("minuit")
 
     if minuit is None:
         minuit, _ = setup_iminuit(
-            parameters=parameters, function=function, store_trace=False, **kwargs
+            parameters=parameters,
+            function=function,
+            store_trace=False,
+            gradient=gradient,
+            **kwargs,
         )
         minuit.hesse()
 
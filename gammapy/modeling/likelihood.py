@@ -1,5 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import html
+import numpy as np
 
 __all__ = ["Likelihood"]
 
@@ -22,13 +23,19 @@ class Likelihood:
         Parameters with starting values.
     function : callable
         Likelihood function.
+    store_trace : bool
+        Store trace of the fit.
+    gradient : callable, optional
+        Derivatives of the likelihood function with respect to the values
+        of the free parameters. Default is None.
     """
 
-    def __init__(self, function, parameters, store_trace):
+    def __init__(self, function, parameters, store_trace, gradient=None):
         self.function = function
         self.parameters = parameters
         self.trace = []
         self.store_trace = store_trace
+        self.gradient = gradient
 
     def store_trace_iteration(self, total_stat):
         row = {"total_stat": total_stat}
@@ -47,6 +54,18 @@ class Likelihood:
 
         return total_stat
 
+    def grad(self, factors):
+        self.parameters.set_parameter_factors(factors)
+        return self._gradient_factors()
+
+    def _gradient_factors(self):
+        """Derivatives with respect to the factors seen by the optimiser."""
+        derivatives = [
+            par._inverse_transform_derivative(par.factor)
+            for par in self.parameters.free_parameters
+        ]
+        return self.gradient() * np.array(derivatives)
+
     def _repr_html_(self):
         try:
             return self.to_html()
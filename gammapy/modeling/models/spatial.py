@@ -1,6 +1,7 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Spatial models."""
 
+import inspect
 import logging
 import os
 
@@ -21,6 +22,7 @@ from regions import (
     RectangleSkyRegion,
 )
 from scipy.interpolate import griddata
+from scipy.ndimage import binary_dilation
 
 from gammapy.maps import HpxNDMap, Map, MapCoord, WcsGeom, WcsNDMap
 from gammapy.modeling import Parameter, Parameters
@@ -53,6 +55,20 @@ log = logging.getLogger(__name__)
 
 MAX_OVERSAMPLING = 200
 
+# Maximum number of values evaluated at once by `SpatialModel.integrate_geom_batch`
+BATCH_MAX_SIZE = 10_000_000
+
+# Relative tolerance of the adaptive integration in `SpatialModel.integrate_geom`.
+# If None, a single oversampling factor is used for all pixels.
+INTEGRATION_RTOL = None
+
+# Whether to integrate circular Gaussian and disk models in closed form on WCS
+# geometries, if the relative projection distortion over the evaluation cutout
+# is below ANALYTIC_INTEGRATION_MAX_DISTORTION. Disk edges narrower than the
+# pixels are treated as sharp.
+ANALYTIC_INTEGRATION = True
+ANALYTIC_INTEGRATION_MAX_DISTORTION = 1e-3
+
 
 def compute_sigma_eff(lon_0, lat_0, lon, lat, phi, major_axis, e):
     """Effective radius, used for the evaluation of elongated models."""
@@ -67,6 +83,21 @@ def compute_sigma_eff(lon_0, lat_0, lon, lat, phi, major_axis, e):
     return minor_axis, sigma_eff
 
 
+def _circle_quadrant_area(x, y, radius):
+    """Signed area of the circle of given radius in the rectangle (0, 0) - (x, y)."""
+    sign = np.sign(x) * np.sign(y)
+    x = np.minimum(np.abs(x), radius)
+    y = np.minimum(np.abs(y), radius)
+
+    # abscissa where the circle crosses the upper edge of the rectangle
+    x_c = np.minimum(np.sqrt(np.clip(radius**2 - y**2, 0, None)), x)
+
+    def primitive(t):
+        return 0.5 * (t * np.sqrt(radius**2 - t**2) + radius**2 * np.arcsin(t / radius))
+
+    return sign * (y * x_c + primitive(x) - primitive(x_c))
+
+
 def _validate_template_map(map_):
     """Validate template map data for NaN, negative, or zero values."""
     if (map_.data < 0).any():
@@ -92,6 +123,18 @@ def _validate_template_map(map_):
             )
 
 
+def _coords_equal(coord, other):
+    """Whether two coordinate dicts have the same names, shapes and values."""
+    if coord.keys() != other.keys():
+        return False
+
+    return all(
+        np.shape(coord[name]) == np.shape(other[name])
+        and np.array_equal(coord[name], other[name])
+        for name in coord
+    )
+
+
 def _get_template_filename(filename):
     """Handle and validate template filename."""
     if filename is not None:
@@ -230,6 +273,11 @@ class SpatialModel(ModelBase):
 
         For a RegionGeom, the model is integrated on a tangent WCS projection in the region.
 
+        If ``INTEGRATION_RTOL`` of this module is set and no oversampling factor is
+        given, the model is integrated adaptively on WCS geometries instead: the
+        oversampling factor is doubled only for the pixels whose integral changed
+        by more than the relative tolerance, see `integrate_geom_adaptive`.
+
         Parameters
         ----------
         geom : `~gammapy.maps.WcsGeom` or `~gammapy.maps.RegionGeom`
@@ -243,14 +291,457 @@ class SpatialModel(ModelBase):
         map : `~gammapy.maps.Map` or `gammapy.maps.RegionNDMap`
             Map containing the integral value in each spatial bin.
         """
+        if (
+            INTEGRATION_RTOL is not None
+            and oversampling_factor is None
+            and not geom.is_region
+            and not geom.is_hpx
+            and not self.is_energy_dependent
+        ):
+            return self.integrate_geom_adaptive(geom, rtol=INTEGRATION_RTOL)
+
+        values = self._integrate_geom(
+            geom,
+            lambda _: {"value": self.evaluate_geom(_)},
+            oversampling_factor=oversampling_factor,
+        )
+        return values["value"]
+
+    @property
+    def has_gradient(self):
+        """Whether derivatives with respect to the model parameters are available.
+
+        Not available while ``INTEGRATION_RTOL`` of this module is set, because the
+        derivatives are integrated with a fixed oversampling factor and would not
+        match the adaptively integrated model values.
+        """
+        return hasattr(self, "evaluate_gradient") and INTEGRATION_RTOL is None
+
+    def evaluate_geom_gradient(self, geom):
+        """Evaluate the derivatives with respect to the parameters on `~gammapy.maps.Geom`.
+
+        Parameters
+        ----------
+        geom : `~gammapy.maps.WcsGeom`
+            Map geometry.
+
+        Returns
+        -------
+        gradient : dict of `~astropy.units.Quantity`
+            Derivative of the model value for each parameter name.
+        """
+        coords = geom.get_coord(frame=self.frame, sparse=True)
+        kwargs = {par.name: par.quantity for par in self.parameters}
+        return self.evaluate_gradient(coords.lon, coords.lat, **kwargs)
+
+    def integrate_geom_gradient(self, geom, oversampling_factor=None):
+        """Integrate the derivatives with respect to the parameters on `~gammapy.maps.Geom`.
+
+        The same integration scheme as in `integrate_geom` is used, such that the
+        derivatives are consistent with the integrated model values.
+
+        Parameters
+        ----------
+        geom : `~gammapy.maps.WcsGeom` or `~gammapy.maps.RegionGeom`
+            The geom on which the integration is performed.
+        oversampling_factor : int or None
+            The oversampling factor to use for integration.
+            Default is None: the factor is estimated from the model minimal bin size.
+
+        Returns
+        -------
+        gradient : dict of `~gammapy.maps.Map`
+            Integrated derivative for each parameter name.
+        """
+        return self._integrate_geom(
+            geom, self.evaluate_geom_gradient, oversampling_factor=oversampling_factor
+        )
+
+    def _evaluate_subpixels(self, geom, idx_x, idx_y, factor):
+        """Mean model value on a grid of ``factor**2`` points in each of the pixels."""
+        offsets = (np.arange(factor) + 0.5) / factor - 0.5
+        x = idx_x[:, np.newaxis, np.newaxis] + offsets[np.newaxis, np.newaxis, :]
+        y = idx_y[:, np.newaxis, np.newaxis] + offsets[np.newaxis, :, np.newaxis]
+        x, y = np.broadcast_arrays(x, y)
+
+        lon, lat = geom.pix_to_coord((x, y))
+        coords = MapCoord.create({"lon": lon, "lat": lat}, frame=geom.frame)
+        coords = coords.to_frame(self.frame)
+
+        values = self(coords.lon, coords.lat)
+        return values.mean(axis=(1, 2))
+
+    def integrate_geom_adaptive(self, geom, rtol=1e-3):
+        """Integrate model on `~gammapy.maps.WcsGeom` with adaptive oversampling.
+
+        The model is first evaluated at the pixel centers. The oversampling factor
+        is then doubled, up to ``MAX_OVERSAMPLING``, only for the pixels whose
+        integral changed by more than ``rtol`` of its value since the previous
+        step, and for their neighbours. The mean pixel integral over the evaluation
+        cutout is used as lower limit of the tolerance, so that pixels in the faint
+        tails of the model are not refined. Contrary to `integrate_geom`, only the
+        pixels where the model varies quickly, e.g. the core of a small Gaussian or
+        the edge of a disk, are oversampled.
+
+        Parameters
+        ----------
+        geom : `~gammapy.maps.WcsGeom`
+            The geom on which the integration is performed.
+        rtol : float, optional
+            Relative tolerance on the pixel integrals. Default is 1e-3.
+
+        Returns
+        -------
+        map : `~gammapy.maps.Map`
+            Map containing the integral value in each spatial bin.
+        """
+        integrated_geom = self._evaluation_cutout(geom)
+
+        if integrated_geom is None:
+            return self._integrate_geom(
+                geom,
+                lambda _: {"value": self.evaluate_geom(_)},
+                oversampling_factor=1,
+            )["value"]
+
+        geom_image = integrated_geom.to_image()
+        idx_y, idx_x = [_.ravel() for _ in np.indices(geom_image.data_shape)]
+
+        values = self._evaluate_subpixels(geom_image, idx_x, idx_y, factor=1)
+        active, factor = np.arange(values.size), 1
+
+        while active.size > 0 and factor < MAX_OVERSAMPLING:
+            factor = min(2 * factor, MAX_OVERSAMPLING)
+            refined = self._evaluate_subpixels(
+                geom_image, idx_x[active], idx_y[active], factor=factor
+            )
+            error = np.abs(refined - values[active])
+            values[active] = refined
+
+            tolerance = rtol * np.maximum(np.abs(refined), np.mean(np.abs(values)))
+            is_active = np.zeros(geom_image.data_shape, dtype=bool)
+            is_active.flat[active[error > tolerance]] = True
+
+            # the samples of the neighbouring pixels may have missed a sharp feature
+            # of the model, e.g. the edge of a disk, so they are refined as well
+            if is_active.any():
+                is_active = binary_dilation(is_active, structure=np.ones((3, 3)))
+
+            active = np.flatnonzero(is_active)
+
+        values = values.reshape(geom_image.data_shape) * geom_image.solid_angle()
+        return self._stack_image(geom, integrated_geom, values)
+
+    def _evaluation_cutout(self, geom, padding=0):
+        """Cutout of the geometry within the evaluation radius, None without overlap.
+
+        The cutout is padded by the given number of pixels on each side.
+        """
+        if self.evaluation_radius is None:
+            return geom
+
+        pix_scale = np.max(geom.pixel_scales.to_value("deg"))
+        width = 2 * np.maximum(self.evaluation_radius.to_value("deg"), pix_scale)
+        width += 2 * padding * pix_scale
+
+        try:
+            return geom.cutout(self.position, width)
+        except (NoOverlapError, ValueError):
+            return None
+
+    @staticmethod
+    def _stack_image(geom, integrated_geom, values):
+        """Stack pixel integrals computed on a cutout image into a map of the geom."""
+        integrated = Map.from_geom(integrated_geom, unit=values.unit)
+        integrated += values
+
+        result = Map.from_geom(geom, unit=values.unit)
+        result.stack(integrated)
+        return result
+
+    def _analytic_pixel_edges(self, geom):
+        """Pixel edges of the evaluation cutout for closed form pixel integrals.
+
+        The pixels of the evaluation cutout are approximated by rectangles in the plane
+        tangent to the sky at the model position.
+
+        Returns the cutout geometry and the pixel edges along both axes, as offsets in
+        degrees from the model position. Returns None if the geometry is not a WCS
+        geometry, or if the projection distortion over the cutout exceeds
+        ``ANALYTIC_INTEGRATION_MAX_DISTORTION``.
+        """
+        if geom.is_region or geom.is_hpx:
+            return None
+
+        # the cutout edges are rounded to whole pixels, pad by one pixel to not
+        # truncate the model
+        integrated_geom = self._evaluation_cutout(geom, padding=1)
+
+        if integrated_geom is None:
+            return None
+
+        geom_image = integrated_geom.to_image()
+        wcs = geom_image.wcs
+
+        x_0, y_0 = self.position.to_pixel(wcs)
+        if not (np.isfinite(x_0) and np.isfinite(y_0)):
+            return None
+
+        # local pixel axes at the model position
+        steps = SkyCoord.from_pixel([x_0 + 1, x_0], [y_0, y_0 + 1], wcs=wcs)
+        center = SkyCoord.from_pixel(x_0, y_0, wcs=wcs)
+        scale_x, scale_y = center.separation(steps).deg
+        pa_x, pa_y = center.position_angle(steps).rad
+
+        solid_angle = geom_image.solid_angle().to_value("sr")
+        distortion = max(
+            np.ptp(solid_angle) / np.mean(solid_angle), np.abs(np.cos(pa_x - pa_y))
+        )
+
+        if not distortion < ANALYTIC_INTEGRATION_MAX_DISTORTION:
+            return None
+
+        ny, nx = geom_image.data_shape
+        x_edges = (np.arange(nx + 1) - 0.5 - x_0) * scale_x
+        y_edges = (np.arange(ny + 1) - 0.5 - y_0) * scale_y
+        return integrated_geom, x_edges, y_edges
+
+    def _integrate_geom_analytic(self, geom, pixel_integral, size):
+        """Integrate the model with closed form pixel integrals.
+
+        The function ``pixel_integral`` gets the pixel edges along both axes, as
+        offsets in degrees from the model position, and the size of the model in
+        degrees, and returns the fraction of the model flux in each pixel.
+
+        Returns None if the closed form integration is not applicable, see
+        `_analytic_pixel_edges`.
+        """
+        edges = self._analytic_pixel_edges(geom)
+
+        if edges is None:
+            return None
+
+        integrated_geom, x_edges, y_edges = edges
+        values = u.Quantity(pixel_integral(x_edges, y_edges, size), "")
+        return self._stack_image(geom, integrated_geom, values)
+
+    def _integrate_geom_analytic_gradient(self, geom, pixel_integral, size_name):
+        """Derivatives of `_integrate_geom_analytic` with respect to the parameters.
+
+        The closed form pixel integrals are differentiated numerically with respect
+        to the offsets of the pixel edges and to the size of the model. The position
+        derivatives are propagated to ``lon_0`` and ``lat_0`` using the local
+        Jacobian of the WCS transformation, as in
+        `PointSpatialModel.integrate_geom_gradient`.
+
+        Returns None if the closed form integration is not applicable, see
+        `_analytic_pixel_edges`.
+        """
+        edges = self._analytic_pixel_edges(geom)
+
+        if edges is None:
+            return None
+
+        integrated_geom, x_edges, y_edges = edges
+        wcs = integrated_geom.to_image().wcs
+        size = self.parameters[size_name].quantity.to_value("deg")
+
+        step = 1e-4 * size
+        lon_0, lat_0 = self.lon_0.quantity, self.lat_0.quantity
+        scale_x = np.diff(x_edges[:2])[0]
+        scale_y = np.diff(y_edges[:2])[0]
+
+        gradient = {}
+        for name, (d_lon, d_lat) in {"lon_0": (step, 0), "lat_0": (0, step)}.items():
+            d_lon, d_lat = d_lon * u.deg, d_lat * u.deg
+            upper = SkyCoord(lon_0 + d_lon, lat_0 + d_lat, frame=self.frame)
+            lower = SkyCoord(lon_0 - d_lon, lat_0 - d_lat, frame=self.frame)
+            x_upper, y_upper = upper.to_pixel(wcs)
+            x_lower, y_lower = lower.to_pixel(wcs)
+
+            # moving the model shifts the pixel edges in the opposite direction
+            dx, dy = (x_upper - x_lower) * scale_x, (y_upper - y_lower) * scale_y
+            values = pixel_integral(x_edges + dx / 2, y_edges + dy / 2, size)
+            values -= pixel_integral(x_edges - dx / 2, y_edges - dy / 2, size)
+            gradient[name] = -values / (2 * step)
+
+        values = pixel_integral(x_edges, y_edges, size + step)
+        values -= pixel_integral(x_edges, y_edges, size - step)
+        gradient[size_name] = values / (2 * step)
+
+        return {
+            name: self._stack_image(geom, integrated_geom, u.Quantity(value, "deg-1"))
+            for name, value in gradient.items()
+        }
+
+    def _oversampling_factor(self, pix_scale):
+        """Oversampling factor needed to integrate the model on pixels of given size."""
+        if self.evaluation_bin_size_min is None:
+            return 1
+
+        res_scale = self.evaluation_bin_size_min.to_value("deg")
+
+        if res_scale > 0:
+            return np.minimum(int(np.ceil(pix_scale / res_scale)), MAX_OVERSAMPLING)
+
+        return MAX_OVERSAMPLING
+
+    @classmethod
+    def _batch_type(cls, models):
+        """Common type and frame of models evaluated in a batch."""
+        if len(models) == 0:
+            raise ValueError("At least one model is required.")
+
+        types = {type(model) for model in models}
+        if len(types) > 1:
+            names = sorted(_.__name__ for _ in types)
+            raise ValueError(f"Models must be of the same type, got {names}")
+
+        model_type = types.pop()
+        if not issubclass(model_type, cls):
+            raise TypeError(f"Expected {cls.__name__}, got {model_type.__name__}")
+
+        frames = {model.frame for model in models}
+        if len(frames) > 1:
+            raise ValueError(f"Models must have the same frame, got {sorted(frames)}")
+
+        return model_type, frames.pop()
+
+    @classmethod
+    def evaluate_geom_batch(cls, models, geom):
+        """Evaluate several models of the same type on a geometry in one call.
+
+        The parameter values of the models are stacked along a new first axis and
+        the ``evaluate`` method is called once, broadcasting them against the
+        coordinates of the geometry.
+
+        Parameters
+        ----------
+        models : list of `SpatialModel`
+            Spatial models of the same type and frame.
+        geom : `~gammapy.maps.WcsGeom` or `~gammapy.maps.HpxGeom`
+            Map geometry.
+
+        Returns
+        -------
+        values : `~astropy.units.Quantity`
+            Model values, with the models along the first axis.
+        """
+        models = list(models)
+        model_type, frame = cls._batch_type(models)
+
+        evaluate = inspect.getattr_static(model_type, "evaluate", None)
+        if (
+            not isinstance(evaluate, staticmethod)
+            or model_type.evaluate_geom is not SpatialModel.evaluate_geom
+        ):
+            raise TypeError(
+                f"Batched evaluation is not supported for {model_type.__name__}"
+            )
+
+        coords = geom.get_coord(frame=frame, sparse=True)
+        lon, lat = coords.lon, coords.lat
+        shape = (len(models),) + (1,) * np.ndim(lon)
+
+        kwargs = {}
+        for name in models[0].parameters.names:
+            values = u.Quantity([model.parameters[name].quantity for model in models])
+            kwargs[name] = values.reshape(shape)
+
+        if models[0].is_energy_dependent:
+            kwargs["energy"] = coords["energy_true"]
+
+        return model_type.evaluate(lon, lat, **kwargs)
+
+    @classmethod
+    def integrate_geom_batch(
+        cls, models, geom, oversampling_factor=None, sum_models=False
+    ):
+        """Integrate several models of the same type on a geometry in one call.
+
+        The integration scheme is the same as in `integrate_geom`, using the largest
+        oversampling factor required by the models. Contrary to `integrate_geom`, the
+        models are evaluated on the whole geometry rather than on a cutout around
+        each of them. The models are processed in chunks of at most
+        ``BATCH_MAX_SIZE`` evaluated values, see `evaluate_geom_batch`.
+
+        Parameters
+        ----------
+        models : list of `SpatialModel`
+            Spatial models of the same type and frame.
+        geom : `~gammapy.maps.WcsGeom` or `~gammapy.maps.HpxGeom`
+            The geom on which the integration is performed.
+        oversampling_factor : int, optional
+            The oversampling factor to use for integration.
+            Default is None: the factor is estimated from the model minimal bin sizes.
+        sum_models : bool, optional
+            Return the sum of the integrated models as a map. Default is False.
+
+        Returns
+        -------
+        values : `~astropy.units.Quantity` or `~gammapy.maps.Map`
+            Integrated values with the models along the first axis, or the map of
+            their sum if ``sum_models`` is True.
+        """
+        models = list(models)
+        cls._batch_type(models)
+
+        if geom.is_region:
+            raise ValueError("Batched integration does not support region geometries.")
+
+        if geom.is_hpx:
+            oversampling_factor = 1
+        elif oversampling_factor is None:
+            pix_scale = np.max(geom.pixel_scales.to_value("deg"))
+            oversampling_factor = max(
+                model._oversampling_factor(pix_scale) for model in models
+            )
+
+        upsampled_geom = geom
+        if oversampling_factor > 1:
+            upsampled_geom = geom.upsample(oversampling_factor, axis_name=None)
+
+        solid_angle = geom.to_image().solid_angle()
+        n_pix = np.prod(upsampled_geom.to_image().data_shape)
+        chunk_size = max(1, BATCH_MAX_SIZE // n_pix)
+
+        total, results = 0, []
+        for idx in range(0, len(models), chunk_size):
+            values = cls.evaluate_geom_batch(
+                models[idx : idx + chunk_size], upsampled_geom
+            )
+
+            if oversampling_factor > 1:
+                # assume the upsampled solid angles are approximately factor**2 smaller
+                ny, nx = geom.to_image().data_shape
+                shape = values.shape[:-2]
+                shape += (ny, oversampling_factor, nx, oversampling_factor)
+                values = values.reshape(shape).sum(axis=(-3, -1))
+                values = values / oversampling_factor**2
+
+            values = values * solid_angle
+
+            if sum_models:
+                total = total + values.sum(axis=0)
+            else:
+                results.append(values)
+
+        if not sum_models:
+            return np.concatenate(results)
+
+        result = Map.from_geom(geom, unit=total.unit)
+        result += total
+        return result
+
+    def _integrate_geom(self, geom, evaluate_geom, oversampling_factor=None):
+        """Integrate the quantities returned by ``evaluate_geom`` on the geom."""
         wcs_geom = geom
         mask = None
 
         if geom.is_region:
             wcs_geom = geom.to_wcs_geom().to_image()
 
-        result = Map.from_geom(geom=wcs_geom)
-        integrated = Map.from_geom(wcs_geom)
+        integrated_geom = wcs_geom
 
         pix_scale = np.max(wcs_geom.pixel_scales.to_value("deg"))
         if self.evaluation_radius is not None:
@@ -258,55 +749,56 @@ class SpatialModel(ModelBase):
                 width = 2 * np.maximum(
                     self.evaluation_radius.to_value("deg"), pix_scale
                 )
-                wcs_geom_cut = wcs_geom.cutout(self.position, width)
-                integrated = Map.from_geom(wcs_geom_cut)
+                integrated_geom = wcs_geom.cutout(self.position, width)
             except (NoOverlapError, ValueError):
                 oversampling_factor = 1
 
         if oversampling_factor is None:
-            if self.evaluation_bin_size_min is not None:
-                res_scale = self.evaluation_bin_size_min.to_value("deg")
-                if res_scale > 0:
-                    oversampling_factor = np.minimum(
-                        int(np.ceil(pix_scale / res_scale)), MAX_OVERSAMPLING
-                    )
-                else:
-                    oversampling_factor = MAX_OVERSAMPLING
-            else:
-                oversampling_factor = 1
+            oversampling_factor = self._oversampling_factor(pix_scale)
 
         if oversampling_factor > 1:
-            upsampled_geom = integrated.geom.upsample(
+            upsampled_geom = integrated_geom.upsample(
                 oversampling_factor, axis_name=None
             )
-            # assume the upsampled solid angles are approximately factor**2 smaller
-            values = self.evaluate_geom(upsampled_geom) / oversampling_factor**2
-            upsampled = Map.from_geom(upsampled_geom, unit=values.unit)
-            upsampled += values
 
             if geom.is_region:
                 mask = geom.contains(upsampled_geom.get_coord()).astype("int")
 
-            integrated.quantity = upsampled.downsample(
-                oversampling_factor, preserve_counts=True, weights=mask
-            ).quantity
-
-            # Finally stack result
-            result._unit = integrated.unit
-            result.stack(integrated)
+            evaluated = evaluate_geom(upsampled_geom)
         else:
-            values = self.evaluate_geom(wcs_geom)
-            result._unit = values.unit
-            result += values
+            evaluated = evaluate_geom(wcs_geom)
+
+        results = {}
+        for name, values in evaluated.items():
+            result = Map.from_geom(geom=wcs_geom)
+
+            if oversampling_factor > 1:
+                # assume the upsampled solid angles are approximately factor**2 smaller
+                values = values / oversampling_factor**2
+                upsampled = Map.from_geom(upsampled_geom, unit=values.unit)
+                upsampled += values
+
+                integrated = Map.from_geom(integrated_geom)
+                integrated.quantity = upsampled.downsample(
+                    oversampling_factor, preserve_counts=True, weights=mask
+                ).quantity
+
+                # Finally stack result
+                result._unit = integrated.unit
+                result.stack(integrated)
+            else:
+                result._unit = values.unit
+                result += values
 
-        result *= result.geom.solid_angle()
+            result *= result.geom.solid_angle()
 
-        if geom.is_region:
-            mask = result.geom.region_mask([geom.region])
-            result = Map.from_geom(
-                geom, data=np.sum(result.data[mask]), unit=result.unit
-            )
-        return result
+            if geom.is_region:
+                mask_region = result.geom.region_mask([geom.region])
+                result = Map.from_geom(
+                    geom, data=np.sum(result.data[mask_region]), unit=result.unit
+                )
+            results[name] = result
+        return results
 
     def to_dict(self, full_output=False):
         """Create dictionary for YAML serilisation."""
@@ -630,6 +1122,128 @@ class PointSpatialModel(SpatialModel):
             data = self._grid_weights(x, y, x0, y0)
         return Map.from_geom(geom=geom_image, data=data, unit="")
 
+    @classmethod
+    def evaluate_geom_batch(cls, models, geom):
+        """Evaluate several point sources on a geometry in one call.
+
+        See `SpatialModel.evaluate_geom_batch`.
+        """
+        values = cls.integrate_geom_batch(models, geom)
+        return values / geom.to_image().solid_angle()
+
+    @classmethod
+    def integrate_geom_batch(
+        cls, models, geom, oversampling_factor=None, sum_models=False
+    ):
+        """Integrate several point sources on a geometry in one call.
+
+        The weights of the four pixels around each source, see `integrate_geom`, are
+        computed for all sources at once. See `SpatialModel.integrate_geom_batch`.
+
+        Parameters
+        ----------
+        models : list of `PointSpatialModel`
+            Point sources with the same frame.
+        geom : `~gammapy.maps.WcsGeom` or `~gammapy.maps.HpxGeom`
+            Map geometry.
+        oversampling_factor : None
+            Not used for point sources.
+        sum_models : bool, optional
+            Return the sum of the integrated models as a map. Default is False.
+
+        Returns
+        -------
+        values : `~astropy.units.Quantity` or `~gammapy.maps.Map`
+            Integrated values with the models along the first axis, or the map of
+            their sum if ``sum_models`` is True.
+        """
+        models = list(models)
+        _, frame = cls._batch_type(models)
+        geom_image = geom.to_image()
+
+        if geom.is_hpx:
+            data = np.array([model.integrate_geom(geom).data for model in models])
+        else:
+            lon = u.Quantity([model.lon_0.quantity for model in models])
+            lat = u.Quantity([model.lat_0.quantity for model in models])
+            x0, y0 = SkyCoord(lon, lat, frame=frame).to_pixel(geom.wcs)
+
+            ny, nx = geom_image.data_shape
+            data = np.zeros((len(models), ny, nx))
+            idx_model = np.arange(len(models))
+            valid = np.isfinite(x0) & np.isfinite(y0)
+            x_floor = np.floor(np.where(valid, x0, -2)).astype(int)
+            y_floor = np.floor(np.where(valid, y0, -2)).astype(int)
+
+            for dx, dy in [(0, 0), (1, 0), (0, 1), (1, 1)]:
+                x, y = x_floor + dx, y_floor + dy
+                weights = cls._grid_weights(x, y, x0, y0)
+                inside = valid & (x >= 0) & (x < nx) & (y >= 0) & (y < ny)
+                np.add.at(
+                    data,
+                    (idx_model[inside], y[inside], x[inside]),
+                    weights[inside],
+                )
+
+        if sum_models:
+            return Map.from_geom(geom=geom_image, data=data.sum(axis=0), unit="")
+
+        return u.Quantity(data, "")
+
+    @property
+    def has_gradient(self):
+        """Whether derivatives with respect to the model parameters are available."""
+        return True
+
+    def integrate_geom_gradient(self, geom, oversampling_factor=None):
+        """Derivatives of the integrated model with respect to the position.
+
+        The derivatives of the pixel weights used in `integrate_geom` are
+        computed with respect to the pixel position of the source, which is
+        then propagated to ``lon_0`` and ``lat_0`` using the local Jacobian
+        of the WCS transformation.
+
+        Parameters
+        ----------
+        geom : `Geom`
+            Map geometry.
+
+        Returns
+        -------
+        gradient : dict of `Map`
+            Derivative of the integrated model for each parameter name.
+        """
+        if geom.is_hpx:
+            raise NotImplementedError(
+                "Point source gradient is not supported for HEALPix geometries."
+            )
+
+        geom_image = geom.to_image()
+        x, y = geom_image.get_pix()
+        x0, y0 = self.position.to_pixel(geom.wcs)
+
+        dx, dy = x - x0, y - y0
+        weights_x = np.where(np.abs(dx) < 1, 1 - np.abs(dx), 0)
+        weights_y = np.where(np.abs(dy) < 1, 1 - np.abs(dy), 0)
+        d_weights_x = np.where(np.abs(dx) < 1, np.sign(dx), 0)
+        d_weights_y = np.where(np.abs(dy) < 1, np.sign(dy), 0)
+
+        step = 1e-4 * u.deg
+        lon_0, lat_0 = self.lon_0.quantity, self.lat_0.quantity
+        offsets = {"lon_0": (step, 0 * u.deg), "lat_0": (0 * u.deg, step)}
+
+        gradient = {}
+        for name, (d_lon, d_lat) in offsets.items():
+            upper = SkyCoord(lon_0 + d_lon, lat_0 + d_lat, frame=self.frame)
+            lower = SkyCoord(lon_0 - d_lon, lat_0 - d_lat, frame=self.frame)
+            x_upper, y_upper = upper.to_pixel(geom.wcs)
+            x_lower, y_lower = lower.to_pixel(geom.wcs)
+            dx0 = (x_upper - x_lower) / (2 * step.value)
+            dy0 = (y_upper - y_lower) / (2 * step.value)
+            data = d_weights_x * dx0 * weights_y + weights_x * d_weights_y * dy0
+            gradient[name] = Map.from_geom(geom=geom_image, data=data, unit="deg-1")
+        return gradient
+
     def to_region(self, **kwargs):
         """Model outline as a `~regions.PointSkyRegion`."""
         kwargs.pop("size_factor", None)
@@ -687,19 +1301,141 @@ class GaussianSpatialModel(SpatialModel):
         sep = angular_separation(lon, lat, lon_0, lat_0)
         phi = wrap_at(phi, 0 * u.deg, 180 * u.deg)
 
-        if e == 0:
-            a = 1.0 - np.cos(sigma)
-            norm = (1 / (4 * np.pi * a * (1.0 - np.exp(-1.0 / a)))).value
+        a = 1.0 - np.cos(sigma)
+        norm_circular = (1 / (4 * np.pi * a * (1.0 - np.exp(-1.0 / a)))).value
+
+        if np.all(e == 0):
+            norm = norm_circular
         else:
             minor_axis, sigma_eff = compute_sigma_eff(
                 lon_0, lat_0, lon, lat, phi, sigma, e
             )
             a = 1.0 - np.cos(sigma_eff)
             norm = (1 / (2 * np.pi * sigma * minor_axis)).to_value("sr-1")
+            # parameter arrays of batched evaluations can mix circular models in
+            norm = np.where(e == 0, norm_circular, norm)
 
         exponent = -0.5 * ((1 - np.cos(sep)) / a)
         return u.Quantity(norm * np.exp(exponent).value, "sr-1", copy=COPY_IF_NEEDED)
 
+    def integrate_geom(self, geom, oversampling_factor=None):
+        """Integrate model on `~gammapy.maps.Geom` or `~gammapy.maps.RegionGeom`.
+
+        If ``ANALYTIC_INTEGRATION`` of this module is set and no oversampling factor
+        is given, circular models are integrated on WCS geometries with negligible
+        projection distortion as products of error functions along the pixel axes.
+        Otherwise the integration of `SpatialModel.integrate_geom` is used.
+
+        Parameters
+        ----------
+        geom : `~gammapy.maps.WcsGeom` or `~gammapy.maps.RegionGeom`
+            The geom on which the integration is performed.
+        oversampling_factor : int or None
+            The oversampling factor to use for integration.
+            Default is None: the factor is estimated from the model minimal bin size.
+
+        Returns
+        -------
+        map : `~gammapy.maps.Map` or `gammapy.maps.RegionNDMap`
+            Map containing the integral value in each spatial bin.
+        """
+        if self._is_circle(oversampling_factor):
+            sigma = self.sigma.quantity.to_value("deg")
+            result = self._integrate_geom_analytic(geom, self._pixel_integral, sigma)
+            if result is not None:
+                return result
+
+        return super().integrate_geom(geom, oversampling_factor=oversampling_factor)
+
+    def integrate_geom_gradient(self, geom, oversampling_factor=None):
+        """Integrate the derivatives with respect to the parameters on a geometry.
+
+        If the model is integrated in closed form by `integrate_geom`, the derivatives
+        of the closed form pixel integrals are returned. Otherwise the derivatives are
+        integrated as in `SpatialModel.integrate_geom_gradient`.
+
+        Parameters
+        ----------
+        geom : `~gammapy.maps.WcsGeom` or `~gammapy.maps.RegionGeom`
+            The geom on which the integration is performed.
+        oversampling_factor : int or None
+            The oversampling factor to use for integration.
+            Default is None: the factor is estimated from the model minimal bin size.
+
+        Returns
+        -------
+        gradient : dict of `~gammapy.maps.Map`
+            Integrated derivative for each parameter name.
+        """
+        if self._is_circle(oversampling_factor):
+            result = self._integrate_geom_analytic_gradient(
+                geom, self._pixel_integral, "sigma"
+            )
+            if result is not None:
+                return result
+
+        return super().integrate_geom_gradient(
+            geom, oversampling_factor=oversampling_factor
+        )
+
+    def _is_circle(self, oversampling_factor):
+        """Whether the closed form pixel integrals can be used."""
+        return (
+            ANALYTIC_INTEGRATION
+            and INTEGRATION_RTOL is None
+            and oversampling_factor is None
+            and self.e.value == 0
+        )
+
+    @staticmethod
+    def _pixel_integral(x_edges, y_edges, sigma):
+        """Fraction of the flux in each pixel, for pixel edges and sigma in degrees."""
+        scale = np.sqrt(2) * sigma
+        cdf_x = 0.5 * scipy.special.erf(x_edges / scale)
+        cdf_y = 0.5 * scipy.special.erf(y_edges / scale)
+        return np.diff(cdf_y)[:, np.newaxis] * np.diff(cdf_x)[np.newaxis, :]
+
+    @property
+    def has_gradient(self):
+        """Whether derivatives with respect to the model parameters are available.
+
+        Only supported for the symmetric model, with a frozen zero eccentricity,
+        and not while ``INTEGRATION_RTOL`` of this module is set.
+        """
+        return super().has_gradient and self.e.frozen and self.e.value == 0
+
+    @staticmethod
+    def evaluate_gradient(lon, lat, lon_0, lat_0, sigma, e, phi):
+        """Evaluate the derivatives of the symmetric model with respect to the parameters."""
+        value = GaussianSpatialModel.evaluate(lon, lat, lon_0, lat_0, sigma, e, phi)
+        value = value.to_value("sr-1")
+
+        lon = u.Quantity(lon, "deg").to_value("rad")
+        lat = u.Quantity(lat, "deg").to_value("rad")
+        lon_0, lat_0 = lon_0.to_value("rad"), lat_0.to_value("rad")
+        sigma = sigma.to_value("rad")
+
+        sep = angular_separation(lon, lat, lon_0, lat_0)
+        one_minus_cos_sep = 2 * np.sin(sep / 2) ** 2
+
+        a = 1.0 - np.cos(sigma)
+        exp_a = np.exp(-1.0 / a)
+
+        # derivatives of cos(sep) with respect to the position
+        d_lon_0 = np.cos(lat) * np.cos(lat_0) * np.sin(lon - lon_0)
+        d_lat_0 = np.sin(lat) * np.cos(lat_0) - np.cos(lat) * np.sin(lat_0) * np.cos(
+            lon - lon_0
+        )
+        d_a = one_minus_cos_sep / (2 * a**2) - 1 / a + exp_a / (a**2 * (1 - exp_a))
+
+        unit = "sr-1 rad-1"
+        return {
+            "lon_0": u.Quantity(value * d_lon_0 / (2 * a), unit),
+            "lat_0": u.Quantity(value * d_lat_0 / (2 * a), unit),
+            "sigma": u.Quantity(value * np.sin(sigma) * d_a, unit),
+            "phi": u.Quantity(np.zeros_like(value), unit),
+        }
+
     def to_region(self, size_factor=1.0, **kwargs):
         r"""Model outline at a given number of :math:`\sigma`.
 
@@ -951,6 +1687,15 @@ class DiskSpatialModel(SpatialModel):
     @staticmethod
     def _evaluate_norm_factor(r_0, e):
         """Compute the normalization factor."""
+        if np.ndim(r_0) > 0 or np.ndim(e) > 0:
+            # parameter arrays of batched evaluations, one integral per model
+            r_0, e = np.broadcast_arrays(r_0, e, subok=True)
+            values = [
+                DiskSpatialModel._evaluate_norm_factor(*args)
+                for args in zip(r_0.flat, e.flat)
+            ]
+            return np.reshape(values, r_0.shape)
+
         semi_minor = r_0 * np.sqrt(1 - e**2)
 
         def integral_fcn(x, a, b):
@@ -980,7 +1725,7 @@ class DiskSpatialModel(SpatialModel):
         sep = angular_separation(lon, lat, lon_0, lat_0)
         phi = wrap_at(phi, 0 * u.deg, 180 * u.deg)
 
-        if e == 0:
+        if np.all(e == 0):
             sigma_eff = r_0
         else:
             sigma_eff = compute_sigma_eff(lon_0, lat_0, lon, lat, phi, r_0, e)[1]
@@ -992,6 +1737,147 @@ class DiskSpatialModel(SpatialModel):
         )
         return u.Quantity(norm * in_ellipse, "sr-1", copy=COPY_IF_NEEDED)
 
+    def integrate_geom(self, geom, oversampling_factor=None):
+        """Integrate model on `~gammapy.maps.Geom` or `~gammapy.maps.RegionGeom`.
+
+        If ``ANALYTIC_INTEGRATION`` of this module is set and no oversampling factor
+        is given, circular disks are integrated on WCS geometries with negligible
+        projection distortion using the exact overlap area of the disk with each
+        pixel. This requires an edge narrower than the pixels, which is then treated
+        as sharp. Otherwise the integration of `SpatialModel.integrate_geom` is used.
+
+        Parameters
+        ----------
+        geom : `~gammapy.maps.WcsGeom` or `~gammapy.maps.RegionGeom`
+            The geom on which the integration is performed.
+        oversampling_factor : int or None
+            The oversampling factor to use for integration.
+            Default is None: the factor is estimated from the model minimal bin size.
+
+        Returns
+        -------
+        map : `~gammapy.maps.Map` or `gammapy.maps.RegionNDMap`
+            Map containing the integral value in each spatial bin.
+        """
+        if self._is_sharp_circle(geom, oversampling_factor):
+            r_0 = self.r_0.quantity.to_value("deg")
+            result = self._integrate_geom_analytic(geom, self._pixel_integral, r_0)
+            if result is not None:
+                return result
+
+        return super().integrate_geom(geom, oversampling_factor=oversampling_factor)
+
+    def integrate_geom_gradient(self, geom, oversampling_factor=None):
+        """Integrate the derivatives with respect to the parameters on a geometry.
+
+        If the model is integrated in closed form by `integrate_geom`, the derivatives
+        of the closed form pixel integrals are returned. Otherwise the derivatives are
+        integrated as in `SpatialModel.integrate_geom_gradient`.
+
+        Parameters
+        ----------
+        geom : `~gammapy.maps.WcsGeom` or `~gammapy.maps.RegionGeom`
+            The geom on which the integration is performed.
+        oversampling_factor : int or None
+            The oversampling factor to use for integration.
+            Default is None: the factor is estimated from the model minimal bin size.
+
+        Returns
+        -------
+        gradient : dict of `~gammapy.maps.Map`
+            Integrated derivative for each parameter name.
+        """
+        if self._is_sharp_circle(geom, oversampling_factor):
+            result = self._integrate_geom_analytic_gradient(
+                geom, self._pixel_integral, "r_0"
+            )
+            if result is not None:
+                return result
+
+        return super().integrate_geom_gradient(
+            geom, oversampling_factor=oversampling_factor
+        )
+
+    def _is_sharp_circle(self, geom, oversampling_factor):
+        """Whether the closed form pixel integrals can be used on the geom."""
+        if (
+            not ANALYTIC_INTEGRATION
+            or INTEGRATION_RTOL is not None
+            or oversampling_factor is not None
+            or geom.is_region
+            or geom.is_hpx
+            or self.e.value != 0
+            or self.r_0.value <= 0
+        ):
+            return False
+
+        # an edge narrower than the pixels is not resolved and treated as sharp
+        edge_width = self.edge_width.value * self.r_0.quantity
+        return edge_width < np.min(geom.pixel_scales)
+
+    @staticmethod
+    def _pixel_integral(x_edges, y_edges, r_0):
+        """Fraction of the flux in each pixel, for pixel edges and radius in degrees."""
+        x_edges, y_edges = x_edges[np.newaxis, :], y_edges[:, np.newaxis]
+        area = _circle_quadrant_area(x_edges, y_edges, r_0)
+        area = area[1:, 1:] - area[1:, :-1] - area[:-1, 1:] + area[:-1, :-1]
+        return area / (np.pi * r_0**2)
+
+    @property
+    def has_gradient(self):
+        """Whether derivatives with respect to the model parameters are available.
+
+        Only supported for the symmetric model, with a frozen zero eccentricity
+        and a frozen non-zero edge width, and not while ``INTEGRATION_RTOL`` of this
+        module is set.
+        """
+        return (
+            super().has_gradient
+            and self.e.frozen
+            and self.e.value == 0
+            and self.edge_width.frozen
+            and self.edge_width.value > 0
+        )
+
+    @staticmethod
+    def evaluate_gradient(lon, lat, lon_0, lat_0, r_0, e, phi, edge_width):
+        """Evaluate the derivatives of the symmetric model with respect to the parameters."""
+        lon = u.Quantity(lon, "deg").to_value("rad")
+        lat = u.Quantity(lat, "deg").to_value("rad")
+        lon_0, lat_0 = lon_0.to_value("rad"), lat_0.to_value("rad")
+        r_0 = r_0.to_value("rad")
+        edge_width = u.Quantity(edge_width).to_value("")
+
+        sep = angular_separation(lon, lat, lon_0, lat_0)
+        norm = 1 / (2 * np.pi * (1 - np.cos(r_0)))
+
+        edge_width_95 = 2.326174307353347
+        scale = edge_width_95 / (r_0 * edge_width)
+        in_ellipse = 0.5 * (1 - scipy.special.erf(scale * (sep - r_0)))
+        d_edge = -np.exp(-((scale * (sep - r_0)) ** 2)) / np.sqrt(np.pi)
+
+        # derivatives of the separation with respect to the position
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d_lon_0 = -np.cos(lat) * np.cos(lat_0) * np.sin(lon - lon_0) / np.sin(sep)
+            d_lat_0 = -(
+                np.sin(lat) * np.cos(lat_0)
+                - np.cos(lat) * np.sin(lat_0) * np.cos(lon - lon_0)
+            ) / np.sin(sep)
+
+        d_lon_0 = np.where(sep > 0, d_lon_0, 0)
+        d_lat_0 = np.where(sep > 0, d_lat_0, 0)
+
+        d_norm = -norm * np.sin(r_0) / (1 - np.cos(r_0))
+        d_r_0 = d_norm * in_ellipse - norm * d_edge * scale * sep / r_0
+
+        unit = "sr-1 rad-1"
+        return {
+            "lon_0": u.Quantity(norm * d_edge * scale * d_lon_0, unit),
+            "lat_0": u.Quantity(norm * d_edge * scale * d_lat_0, unit),
+            "r_0": u.Quantity(d_r_0, unit),
+            "phi": u.Quantity(np.zeros_like(d_r_0), unit),
+        }
+
     def to_region(self, size_factor=1.0, **kwargs):
         """Model outline as a `~regions.EllipseSkyRegion`."""
         minor_axis = Angle(self.r_0.quantity * np.sqrt(1 - self.e.quantity**2))
@@ -1372,6 +2258,7 @@ class TemplateSpatialModel(SpatialModel):
             interp_kwargs.setdefault("values_scale", "log")
 
         self._interp_kwargs = interp_kwargs
+        self._interp_matrix_cache = None
         kwargs["frame"] = self.map.geom.frame
         if "lon_0" not in kwargs or (
             isinstance(kwargs["lon_0"], Parameter) and np.isnan(kwargs["lon_0"].value)
@@ -1517,10 +2404,35 @@ class TemplateSpatialModel(SpatialModel):
         if energy is not None:
             coord["energy_true"] = energy
 
-        val = self.map.interp_by_coord(coord, **self._interp_kwargs)
+        val = self._interp_by_coord(coord)
         val = np.clip(val, 0, a_max=None)
         return u.Quantity(val, self.map.unit, copy=COPY_IF_NEEDED)
 
+    def _interp_by_coord(self, coord):
+        """Interpolate the map, reusing the weights of the last coordinates.
+
+        For regular WCS maps the interpolation weights are stored as a sparse
+        matrix, see `~gammapy.maps.WcsGeom.interp_matrix`, so that evaluating the
+        model again at the same coordinates is a single sparse matrix product.
+        """
+        geom = self.map.geom
+
+        if (
+            geom.is_hpx
+            or not geom.is_regular
+            or self._interp_kwargs["method"] not in ["linear", "nearest"]
+        ):
+            return self.map.interp_by_coord(coord, **self._interp_kwargs)
+
+        cache = self._interp_matrix_cache
+
+        if cache is None or cache[0] is not geom or not _coords_equal(cache[1], coord):
+            interp = geom.interp_matrix(coord, **self._interp_kwargs)
+            coord = {name: value.copy() for name, value in coord.items()}
+            self._interp_matrix_cache = cache = (geom, coord, interp)
+
+        return cache[2](self.map.data)
+
     @property
     def position_lonlat(self):
         """Spatial model center position `(lon, lat)` in radians and frame of the model."""
@@ -370,6 +370,87 @@ class SpectralModel(ModelBase):
         else:
             return integrate_spectrum(self, energy_min, energy_max, **kwargs)
 
+    @property
+    def has_gradient(self):
+        """Whether derivatives with respect to the model parameters are available."""
+        return hasattr(self, "evaluate_gradient")
+
+    def gradient(self, energy):
+        """Evaluate the derivatives of the model with respect to its parameters.
+
+        Parameters
+        ----------
+        energy : `~astropy.units.Quantity`
+            Energy at which to evaluate.
+
+        Returns
+        -------
+        gradient : dict of `~astropy.units.Quantity`
+            Derivative of the differential flux for each parameter name.
+        """
+        kwargs = {par.name: par.quantity for par in self.parameters}
+        kwargs = self._convert_evaluate_unit(kwargs, energy)
+        return self.evaluate_gradient(energy, **kwargs)
+
+    def integral_gradient(self, energy_min, energy_max, ndecade=100):
+        r"""Derivatives of the integral with respect to the model parameters.
+
+        The analytical expression is used if the model defines
+        ``evaluate_integral_gradient``. Otherwise the log-log trapezoidal rule of
+        :func:`~gammapy.modeling.models.integrate_spectrum` is differentiated on the
+        same energy grid, so that the derivatives match the numerical integral.
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        ndecade : int, optional
+            Number of grid points per decade used for the integration.
+            Default is 100.
+
+        Returns
+        -------
+        gradient : dict of `~astropy.units.Quantity`
+            Derivative of the integral flux for each parameter name.
+        """
+        kwargs = {par.name: par.quantity for par in self.parameters}
+        kwargs = self._convert_evaluate_unit(kwargs, energy_min)
+
+        if hasattr(self, "evaluate_integral_gradient"):
+            return self.evaluate_integral_gradient(energy_min, energy_max, **kwargs)
+
+        num = np.maximum(np.max(ndecade * np.log10(energy_max / energy_min)), 2)
+        energy = np.geomspace(energy_min, energy_max, num=int(num), axis=-1)
+        dlog_energy = np.diff(np.log(energy.value), axis=-1)
+
+        # derivatives of the log-log trapezoidal rule with respect to the values
+        # at the lower and upper edge of each step
+        values = self.evaluate(energy, **kwargs) * energy
+
+        with np.errstate(invalid="ignore", divide="ignore"):
+            ratio = (values[..., 1:] / values[..., :-1]).to_value("")
+            log_ratio = np.log(ratio)
+            weight_min = (ratio - 1) / log_ratio**2 - 1 / log_ratio
+            weight_max = 1 / log_ratio - (ratio - 1) / (ratio * log_ratio**2)
+
+        # series expansion for nearly constant values, to avoid cancellation
+        is_flat = np.abs(log_ratio) < 1e-3
+        weight_min = np.where(is_flat, 0.5 + log_ratio / 6, weight_min)
+        weight_max = np.where(is_flat, 0.5 - log_ratio / 6, weight_max)
+
+        # steps with zero values do not contribute to the integral
+        is_valid = np.isfinite(log_ratio)
+        weight_min = np.where(is_valid, weight_min, 0) * dlog_energy
+        weight_max = np.where(is_valid, weight_max, 0) * dlog_energy
+
+        gradient = {}
+        for name, value in self.evaluate_gradient(energy, **kwargs).items():
+            value = value * energy
+            gradient[name] = np.sum(
+                weight_min * value[..., :-1] + weight_max * value[..., 1:], axis=-1
+            )
+        return gradient
+
     def integral_error(
         self,
         energy_min,
@@ -1036,6 +1117,18 @@ class PowerLawSpectralModel(SpectralModel):
         """Evaluate the model (static function)."""
         return amplitude * np.power((energy / reference), -index)
 
+    @staticmethod
+    def evaluate_gradient(energy, index, amplitude, reference):
+        """Evaluate the derivatives with respect to the parameters (static function)."""
+        xx = energy / reference
+        pwl = np.power(xx, -index)
+        value = amplitude * pwl
+        return {
+            "index": -value * np.log(xx),
+            "amplitude": pwl,
+            "reference": value * index / reference,
+        }
+
     @staticmethod
     def evaluate_integral(energy_min, energy_max, index, amplitude, reference):
         r"""Integrate power law analytically (static function).
@@ -1066,6 +1159,43 @@ class PowerLawSpectralModel(SpectralModel):
 
         return integral
 
+    @staticmethod
+    def evaluate_integral_gradient(energy_min, energy_max, index, amplitude, reference):
+        r"""Derivatives of the power law integral (static function).
+
+        .. math::
+            \frac{\partial F}{\partial \Gamma} = - \phi_0 E_0
+            \int_{E_{\min} / E_0}^{E_{\max} / E_0} x^{-\Gamma} \log x \, dx
+
+        Parameters
+        ----------
+        energy_min, energy_max : `~astropy.units.Quantity`
+            Lower and upper bound of integration range.
+        """
+        val = -1 * index + 1
+        log_upper = np.log(energy_max / reference)
+        log_lower = np.log(energy_min / reference)
+
+        upper = np.power((energy_max / reference), val)
+        lower = np.power((energy_min / reference), val)
+
+        integral_norm = reference * (upper - lower) / val
+        integral_log = (upper * log_upper - lower * log_lower) / val - (
+            upper - lower
+        ) / val**2
+
+        mask = np.isclose(val, 0)
+
+        if mask.any():
+            integral_norm[mask] = (reference * (log_upper - log_lower))[mask]
+            integral_log[mask] = (0.5 * (log_upper**2 - log_lower**2))[mask]
+
+        return {
+            "index": -amplitude * reference * integral_log,
+            "amplitude": integral_norm,
+            "reference": amplitude * integral_norm * index / reference,
+        }
+
     @staticmethod
     def evaluate_energy_flux(energy_min, energy_max, index, amplitude, reference):
         r"""Compute energy flux in given energy range analytically (static function).
@@ -1161,6 +1291,18 @@ class PowerLawNormSpectralModel(SpectralModel):
         """Evaluate the model (static function)."""
         return norm * np.power((energy / reference), -tilt)
 
+    @staticmethod
+    def evaluate_gradient(energy, tilt, norm, reference):
+        """Evaluate the derivatives with respect to the parameters (static function)."""
+        xx = energy / reference
+        pwl = np.power(xx, -tilt)
+        value = norm * pwl
+        return {
+            "tilt": -value * np.log(xx),
+            "norm": pwl,
+            "reference": value * tilt / reference,
+        }
+
     @staticmethod
     def evaluate_integral(energy_min, energy_max, tilt, norm, reference):
         """Evaluate powerlaw integral."""
@@ -1566,6 +1708,26 @@ class ExpCutoffPowerLawSpectralModel(SpectralModel):
 
         return pwl * cutoff
 
+    @staticmethod
+    def evaluate_gradient(energy, index, amplitude, reference, lambda_, alpha):
+        """Evaluate the derivatives with respect to the parameters (static function)."""
+        xx = energy / reference
+        shape = (energy * lambda_).to_value("")
+        pwl = np.power(xx, -index)
+        cutoff = np.exp(-np.power(shape, alpha))
+        value = amplitude * pwl * cutoff
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            d_alpha = -value * np.power(shape, alpha) * np.log(shape)
+
+        return {
+            "index": -value * np.log(xx),
+            "amplitude": pwl * cutoff,
+            "reference": value * index / reference,
+            "lambda_": -value * alpha * energy * np.power(shape, alpha - 1),
+            "alpha": d_alpha,
+        }
+
     @property
     def e_peak(self):
         r"""Spectral energy distribution peak energy (`~astropy.units.Quantity`).
@@ -1907,6 +2069,20 @@ class LogParabolaSpectralModel(SpectralModel):
         exponent = -alpha - beta * np.log(xx)
         return amplitude * np.power(xx, exponent)
 
+    @staticmethod
+    def evaluate_gradient(energy, amplitude, reference, alpha, beta):
+        """Evaluate the derivatives with respect to the parameters (static function)."""
+        xx = energy / reference
+        log_xx = np.log(xx)
+        shape = np.power(xx, -alpha - beta * log_xx)
+        value = amplitude * shape
+        return {
+            "amplitude": shape,
+            "reference": value * (alpha + 2 * beta * log_xx) / reference,
+            "alpha": -value * log_xx,
+            "beta": -value * log_xx**2,
+        }
+
     @property
     def e_peak(self):
         r"""Spectral energy distribution peak energy (`~astropy.units.Quantity`).
@@ -608,8 +608,8 @@ class TestSkyModelMapEvaluator:
         out = evaluator.compute_flux()
         out = out.quantity.to_value("cm-2 s-1")
         assert out.shape == (3, 4, 5)
-        assert_allclose(out.sum(), 2.213817e-12, rtol=1e-5)
-        assert_allclose(out[0, 0, 0], 7.938388e-14, rtol=1e-5)
+        assert_allclose(out.sum(), 2.211772e-12, rtol=1e-5)
+        assert_allclose(out[0, 0, 0], 7.927626e-14, rtol=1e-5)
 
     @staticmethod
     def test_apply_psf(evaluator):
@@ -626,8 +626,8 @@ class TestSkyModelMapEvaluator:
         npred = evaluator.apply_exposure(flux)
         out = evaluator.apply_edisp(npred)
         assert out.data.shape == (2, 4, 5)
-        assert_allclose(out.data.sum(), 5.615601e-06, rtol=1e-5)
-        assert_allclose(out.data[0, 0, 0], 1.33602e-07, rtol=1e-5)
+        assert_allclose(out.data.sum(), 5.610412e-06, rtol=1e-5)
+        assert_allclose(out.data[0, 0, 0], 1.334208e-07, rtol=1e-5)
 
     @staticmethod
     def test_compute_npred(evaluator, gti):
@@ -834,7 +834,9 @@ def test_evaluate_integrate_nd_geom():
     integral = sky_model.integrate_geom(wcs_geom).data
     assert integral.shape == (2, 3, 24, 20)
     assert_allclose(integral[0], integral[1])
-    assert_allclose(integral[0, :, 12, 10], [1.973745e-13, 9.161312e-14, 4.252304e-14])
+    assert_allclose(
+        integral[0, :, 12, 10], [1.964279e-13, 9.117378e-14, 4.231912e-14], rtol=1e-6
+    )
 
     integral = sky_model.integrate_geom(region_geom).data
 
@@ -31,6 +31,7 @@ from gammapy.modeling.models import (
     Shell2SpatialModel,
     ShellSpatialModel,
     SkyModel,
+    SpatialModel,
     TemplateNDSpatialModel,
     TemplateSpatialModel,
 )
@@ -721,6 +722,213 @@ def test_integrate_geom_energy_axis():
     assert_allclose(integral, 1, rtol=0.0001)
 
 
+@pytest.mark.parametrize(
+    "model",
+    [
+        GaussianSpatialModel(
+            lon_0="0.13 deg", lat_0="-0.07 deg", sigma="0.2 deg", frame="galactic"
+        ),
+        DiskSpatialModel(
+            lon_0="0.13 deg",
+            lat_0="-0.07 deg",
+            r_0="0.3 deg",
+            edge_width=0.2,
+            frame="galactic",
+        ),
+        PointSpatialModel(lon_0="0.13 deg", lat_0="-0.07 deg", frame="galactic"),
+    ],
+)
+def test_integrate_geom_gradient(model):
+    geom = WcsGeom.create(skydir=(0, 0), binsz=0.05, width=2, frame="galactic")
+
+    assert model.has_gradient
+    gradient = model.integrate_geom_gradient(geom, oversampling_factor=4)
+
+    # the integrated values are single precision, so the step must not be too small
+    for par in model.parameters.free_parameters:
+        value, step = par.value, 1e-4
+
+        par.value = value + step
+        upper = model.integrate_geom(geom, oversampling_factor=4).quantity
+        par.value = value - step
+        lower = model.integrate_geom(geom, oversampling_factor=4).quantity
+        par.value = value
+
+        expected = ((upper - lower) / (2 * step * par.unit)).to_value("deg-1")
+        actual = gradient[par.name].quantity.to_value("deg-1")
+        assert_allclose(actual, expected, rtol=1e-3, atol=1e-4 * np.abs(expected).max())
+
+
+def test_spatial_model_has_gradient():
+    assert not GaussianSpatialModel(e=0.5).has_gradient
+    assert not DiskSpatialModel(edge_width=0).has_gradient
+    assert not ShellSpatialModel().has_gradient
+
+
+@pytest.mark.parametrize(
+    ("model_class", "kwargs"),
+    [
+        (
+            GaussianSpatialModel,
+            [dict(sigma="0.1 deg"), dict(sigma="0.2 deg", e=0.5, phi="30 deg")],
+        ),
+        (
+            DiskSpatialModel,
+            [dict(r_0="0.2 deg"), dict(r_0="0.3 deg", e=0.4, phi="45 deg")],
+        ),
+        (
+            GeneralizedGaussianSpatialModel,
+            [dict(r_0="0.1 deg", eta=0.5), dict(r_0="0.2 deg", eta=0.3, e=0.2)],
+        ),
+        (
+            ShellSpatialModel,
+            [dict(radius="0.2 deg", width="0.05 deg"), dict(radius="0.3 deg")],
+        ),
+        (PointSpatialModel, [dict(), dict()]),
+    ],
+)
+def test_integrate_geom_batch(model_class, kwargs):
+    geom = WcsGeom.create(skydir=(0, 0), binsz=0.05, width=2, frame="galactic")
+    positions = [("0.13 deg", "-0.07 deg"), ("-0.3 deg", "0.2 deg")]
+
+    models = [
+        model_class(lon_0=lon_0, lat_0=lat_0, frame="galactic", **_)
+        for (lon_0, lat_0), _ in zip(positions, kwargs)
+    ]
+
+    values = model_class.integrate_geom_batch(models, geom, oversampling_factor=4)
+    assert values.shape == (2,) + geom.data_shape
+
+    for model, actual in zip(models, values):
+        expected = model.integrate_geom(geom, oversampling_factor=4).quantity
+        # the batched integration is not restricted to a cutout around each model
+        inside = expected > 0
+        assert_allclose(
+            actual[inside], expected[inside], rtol=1e-6, atol=1e-6 * expected.max()
+        )
+
+    values = model_class.evaluate_geom_batch(models, geom)
+    expected = models[0].evaluate_geom(geom)
+    assert_allclose(values[0], expected, rtol=1e-6, atol=1e-6 * expected.max())
+
+
+def test_integrate_geom_batch_sum():
+    energy_axis = MapAxis.from_energy_bounds("1 TeV", "10 TeV", nbin=2)
+    geom = WcsGeom.create(
+        skydir=(0, 0), binsz=0.05, width=2, frame="galactic", axes=[energy_axis]
+    )
+    models = [
+        GaussianSpatialModel(lon_0=f"{lon_0} deg", sigma="0.1 deg", frame="galactic")
+        for lon_0 in [-0.2, 0, 0.2]
+    ]
+
+    result = GaussianSpatialModel.integrate_geom_batch(
+        models, geom, oversampling_factor=4, sum_models=True
+    )
+    expected = sum(
+        model.integrate_geom(geom, oversampling_factor=4).data for model in models
+    )
+
+    assert result.geom == geom
+    assert_allclose(result.data, expected, rtol=1e-6, atol=1e-5 * expected.max())
+
+    with pytest.raises(ValueError):
+        SpatialModel.integrate_geom_batch(models + [DiskSpatialModel()], geom)
+
+    with pytest.raises(ValueError):
+        GaussianSpatialModel.integrate_geom_batch(
+            models + [GaussianSpatialModel(frame="icrs")], geom
+        )
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        GaussianSpatialModel(lon_0="0.13 deg", sigma="0.02 deg", frame="galactic"),
+        DiskSpatialModel(
+            lon_0="0.13 deg", r_0="0.2 deg", e=0.5, edge_width=0.05, frame="galactic"
+        ),
+    ],
+)
+def test_integrate_geom_adaptive(model, monkeypatch):
+    geom = WcsGeom.create(skydir=(0, 0), binsz=0.05, width=2, frame="galactic")
+
+    expected = model.integrate_geom(geom, oversampling_factor=100)
+    actual = model.integrate_geom_adaptive(geom, rtol=1e-4)
+
+    assert actual.geom == geom
+    assert_allclose(actual.data.sum(), expected.data.sum(), rtol=1e-3)
+    assert_allclose(actual.data, expected.data, atol=2e-3 * expected.data.max())
+
+    monkeypatch.setattr(
+        "gammapy.modeling.models.spatial.INTEGRATION_RTOL", 1e-4, raising=True
+    )
+    result = model.integrate_geom(geom)
+    assert_allclose(result.data, actual.data)
+
+    # the derivatives use a fixed oversampling factor
+    assert not model.has_gradient
+
+
+@pytest.mark.parametrize(
+    ("model", "atol"),
+    [
+        (GaussianSpatialModel(lon_0="0.13 deg", sigma="0.05 deg"), 1e-3),
+        (DiskSpatialModel(lon_0="0.13 deg", r_0="0.205 deg", edge_width=0), 3e-2),
+        (DiskSpatialModel(lon_0="0.13 deg", r_0="0.205 deg", edge_width=0.05), 5e-2),
+    ],
+)
+def test_integrate_geom_analytic(model, atol, monkeypatch):
+    geom = WcsGeom.create(skydir=(0, 0), binsz=0.02, width=2)
+    expected = model.integrate_geom(geom, oversampling_factor=50)
+    actual = model.integrate_geom(geom)
+
+    assert actual.geom == geom
+    assert_allclose(actual.data.sum(), 1, rtol=1e-3)
+    assert_allclose(actual.data.sum(), expected.data.sum(), rtol=1e-3)
+    assert_allclose(actual.data, expected.data, atol=atol * expected.data.max())
+
+    # the derivatives of the closed form pixel integrals
+    gradient = model.integrate_geom_gradient(geom)
+
+    for par in model.parameters.free_parameters:
+        value, step = par.value, 1e-4
+
+        par.value = value + step
+        upper = model.integrate_geom(geom).quantity
+        par.value = value - step
+        lower = model.integrate_geom(geom).quantity
+        par.value = value
+
+        expected = ((upper - lower) / (2 * step * par.unit)).to_value("deg-1")
+        actual = gradient[par.name].quantity.to_value("deg-1")
+        assert_allclose(actual, expected, rtol=1e-3, atol=1e-3 * np.abs(expected).max())
+
+    # large distortion of the all-sky projection, falls back to oversampling
+    geom = WcsGeom.create(skydir=(0, 0), binsz=0.5, width=(360, 180), proj="CAR")
+    model.lat_0.value = 80
+    assert model._analytic_pixel_edges(geom) is None
+
+    monkeypatch.setattr(
+        "gammapy.modeling.models.spatial.ANALYTIC_INTEGRATION", False, raising=True
+    )
+    geom = WcsGeom.create(skydir=(0, 0), binsz=0.02, width=2)
+    actual = model.integrate_geom(geom)
+    assert_allclose(actual.data, SpatialModel.integrate_geom(model, geom).data)
+
+
+def test_integrate_geom_analytic_edge_width():
+    geom = WcsGeom.create(skydir=(0, 0), binsz=0.02, width=2)
+
+    # edges wider than the pixels are resolved by oversampling
+    model = DiskSpatialModel(r_0="0.2 deg", edge_width=0.2)
+    assert not model._is_sharp_circle(geom, oversampling_factor=None)
+
+    model.edge_width.value = 0.01
+    assert model._is_sharp_circle(geom, oversampling_factor=None)
+    assert not model._is_sharp_circle(geom, oversampling_factor=4)
+
+
 def test_templatemap_clip():
     model_map = Map.create(map_type="wcs", width=(2, 2), binsz=0.5, unit="sr-1")
     model_map.data += 1.0
@@ -734,6 +942,28 @@ def test_templatemap_clip():
     assert_allclose(val, 0, rtol=0.0001)
 
 
+def test_templatemap_interp_matrix_cache():
+    model_map = Map.create(map_type="wcs", width=(2, 2), binsz=0.1, unit="sr-1")
+    model_map.data += np.arange(model_map.data.size).reshape(model_map.data.shape)
+    model = TemplateSpatialModel(model_map, normalize=False)
+
+    lon = np.array([0.03, 0.2, 0.35]) * u.deg
+    lat = np.array([0.01, -0.2, 0.3]) * u.deg
+
+    expected = model.map.interp_by_coord(
+        {"lon": lon.value, "lat": lat.value}, **model._interp_kwargs
+    )
+    assert_allclose(model.evaluate(lon, lat).value, expected, rtol=1e-6)
+
+    interp = model._interp_matrix_cache[2]
+    model.map.data *= 2
+    assert_allclose(model.evaluate(lon, lat).value, 2 * expected, rtol=1e-6)
+    assert model._interp_matrix_cache[2] is interp
+
+    model.evaluate(lon[:2], lat[:2])
+    assert model._interp_matrix_cache[2] is not interp
+
+
 def test_piecewise_spatial_model_gc():
     geom = WcsGeom.create(skydir=(0, 0), npix=(2, 2), binsz=0.3, frame="galactic")
     coords = MapCoord.create(geom.footprint)
@@ -1515,3 +1515,61 @@ def test_bpl_evalaute_array():
         np.ones(3) * 0.5 * u.TeV,
     )
     assert values.shape == (2, 3)
+
+
+@pytest.mark.parametrize(
+    "model",
+    [
+        PowerLawSpectralModel(
+            index=2.3, amplitude="4e-12 cm-2 s-1 TeV-1", reference="1 TeV"
+        ),
+        PowerLawSpectralModel(
+            index=1, amplitude="4e-12 cm-2 s-1 TeV-1", reference="1 TeV"
+        ),
+        PowerLawNormSpectralModel(tilt=0.2, norm=1.3, reference="1 TeV"),
+        LogParabolaSpectralModel(
+            alpha=2.3, beta=0.4, amplitude="4e-12 cm-2 s-1 TeV-1", reference="1 TeV"
+        ),
+        ExpCutoffPowerLawSpectralModel(
+            index=2.1,
+            amplitude="4e-12 cm-2 s-1 TeV-1",
+            reference="1 TeV",
+            lambda_="0.3 TeV-1",
+            alpha=1.2,
+        ),
+    ],
+)
+def test_spectral_model_gradient(model):
+    energy = [0.3, 2, 5, 20] * u.TeV
+    energy_min, energy_max = energy[:-1], energy[1:]
+
+    assert model.has_gradient
+    gradient = model.gradient(energy)
+    integral_gradient = model.integral_gradient(energy_min, energy_max)
+
+    for par in model.parameters:
+        value = par.value
+        step = 1e-6 * abs(value)
+
+        par.value = value + step
+        dnde_upper = model(energy)
+        flux_upper = model.integral(energy_min, energy_max)
+
+        par.value = value - step
+        dnde_lower = model(energy)
+        flux_lower = model.integral(energy_min, energy_max)
+
+        par.value = value
+
+        expected = (dnde_upper - dnde_lower) / (2 * step * par.unit)
+        assert_quantity_allclose(gradient[par.name], expected, rtol=1e-5)
+
+        expected = (flux_upper - flux_lower) / (2 * step * par.unit)
+        assert_quantity_allclose(integral_gradient[par.name], expected, rtol=1e-3)
+
+
+def test_spectral_model_has_gradient():
+    assert not GaussianSpectralModel().has_gradient
+
+    model = PowerLawSpectralModel() * ExpCutoffPowerLawNormSpectralModel()
+    assert not model.has_gradient
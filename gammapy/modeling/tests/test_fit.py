@@ -13,6 +13,7 @@ from gammapy.modeling.models import (
     Models,
     SkyModel,
 )
+from gammapy.utils.profiling import Profiler
 from gammapy.utils.scripts import read_yaml
 from gammapy.utils.testing import requires_data, requires_dependency
 
@@ -61,6 +62,16 @@ class MyDataset(Dataset):
         """Statistic array, one value per data point."""
 
 
+class MyDatasetGradient(MyDataset):
+    @property
+    def has_stat_sum_gradient(self):
+        return True
+
+    def stat_sum_gradient(self, parameters):
+        optimum = {"x": 2, "y": 3e2, "z": 4e-2}
+        return [2 * (par.value - optimum[par.name]) for par in parameters]
+
+
 @requires_dependency("sherpa")
 @pytest.mark.parametrize("backend", ["sherpa", "scipy"])
 def test_optimize_backend_and_covariance(backend):
@@ -130,6 +141,46 @@ def test_run(backend):
     assert_allclose(pars["z"].error, 1, rtol=1e-7)
 
 
+def test_run_profiling():
+    datasets = Datasets([MyDataset()])
+
+    with Profiler() as profiler:
+        Fit().run(datasets)
+
+    records = profiler.to_dict()
+    assert records["Fit.optimize"]["n_calls"] == 1
+    assert records["Fit.covariance"]["n_calls"] == 1
+    assert records["MyDataset.stat_sum[test]"]["n_calls"] > 10
+
+
+def test_run_gradient():
+    dataset = MyDatasetGradient()
+    fit = Fit(
+        backend="minuit",
+        optimize_opts={"use_gradient": True},
+        covariance_opts={"use_gradient": True},
+    )
+    result = fit.run([dataset])
+    pars = dataset.models.parameters
+
+    assert result.success
+    assert result.covariance_result.success
+
+    assert_allclose(pars["x"].value, 2, rtol=1e-3)
+    assert_allclose(pars["y"].value, 3e2, rtol=1e-3)
+    assert_allclose(pars["z"].value, 4e-2, rtol=1e-3)
+    assert_allclose(pars["x"].error, 1, rtol=1e-5)
+
+
+def test_run_gradient_not_available(caplog):
+    dataset = MyDataset()
+    fit = Fit(backend="minuit", optimize_opts={"use_gradient": True})
+    result = fit.run([dataset])
+
+    assert result.success
+    assert "Statistic gradient not available" in caplog.text
+
+
 def test_run_scale_transform_change_sqrt():
     dataset = MyDataset()
     fit = Fit(backend="minuit")
@@ -389,6 +440,82 @@ def test_stat_surface_reoptimize():
     )
 
 
+def test_stat_profile_reoptimize_warm_start():
+    dataset = MyDataset()
+    fit = Fit()
+    fit.run([dataset])
+
+    parameters = dataset.models.parameters
+    errors = [par.error for par in parameters]
+
+    parameters["y"].value = 0
+    parameters["x"].scan_n_values = 5
+    result = fit.stat_profile(
+        datasets=[dataset], parameter="x", reoptimize=True, warm_start=True
+    )
+
+    assert_allclose(result["test.x_scan"], [0, 1, 2, 3, 4], atol=1e-7)
+    assert_allclose(result["stat_scan"], [4, 1, 0, 1, 4], atol=1e-7)
+    assert len(result["fit_results"]) == 5
+
+    for fit_result, value in zip(result["fit_results"], result["test.x_scan"]):
+        assert_allclose(fit_result.parameters["x"].value, value, atol=1e-7)
+        assert_allclose(fit_result.parameters["y"].value, 3e2, rtol=1e-3)
+
+    assert_allclose(parameters["x"].value, 2)
+    assert_allclose(parameters["y"].value, 0)
+    assert_allclose([par.error for par in parameters], errors)
+    assert not parameters["x"].frozen
+
+
+@pytest.mark.parametrize("parallel_backend", ["threading", "multiprocessing"])
+def test_stat_profile_parallel(parallel_backend):
+    dataset = MyDataset()
+    fit = Fit(n_jobs=2, parallel_backend=parallel_backend)
+    fit.run([dataset])
+
+    dataset.models.parameters["y"].value = 0
+    dataset.models.parameters["x"].scan_n_values = 5
+    result = fit.stat_profile(datasets=[dataset], parameter="x", reoptimize=True)
+
+    assert_allclose(result["test.x_scan"], [0, 1, 2, 3, 4], atol=1e-7)
+    assert_allclose(result["stat_scan"], [4, 1, 0, 1, 4], atol=1e-7)
+    assert len(result["fit_results"]) == 5
+    assert_allclose(
+        result["fit_results"][3].total_stat, result["stat_scan"][3], atol=1e-7
+    )
+    assert result["fit_results"][3].minuit is None
+
+    # Check that original value state wasn't changed
+    assert_allclose(dataset.models.parameters["x"].value, 2)
+    assert_allclose(dataset.models.parameters["y"].value, 0)
+    assert not dataset.models.parameters["x"].frozen
+
+
+def test_stat_surface_parallel():
+    dataset = MyDataset()
+    fit = Fit(n_jobs=2, parallel_backend="threading")
+    fit.run([dataset])
+
+    x_values = [1, 2, 3]
+    y_values = [2e2, 3e2, 4e2]
+
+    dataset.models.parameters["x"].scan_values = x_values
+    dataset.models.parameters["y"].scan_values = y_values
+    result = fit.stat_surface(datasets=[dataset], x="x", y="y")
+
+    expected_stat = [
+        [1.0001e04, 1.0000e00, 1.0001e04],
+        [1.0000e04, 0.0000e00, 1.0000e04],
+        [1.0001e04, 1.0000e00, 1.0001e04],
+    ]
+    assert_allclose(list(result["stat_scan"]), expected_stat, atol=1e-7)
+    assert len(result["fit_results"]) == 0
+
+    assert_allclose(dataset.models.parameters["x"].value, 2)
+    assert_allclose(dataset.models.parameters["y"].value, 3e2)
+
+
 def test_stat_contour():
     dataset = MyDataset()
     dataset.models.parameters["x"].frozen = True
@@ -53,6 +53,27 @@ def test_iminuit_basic():
     assert_allclose(minuit.values["par_002_z"], 4, rtol=1e-3)
 
 
+def test_iminuit_gradient():
+    ds = MyDataset()
+    pars = ds.models.parameters
+
+    def gradient():
+        x, y, z = [p.value for p in pars]
+        return [
+            2 * (x - 2) / 0.2**2,
+            2 * (y - 3e5) / 3e4**2,
+            2 * (z - 4e-5) / 4e-6**2,
+        ]
+
+    factors, info, minuit = optimize_iminuit(
+        function=ds.fcn, parameters=pars, gradient=gradient
+    )
+
+    assert info["success"]
+    assert_allclose(ds.fcn(), 0, atol=1e-5)
+    assert_allclose(factors, [2, 3, 4], rtol=1e-3)
+
+
 def test_iminuit_stepsize():
     ds = MyDataset()
     pars = ds.models.parameters
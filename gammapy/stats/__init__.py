@@ -4,10 +4,12 @@
 from .counts_statistic import CashCountsStatistic, WStatCountsStatistic
 from .fit_statistics import (
     cash,
+    cash_gradient,
     cstat,
     get_wstat_gof_terms,
     get_wstat_mu_bkg,
     wstat,
+    wstat_gradient,
     Chi2FitStatistic,
     CashFitStatistic,
     Chi2AsymmetricErrorFitStatistic,
@@ -39,6 +41,7 @@ FIT_STATISTICS_REGISTRY = {
 
 __all__ = [
     "cash",
+    "cash_gradient",
     "CashCountsStatistic",
     "Chi2FitStatistic",
     "Chi2AsymmetricErrorFitStatistic",
@@ -47,6 +50,7 @@ __all__ = [
     "get_wstat_gof_terms",
     "get_wstat_mu_bkg",
     "wstat",
+    "wstat_gradient",
     "WStatCountsStatistic",
     "compute_fvar",
     "compute_fpp",
@@ -14,8 +14,10 @@ from gammapy.utils.compilation import get_fit_statistics_compiled
 
 __all__ = [
     "cash",
+    "cash_gradient",
     "cstat",
     "wstat",
+    "wstat_gradient",
     "get_wstat_mu_bkg",
     "get_wstat_gof_terms",
     "CashFitStatistic",
@@ -79,6 +81,39 @@ def cash(n_on, mu_on, truncation_value=None):
     return stat
 
 
+def cash_gradient(n_on, mu_on, truncation_value=None):
+    r"""Derivative of the Cash statistic with respect to the expected counts.
+
+    .. math::
+        \frac{\partial C}{\partial \mu_{on}} = 2 \left( 1 - \frac{n_{on}}{\mu_{on}} \right)
+
+    The derivative is zero where ``mu_on`` is truncated, consistently with `cash`.
+
+    Parameters
+    ----------
+    n_on : `~numpy.ndarray` or array_like
+        Observed counts.
+    mu_on : `~numpy.ndarray` or array_like
+        Expected counts.
+    truncation_value : `~numpy.ndarray` or array_like
+        Minimum value use for ``mu_on``. Default is 1e-25.
+
+    Returns
+    -------
+    gradient : ndarray
+        Derivative of the statistic per bin.
+    """
+    if truncation_value is None:
+        truncation_value = get_fit_statistics_compiled()["TRUNCATION_VALUE"]
+
+    n_on = np.asanyarray(n_on, dtype=np.float64)
+    mu_on = np.asanyarray(mu_on, dtype=np.float64)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        gradient = 2 * (1 - n_on / mu_on)
+    return np.where(mu_on <= truncation_value, 0, gradient)
+
+
 def cstat(n_on, mu_on, truncation_value=None):
     r"""C statistic, for Poisson data.
 
@@ -215,6 +250,46 @@ def wstat(n_on, n_off, alpha, mu_sig, mu_bkg=None, extra_terms=True):
     return stat
 
 
+def wstat_gradient(n_on, n_off, alpha, mu_sig):
+    r"""Derivative of the W statistic with respect to the signal expected counts.
+
+    The background ``mu_bkg`` is profiled, see `get_wstat_mu_bkg`. As the
+    statistic is stationary in ``mu_bkg`` at the profiled value, the total
+    derivative reduces to the partial derivative at fixed ``mu_bkg``:
+
+    .. math::
+        \frac{\partial W}{\partial \mu_{sig}} = 2 \left( 1 -
+            \frac{n_{on}}{\mu_{sig} + \alpha \mu_{bkg}} \right)
+
+    Parameters
+    ----------
+    n_on : `~numpy.ndarray` or array_like
+        Total observed counts.
+    n_off : `~numpy.ndarray` or array_like
+        Total observed background counts.
+    alpha : `~numpy.ndarray` or array_like
+        Exposure ratio between on and off region.
+    mu_sig : `~numpy.ndarray` or array_like
+        Signal expected counts.
+
+    Returns
+    -------
+    gradient : ndarray
+        Derivative of the statistic per bin.
+    """
+    n_on = np.asanyarray(n_on, dtype=np.float64)
+    alpha = np.asanyarray(alpha, dtype=np.float64)
+    mu_sig = np.asanyarray(mu_sig, dtype=np.float64)
+
+    mu_bkg = get_wstat_mu_bkg(n_on, n_off, alpha, mu_sig)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        term = n_on / (mu_sig + alpha * mu_bkg)
+
+    term = np.where(n_on == 0, 0, term)
+    return 2 * (1 - term)
+
+
 def get_wstat_mu_bkg(n_on, n_off, alpha, mu_sig):
     """Background estimate ``mu_bkg`` for WSTAT.
 
@@ -274,6 +349,14 @@ class FitStatistic(ABC):
         """Calculate sum log(L)."""
         return -0.5 * cls.stat_sum_dataset(dataset)
 
+    @classmethod
+    def stat_gradient_dataset(cls, dataset):
+        """Calculate the derivative of -2 * log(L) with respect to the predicted counts.
+
+        Bins outside of the dataset mask are set to zero.
+        """
+        raise NotImplementedError
+
 
 class CashFitStatistic(FitStatistic):
     """Cash statistic class for Poisson with known background."""
@@ -297,6 +380,14 @@ class CashFitStatistic(FitStatistic):
         counts, npred = dataset.counts.data, dataset.npred().data
         return cash(n_on=counts, mu_on=npred)
 
+    @classmethod
+    def stat_gradient_dataset(cls, dataset):
+        counts, npred = dataset.counts.data, dataset.npred().data
+        gradient = cash_gradient(n_on=counts, mu_on=npred)
+        if dataset.mask is not None:
+            gradient = gradient * dataset.mask.data
+        return gradient
+
 
 class WeightedCashFitStatistic(FitStatistic):
     """Cash statistic class for Poisson with known background applying weights."""
@@ -328,6 +419,14 @@ class WeightedCashFitStatistic(FitStatistic):
             weights = dataset.mask.astype("float")
         return cash(n_on=counts, mu_on=npred) * weights
 
+    @classmethod
+    def stat_gradient_dataset(cls, dataset):
+        counts, npred = dataset.counts.data, dataset.npred().data
+        gradient = cash_gradient(n_on=counts, mu_on=npred)
+        if dataset.mask is not None:
+            gradient = gradient * dataset.mask.data.astype("float")
+        return gradient
+
 
 class WStatFitStatistic(FitStatistic):
     """WStat fit statistic class for ON-OFF Poisson measurements."""
@@ -360,6 +459,22 @@ class WStatFitStatistic(FitStatistic):
                 stat_array = stat_array[dataset.mask.data]
             return np.sum(stat_array)
 
+    @classmethod
+    def stat_gradient_dataset(cls, dataset):
+        if dataset.counts_off is None and not np.any(dataset.mask_safe.data):
+            return np.zeros(dataset.data_shape)
+
+        gradient = wstat_gradient(
+            n_on=dataset.counts.data,
+            n_off=dataset.counts_off.data,
+            alpha=dataset.alpha.data,
+            mu_sig=dataset.npred_signal().data,
+        )
+        gradient = np.nan_to_num(gradient)
+        if dataset.mask is not None:
+            gradient = gradient * dataset.mask.data
+        return gradient
+
 
 class Chi2FitStatistic(FitStatistic):
     """Chi2 fit statistic class for measurements with gaussian symmetric errors."""
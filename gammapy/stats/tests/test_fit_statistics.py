@@ -124,6 +124,34 @@ def test_cstat(test_data, reference_values):
     assert_allclose(statsvec, reference_values["cstat"])
 
 
+def test_cash_gradient(test_data):
+    n_on = np.array(test_data["n_on"], dtype=float)
+    mu_on = np.array(test_data["mu_sig"])
+
+    step = 1e-6
+    upper = stats.cash(n_on=n_on, mu_on=mu_on + step)
+    lower = stats.cash(n_on=n_on, mu_on=mu_on - step)
+
+    gradient = stats.cash_gradient(n_on=n_on, mu_on=mu_on)
+    assert_allclose(gradient, (upper - lower) / (2 * step), rtol=1e-5)
+
+    assert_allclose(stats.cash_gradient(n_on=3, mu_on=0), 0)
+
+
+def test_wstat_gradient(test_data):
+    kwargs = dict(
+        n_on=test_data["n_on"], n_off=test_data["n_off"], alpha=test_data["alpha"]
+    )
+    mu_sig = np.array(test_data["mu_sig"])
+
+    step = 1e-6
+    upper = stats.wstat(mu_sig=mu_sig + step, **kwargs)
+    lower = stats.wstat(mu_sig=mu_sig - step, **kwargs)
+
+    gradient = stats.wstat_gradient(mu_sig=mu_sig, **kwargs)
+    assert_allclose(gradient, (upper - lower) / (2 * step), rtol=1e-4)
+
+
 @requires_dependency("numba")
 def test_cash_sum_compiled(test_data):
     counts = np.array(test_data["n_on"], dtype=float)
@@ -2,15 +2,17 @@
 """Interpolation utilities."""
 
 import html
-from itertools import compress
+from itertools import compress, product
 import numpy as np
 import scipy.interpolate
+from scipy.sparse import csr_matrix
 from astropy import units as u
 from .compat import COPY_IF_NEEDED
 
 __all__ = [
     "interpolate_profile",
     "interpolation_scale",
+    "InterpolationMatrix",
     "ScaledRegularGridInterpolator",
 ]
 
@@ -138,6 +140,175 @@ class ScaledRegularGridInterpolator:
         return values
 
 
+class InterpolationMatrix:
+    """Interpolation at fixed points on a regular grid, as a sparse matrix.
+
+    The interpolation weights only depend on the grid and on the points, not on
+    the interpolated values. They are computed once and stored in a
+    `~scipy.sparse.csr_matrix`, so that interpolating new values at the same
+    points is a single sparse matrix product. This is useful when the same points
+    are interpolated many times, e.g. when a map changes during a fit.
+
+    Parameters
+    ----------
+    matrix : `~scipy.sparse.csr_matrix`
+        Interpolation weights, of shape ``(n_points, n_values)``.
+    shape : tuple of int
+        Shape of the interpolated points.
+    grid_shape : tuple of int
+        Shape of the grid of values.
+    values_scale : {"lin", "log", "sqrt"}, optional
+        Interpolation scaling applied to values. Default is "lin".
+    fill_value : float, optional
+        The value to use for points outside of the grid and for non-finite
+        interpolated values. Default is None, which keeps the extrapolated values.
+    mask_outside : `~numpy.ndarray`, optional
+        Points outside of the grid, of shape ``shape``. Default is None.
+    """
+
+    def __init__(
+        self,
+        matrix,
+        shape,
+        grid_shape,
+        values_scale="lin",
+        fill_value=None,
+        mask_outside=None,
+    ):
+        self.matrix = matrix
+        self.shape = tuple(shape)
+        self.grid_shape = tuple(grid_shape)
+        self.values_scale = values_scale
+        self.fill_value = fill_value
+        self.mask_outside = mask_outside
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(shape={self.shape}, "
+            f"grid_shape={self.grid_shape}, nnz={self.matrix.nnz})"
+        )
+
+    @classmethod
+    def from_pix(cls, grid_shape, pix, method="linear", **kwargs):
+        """Compute the interpolation weights from pixel coordinates.
+
+        The grid nodes are at the integer pixel coordinates ``0, ..., n - 1`` of
+        each axis. Dimensions of length 1 are ignored and points outside of the
+        grid are extrapolated, as for `ScaledRegularGridInterpolator`. Points with
+        non-finite coordinates evaluate to NaN.
+
+        Parameters
+        ----------
+        grid_shape : tuple of int
+            Shape of the grid of values.
+        pix : tuple of `~numpy.ndarray`
+            Pixel coordinates of the points, one array per axis of the grid.
+            Arrays are broadcast internally.
+        method : {"linear", "nearest"}
+            Interpolation method. Default is "linear".
+        **kwargs : dict
+            Keyword arguments passed to `InterpolationMatrix`.
+
+        Returns
+        -------
+        interp_matrix : `InterpolationMatrix`
+            Interpolation matrix.
+        """
+        if method not in ["linear", "nearest"]:
+            raise ValueError(f"Not a valid interpolation method: '{method}'.")
+
+        grid_shape = tuple(int(n) for n in grid_shape)
+
+        if len(pix) != len(grid_shape):
+            raise ValueError(
+                f"Expected {len(grid_shape)} pixel coordinate arrays, got {len(pix)}."
+            )
+
+        pix = np.broadcast_arrays(*[np.asarray(p, dtype=float) for p in pix])
+        shape = pix[0].shape
+        pix = [p.ravel() for p in pix]
+        n_points = pix[0].size
+
+        finite = np.all([np.isfinite(p) for p in pix], axis=0)
+        ones = np.where(finite, 1.0, np.nan)
+
+        # index and weight pairs of the neighbouring nodes along each axis
+        nodes = []
+        for x, n in zip(pix, grid_shape):
+            if n == 1:
+                nodes.append([(np.zeros(n_points, dtype=int), ones)])
+                continue
+
+            x = np.where(finite, x, 0.0)
+            idx = np.clip(np.floor(x), 0, n - 2).astype(int)
+            t = x - idx
+
+            if method == "nearest":
+                nodes.append([(np.where(t <= 0.5, idx, idx + 1), ones)])
+            else:
+                nodes.append([(idx, (1 - t) * ones), (idx + 1, t * ones)])
+
+        rows, cols, weights = [], [], []
+        for corner in product(*nodes):
+            idx = [_[0] for _ in corner]
+            rows.append(np.arange(n_points))
+            cols.append(np.ravel_multi_index(idx, grid_shape))
+            weights.append(np.prod([_[1] for _ in corner], axis=0))
+
+        matrix = csr_matrix(
+            (np.concatenate(weights), (np.concatenate(rows), np.concatenate(cols))),
+            shape=(n_points, int(np.prod(grid_shape))),
+        )
+        return cls(matrix=matrix, shape=shape, grid_shape=grid_shape, **kwargs)
+
+    def __call__(self, values):
+        """Interpolate values at the points.
+
+        Parameters
+        ----------
+        values : `~numpy.ndarray` or `~astropy.units.Quantity`
+            Values on the grid. Additional leading axes are interpolated
+            independently. Non-finite values are set to zero, unless all values
+            are non-finite.
+
+        Returns
+        -------
+        values : `~numpy.ndarray` or `~astropy.units.Quantity`
+            Interpolated values, of shape ``values.shape[:-ndim] + shape``, where
+            ``ndim`` is the number of dimensions of the grid.
+        """
+        unit = getattr(values, "unit", None)
+        values = np.asarray(getattr(values, "value", values))
+
+        ndim = len(self.grid_shape)
+        if values.shape[values.ndim - ndim :] != self.grid_shape:
+            raise ValueError(
+                f"Values of shape {values.shape} do not match the grid shape "
+                f"{self.grid_shape}."
+            )
+
+        finite = np.isfinite(values)
+        if np.any(finite) and not np.all(finite):
+            values = np.where(finite, values, 0.0)
+
+        scale = interpolation_scale(self.values_scale)
+        extra_shape = values.shape[: values.ndim - ndim]
+        values = scale(values).reshape((-1, self.matrix.shape[1]))
+
+        result = (self.matrix @ values.T).T
+        result = scale.inverse(result.reshape(extra_shape + self.shape))
+
+        if self.fill_value is not None:
+            if self.mask_outside is not None:
+                result[..., self.mask_outside] = self.fill_value
+            result[~np.isfinite(result)] = self.fill_value
+
+        if unit is not None:
+            result = u.Quantity(result, unit, copy=COPY_IF_NEEDED)
+
+        return result
+
+
 def interpolation_scale(scale="lin"):
     """Interpolation scaling.
 
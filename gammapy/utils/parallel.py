@@ -1,9 +1,21 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 """Multiprocessing and multithreading setup."""
 
+import atexit
 import importlib
 import logging
+import sys
+import threading
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import contextmanager
 from enum import Enum
+from functools import partial
+from itertools import islice
+import numpy as np
 from gammapy.utils.pbar import progress_bar
 
 log = logging.getLogger(__name__)
@@ -11,11 +23,15 @@ log = logging.getLogger(__name__)
 __all__ = [
     "multiprocessing_manager",
     "run_multiprocessing",
+    "SharedMemoryArrays",
+    "attach_shared_memory_arrays",
+    "shutdown_pool",
     "BACKEND_DEFAULT",
     "N_JOBS_DEFAULT",
     "POOL_KWARGS_DEFAULT",
     "METHOD_DEFAULT",
     "METHOD_KWARGS_DEFAULT",
+    "PERSISTENT_POOL_DEFAULT",
 ]
 
 
@@ -24,6 +40,8 @@ class ParallelBackendEnum(Enum):
 
     multiprocessing = "multiprocessing"
     ray = "ray"
+    futures = "futures"
+    threading = "threading"
 
     @classmethod
     def from_str(cls, value):
@@ -40,6 +58,7 @@ class PoolMethodEnum(Enum):
 
     starmap = "starmap"
     apply_async = "apply_async"
+    as_completed = "as_completed"
 
 
 BACKEND_DEFAULT = ParallelBackendEnum.multiprocessing
@@ -48,6 +67,10 @@ ALLOW_CHILD_JOBS = False
 POOL_KWARGS_DEFAULT = dict(processes=N_JOBS_DEFAULT)
 METHOD_DEFAULT = PoolMethodEnum.starmap
 METHOD_KWARGS_DEFAULT = {}
+PERSISTENT_POOL_DEFAULT = False
+
+_PERSISTENT_POOLS = {}
+_RESOURCE_TRACKER_LOCK = threading.Lock()
 
 
 def get_multiprocessing():
@@ -67,15 +90,183 @@ def get_multiprocessing_ray():
     return multiprocessing
 
 
+class _ExecutorAsyncResult:
+    """Result of `_ExecutorPool.apply_async`, mimicking `multiprocessing.pool.AsyncResult`.
+
+    The callbacks are run before the result is flagged as ready, so that
+    waiting on the result also waits for the callbacks.
+    """
+
+    def __init__(self, future, callback=None, error_callback=None):
+        self._future = future
+        self._callback = callback
+        self._error_callback = error_callback
+        self._event = threading.Event()
+        future.add_done_callback(self._set)
+
+    def _set(self, future):
+        try:
+            if future.cancelled():
+                return
+
+            error = future.exception()
+
+            if error is None and self._callback is not None:
+                self._callback(future.result())
+            elif error is not None and self._error_callback is not None:
+                self._error_callback(error)
+        finally:
+            self._event.set()
+
+    def ready(self):
+        return self._event.is_set()
+
+    def successful(self):
+        return self.ready() and self._future.exception() is None
+
+    def wait(self, timeout=None):
+        self._event.wait(timeout)
+
+    def get(self, timeout=None):
+        self.wait(timeout)
+        return self._future.result(timeout=0)
+
+
+def _chunks(iterable, chunksize):
+    """Split iterable into lists of at most chunksize elements."""
+    iterator = iter(iterable)
+
+    while chunk := list(islice(iterator, chunksize)):
+        yield chunk
+
+
+def _run_chunk(func, chunk):
+    """Apply function on a chunk of arguments."""
+    return [func(*arguments) for arguments in chunk]
+
+
+def _star_call(func, arguments):
+    """Call function with unpacked arguments."""
+    return func(*arguments)
+
+
+class _ExecutorPool:
+    """Pool on top of a `concurrent.futures` executor.
+
+    It implements the subset of the `multiprocessing.pool.Pool` interface used
+    by `run_multiprocessing`. Arguments are submitted in chunks of
+    ``chunksize`` tasks, and pending tasks are cancelled if one of them fails
+    or if the iteration over the results is interrupted.
+
+    Parameters
+    ----------
+    executor_class : {`~concurrent.futures.ProcessPoolExecutor`, `~concurrent.futures.ThreadPoolExecutor`}
+        Executor class.
+    processes : int, optional
+        Maximum number of workers. Default is None.
+    initializer : callable, optional
+        Called by each worker on start. Default is None.
+    initargs : tuple, optional
+        Arguments passed to the initializer. Default is ().
+    """
+
+    def __init__(self, executor_class, processes=None, initializer=None, initargs=()):
+        self._executor = executor_class(
+            max_workers=processes, initializer=initializer, initargs=initargs
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, type, value, traceback):
+        self.terminate()
+
+    def _submit_chunks(self, func, iterable, chunksize):
+        return [
+            self._executor.submit(_run_chunk, func, chunk)
+            for chunk in _chunks(iterable, chunksize or 1)
+        ]
+
+    @staticmethod
+    def _cancel(futures):
+        for future in futures:
+            future.cancel()
+
+    def starmap(self, func, iterable, chunksize=None):
+        """Apply function to each element of iterable, results are returned in order."""
+        futures = self._submit_chunks(func, iterable, chunksize)
+
+        try:
+            return [result for future in futures for result in future.result()]
+        except BaseException:
+            self._cancel(futures)
+            raise
+
+    def imap_unordered(self, func, iterable, chunksize=None):
+        """Apply function to each element of iterable, results are yielded as they complete."""
+        futures = self._submit_chunks(func, ((_,) for _ in iterable), chunksize)
+
+        try:
+            for future in as_completed(futures):
+                yield from future.result()
+        except BaseException:
+            self._cancel(futures)
+            raise
+
+    def apply_async(self, func, args=(), kwds=None, callback=None, error_callback=None):
+        """Submit function call, the result is available via the returned object."""
+        future = self._executor.submit(func, *args, **(kwds or {}))
+        return _ExecutorAsyncResult(
+            future, callback=callback, error_callback=error_callback
+        )
+
+    def close(self):
+        pass
+
+    def join(self):
+        self._executor.shutdown(wait=True)
+
+    def terminate(self):
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+
+class _ExecutorModule:
+    """Expose an executor with the interface of the `multiprocessing` module used here."""
+
+    def __init__(self, executor_class):
+        self.executor_class = executor_class
+
+    def Pool(self, **kwargs):
+        return _ExecutorPool(self.executor_class, **kwargs)
+
+    def cpu_count(self):
+        return get_multiprocessing().cpu_count()
+
+    def current_process(self):
+        return get_multiprocessing().current_process()
+
+
+def get_concurrent_futures():
+    """Get multiprocessing interface for the `concurrent.futures` process backend."""
+    return _ExecutorModule(ProcessPoolExecutor)
+
+
+def get_threading():
+    """Get multiprocessing interface for the thread backend."""
+    return _ExecutorModule(ThreadPoolExecutor)
+
+
 def is_ray_initialized():
     """Check if ray is initialized."""
-    try:
-        from ray import is_initialized
+    # ray can only be initialized if it was imported, this avoids
+    # repeated failing imports when ray is not installed
+    ray = sys.modules.get("ray")
 
-        return is_initialized()
-    except ModuleNotFoundError:
+    if ray is None:
         return False
 
+    return ray.is_initialized()
+
 
 def is_ray_available():
     """Check if ray is available."""
@@ -94,15 +285,20 @@ class multiprocessing_manager:
 
     Parameters
     ----------
-    backend : {'multiprocessing', 'ray'}
+    backend : {'multiprocessing', 'ray', 'futures', 'threading'}
         Backend to use.
     pool_kwargs : dict
         Keyword arguments passed to the pool. The number of processes is limited
         to the number of physical CPUs.
-    method : {'starmap', 'apply_async'}
+    method : {'starmap', 'apply_async', 'as_completed'}
         Pool method to use.
     method_kwargs : dict
         Keyword arguments passed to the method
+    persistent_pool : bool
+        Whether to keep the pool of workers alive between calls of `run_multiprocessing`,
+        so that repeated parallel computations reuse the already started workers.
+        One pool is created lazily for each backend used, and all of them are shut
+        down when leaving the context.
 
     Examples
     --------
@@ -114,24 +310,42 @@ class multiprocessing_manager:
         fpe = FluxPointsEstimator(energy_edges=[1, 3, 10] * u.TeV)
 
         with parallel.multiprocessing_manager(
-                backend="multiprocessing",
-                pool_kwargs=dict(processes=2),
-            ):
+            backend="multiprocessing",
+            pool_kwargs=dict(processes=2),
+        ):
             fpe.run(datasets)
+
+    To reuse the same workers for several computations::
+
+        with parallel.multiprocessing_manager(
+            pool_kwargs=dict(processes=4),
+            persistent_pool=True,
+        ):
+            for datasets in datasets_list:
+                fpe.run(datasets)
     """
 
-    def __init__(self, backend=None, pool_kwargs=None, method=None, method_kwargs=None):
+    def __init__(
+        self,
+        backend=None,
+        pool_kwargs=None,
+        method=None,
+        method_kwargs=None,
+        persistent_pool=None,
+    ):
         global \
             BACKEND_DEFAULT, \
             POOL_KWARGS_DEFAULT, \
             METHOD_DEFAULT, \
             METHOD_KWARGS_DEFAULT, \
-            N_JOBS_DEFAULT
+            N_JOBS_DEFAULT, \
+            PERSISTENT_POOL_DEFAULT
         self._backend = BACKEND_DEFAULT
         self._pool_kwargs = POOL_KWARGS_DEFAULT
         self._method = METHOD_DEFAULT
         self._method_kwargs = METHOD_KWARGS_DEFAULT
         self._n_jobs = N_JOBS_DEFAULT
+        self._persistent_pool = PERSISTENT_POOL_DEFAULT
         if backend is not None:
             BACKEND_DEFAULT = ParallelBackendEnum.from_str(backend).value
         if pool_kwargs is not None:
@@ -141,6 +355,8 @@ class multiprocessing_manager:
             METHOD_DEFAULT = PoolMethodEnum(method).value
         if method_kwargs is not None:
             METHOD_KWARGS_DEFAULT = method_kwargs
+        if persistent_pool is not None:
+            PERSISTENT_POOL_DEFAULT = persistent_pool
 
     def __enter__(self):
         pass
@@ -151,13 +367,19 @@ class multiprocessing_manager:
             POOL_KWARGS_DEFAULT, \
             METHOD_DEFAULT, \
             METHOD_KWARGS_DEFAULT, \
-            N_JOBS_DEFAULT
+            N_JOBS_DEFAULT, \
+            PERSISTENT_POOL_DEFAULT
         BACKEND_DEFAULT = self._backend
         POOL_KWARGS_DEFAULT = self._pool_kwargs
         METHOD_DEFAULT = self._method
         METHOD_KWARGS_DEFAULT = self._method_kwargs
         N_JOBS_DEFAULT = self._n_jobs
 
+        if PERSISTENT_POOL_DEFAULT and not self._persistent_pool:
+            shutdown_pool()
+
+        PERSISTENT_POOL_DEFAULT = self._persistent_pool
+
 
 class ParallelMixin:
     """Mixin class to handle parallel processing."""
@@ -215,6 +437,21 @@ class ParallelMixin:
             self._parallel_backend = ParallelBackendEnum.from_str(value).value
 
 
+def _array_backend():
+    """Backend for tasks on arrays releasing the GIL, e.g. image convolutions.
+
+    These tasks use threads, which avoid pickling the arrays, unless another
+    backend than the default "multiprocessing" was configured, e.g. with
+    `multiprocessing_manager`, in which case the configured backend is used.
+    """
+    backend = ParallelBackendEnum.from_str(BACKEND_DEFAULT)
+
+    if backend == ParallelBackendEnum.multiprocessing:
+        return ParallelBackendEnum.threading
+
+    return backend
+
+
 def run_multiprocessing(
     func,
     inputs,
@@ -230,21 +467,32 @@ def run_multiprocessing(
     -----
     The progress bar can be displayed for this function.
 
+    If `PERSISTENT_POOL_DEFAULT` is True, the pool of workers is kept alive
+    and reused by subsequent calls, see `multiprocessing_manager` and `shutdown_pool`.
+
     Parameters
     ----------
     func : function
         Function to run.
     inputs : list
         List of arguments to pass to the function.
-    backend : {'multiprocessing', 'ray'}, optional
-        Backend to use. Default is None.
+    backend : {'multiprocessing', 'ray', 'futures', 'threading'}, optional
+        Backend to use. The 'futures' backend relies on
+        `~concurrent.futures.ProcessPoolExecutor` and the 'threading' backend on
+        `~concurrent.futures.ThreadPoolExecutor`. The latter avoids pickling the
+        inputs and is suited for functions releasing the GIL, such as NumPy or
+        FFT based computations. Default is None.
     pool_kwargs : dict, optional
         Keyword arguments passed to the pool. The number of processes is limited
         to the number of physical CPUs. Default is None.
-    method : {'starmap', 'apply_async'}
-        Pool method to use. Default is "starmap".
+    method : {'starmap', 'apply_async', 'as_completed'}
+        Pool method to use. With 'starmap' the results are returned in the order
+        of the inputs. With 'as_completed' they are returned in the order in which
+        they complete, and passed as they arrive to the optional ``callback``
+        given in ``method_kwargs``. Default is "starmap".
     method_kwargs : dict, optional
-        Keyword arguments passed to the method. Default is None.
+        Keyword arguments passed to the method, e.g. ``chunksize`` to submit the
+        inputs by chunks. Default is None.
     task_name : str, optional
         Name of the task to display in the progress bar. Default is "".
     """
@@ -270,14 +518,17 @@ def run_multiprocessing(
     backend = ParallelBackendEnum.from_str(backend)
     multiprocessing = PARALLEL_BACKEND_MODULES[backend]()
 
-    if backend == ParallelBackendEnum.multiprocessing:
+    if backend != ParallelBackendEnum.ray:
         cpu_count = multiprocessing.cpu_count()
 
         if processes > cpu_count:
             log.info(f"Limiting number of processes from {processes} to {cpu_count}")
             processes = cpu_count
 
-        if multiprocessing.current_process().name != "MainProcess":
+        if (
+            backend != ParallelBackendEnum.threading
+            and multiprocessing.current_process().name != "MainProcess"
+        ):
             # with multiprocessing subprocesses cannot have children (but possible with ray)
             processes = 1
 
@@ -292,8 +543,19 @@ def run_multiprocessing(
 
     log.info(f"Using {processes} processes to compute {task_name}")
 
+    pool_func = POOL_METHODS[method_enum]
+
+    if PERSISTENT_POOL_DEFAULT:
+        pool = _get_persistent_pool(backend=backend, pool_kwargs=pool_kwargs)
+        return pool_func(
+            pool=pool,
+            func=func,
+            inputs=inputs,
+            method_kwargs=method_kwargs,
+            task_name=task_name,
+        )
+
     with multiprocessing.Pool(**pool_kwargs) as pool:
-        pool_func = POOL_METHODS[method_enum]
         results = pool_func(
             pool=pool,
             func=func,
@@ -305,6 +567,88 @@ def run_multiprocessing(
     return results
 
 
+class _PersistentPool:
+    """Pool kept alive between calls, together with the configuration it was created with."""
+
+    def __init__(self, backend, pool_kwargs):
+        multiprocessing = PARALLEL_BACKEND_MODULES[backend]()
+        self.backend = backend
+        self.pool_kwargs = dict(pool_kwargs)
+        self.pool = multiprocessing.Pool(**pool_kwargs)
+
+    @property
+    def processes(self):
+        return self.pool_kwargs.get("processes", N_JOBS_DEFAULT)
+
+    def is_compatible(self, backend, pool_kwargs):
+        """Whether the pool can be reused for the given configuration.
+
+        The number of processes must match exactly, so that the number of jobs
+        requested by the caller is respected.
+        """
+        other = {key: value for key, value in pool_kwargs.items() if key != "processes"}
+        this = {
+            key: value for key, value in self.pool_kwargs.items() if key != "processes"
+        }
+        processes = pool_kwargs.get("processes", N_JOBS_DEFAULT)
+        return backend == self.backend and other == this and processes == self.processes
+
+    def close(self):
+        self.pool.close()
+        self.pool.join()
+
+
+def _get_persistent_pool(backend, pool_kwargs):
+    """Get the persistent pool of a backend, creating it if needed.
+
+    One pool is kept for each backend, so that calls alternating between backends
+    do not restart the workers. The pool is reused as long as the number of
+    processes and the other keyword arguments are the same. Otherwise it is shut
+    down and replaced.
+
+    Parameters
+    ----------
+    backend : `ParallelBackendEnum`
+        Backend to use.
+    pool_kwargs : dict
+        Keyword arguments passed to the pool.
+
+    Returns
+    -------
+    pool : `~multiprocessing.pool.Pool`
+        Pool of workers.
+    """
+    persistent_pool = _PERSISTENT_POOLS.get(backend)
+
+    if persistent_pool is not None and not persistent_pool.is_compatible(
+        backend, pool_kwargs
+    ):
+        log.info(f"Shutting down persistent {backend.value} pool of workers")
+        _PERSISTENT_POOLS.pop(backend).close()
+        persistent_pool = None
+
+    if persistent_pool is None:
+        log.info(f"Starting persistent {backend.value} pool of workers")
+        persistent_pool = _PersistentPool(backend=backend, pool_kwargs=pool_kwargs)
+        _PERSISTENT_POOLS[backend] = persistent_pool
+
+    return persistent_pool.pool
+
+
+def shutdown_pool():
+    """Shut down the persistent pools of workers of all backends, if any.
+
+    Pending tasks are completed before the workers exit.
+    """
+    while _PERSISTENT_POOLS:
+        backend, persistent_pool = _PERSISTENT_POOLS.popitem()
+        log.info(f"Shutting down persistent {backend.value} pool of workers")
+        persistent_pool.close()
+
+
+atexit.register(shutdown_pool)
+
+
 def run_loop(func, inputs, method_kwargs=None, task_name=""):
     """Loop over inputs and run function."""
     results = []
@@ -327,6 +671,26 @@ def run_pool_star_map(pool, func, inputs, method_kwargs=None, task_name=""):
     return pool.starmap(func, progress_bar(inputs, desc=task_name), **method_kwargs)
 
 
+def run_pool_as_completed(pool, func, inputs, method_kwargs=None, task_name=""):
+    """Run function in parallel, results are collected as they complete."""
+    method_kwargs = dict(method_kwargs)
+    callback = method_kwargs.pop("callback", None)
+
+    results = []
+
+    for result in pool.imap_unordered(
+        partial(_star_call, func),
+        progress_bar(inputs, desc=task_name),
+        **method_kwargs,
+    ):
+        if callback is not None:
+            result = callback(result)
+
+        results.append(result)
+
+    return results
+
+
 def run_pool_async(pool, func, inputs, method_kwargs=None, task_name=""):
     """Run function in parallel async."""
     results = []
@@ -339,12 +703,149 @@ def run_pool_async(pool, func, inputs, method_kwargs=None, task_name=""):
     return results
 
 
+class SharedMemoryArrays:
+    """Context manager to place arrays into shared memory.
+
+    On enter, each array is copied once into a
+    `~multiprocessing.shared_memory.SharedMemory` block and a picklable
+    description of the blocks is returned. Worker processes can then access
+    the arrays without copying, using `attach_shared_memory_arrays`.
+    The shared memory blocks are released on exit.
+
+    Parameters
+    ----------
+    arrays : dict of `~numpy.ndarray`
+        Arrays to share. None entries are passed through unchanged.
+
+    Examples
+    --------
+    ::
+
+        import numpy as np
+        from gammapy.utils.parallel import (
+            SharedMemoryArrays,
+            attach_shared_memory_arrays,
+        )
+
+        with SharedMemoryArrays({"data": np.ones((100, 100))}) as specs:
+            with attach_shared_memory_arrays(specs) as arrays:
+                total = arrays["data"].sum()
+    """
+
+    def __init__(self, arrays):
+        self.arrays = arrays
+        self._handles = []
+
+    def __enter__(self):
+        from multiprocessing.shared_memory import SharedMemory
+
+        specs = {}
+
+        try:
+            for key, array in self.arrays.items():
+                if array is None:
+                    specs[key] = None
+                    continue
+
+                array = np.ascontiguousarray(array)
+                shm = SharedMemory(create=True, size=max(array.nbytes, 1))
+                self._handles.append(shm)
+                shared = np.ndarray(array.shape, dtype=array.dtype, buffer=shm.buf)
+                shared[...] = array
+                del shared
+                specs[key] = (shm.name, array.shape, array.dtype.str)
+        except Exception:
+            self._release()
+            raise
+
+        return specs
+
+    def __exit__(self, type, value, traceback):
+        self._release()
+
+    def _release(self):
+        for shm in self._handles:
+            shm.close()
+            shm.unlink()
+        self._handles = []
+
+
+def _attach_shared_memory(shared_memory_cls, name):
+    """Attach to an existing shared memory block without tracking it.
+
+    The block is owned and unlinked by the process that created it. Before
+    Python 3.13, attaching registers the block with the resource tracker, which
+    can warn about leaked blocks or unlink them when a worker exits. The
+    registration is skipped, as done by ``track=False`` in later versions.
+    Unregistering after attaching is not an option, because pool workers share
+    the resource tracker of the process owning the block.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory_cls(name=name, track=False)
+
+    from multiprocessing import resource_tracker
+
+    with _RESOURCE_TRACKER_LOCK:
+        register = resource_tracker.register
+        resource_tracker.register = lambda *args, **kwargs: None
+        try:
+            return shared_memory_cls(name=name)
+        finally:
+            resource_tracker.register = register
+
+
+@contextmanager
+def attach_shared_memory_arrays(specs):
+    """Attach to arrays placed into shared memory by `SharedMemoryArrays`.
+
+    The arrays are views on the shared memory blocks and must not be used
+    outside of the context.
+
+    Parameters
+    ----------
+    specs : dict
+        Shared memory description as returned by `SharedMemoryArrays`.
+
+    Yields
+    ------
+    arrays : dict of `~numpy.ndarray`
+        Arrays backed by shared memory.
+    """
+    from multiprocessing.shared_memory import SharedMemory
+
+    handles, arrays = [], {}
+
+    try:
+        for key, spec in specs.items():
+            if spec is None:
+                arrays[key] = None
+                continue
+
+            name, shape, dtype = spec
+            shm = _attach_shared_memory(SharedMemory, name)
+            handles.append(shm)
+            arrays[key] = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+
+        yield arrays
+    finally:
+        arrays.clear()
+        for shm in handles:
+            try:
+                shm.close()
+            except BufferError:
+                # views are still referenced, the mapping is closed on garbage collection
+                log.debug(f"Could not close shared memory block {shm.name}")
+
+
 POOL_METHODS = {
     PoolMethodEnum.starmap: run_pool_star_map,
     PoolMethodEnum.apply_async: run_pool_async,
+    PoolMethodEnum.as_completed: run_pool_as_completed,
 }
 
 PARALLEL_BACKEND_MODULES = {
     ParallelBackendEnum.multiprocessing: get_multiprocessing,
     ParallelBackendEnum.ray: get_multiprocessing_ray,
+    ParallelBackendEnum.futures: get_concurrent_futures,
+    ParallelBackendEnum.threading: get_threading,
 }
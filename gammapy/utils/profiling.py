@@ -0,0 +1,295 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+"""Utilities to record the time spent in the analysis stages."""
+
+import json
+import threading
+import time
+import numpy as np
+import astropy.units as u
+from astropy.table import Table
+from gammapy.utils.scripts import make_path
+
+__all__ = ["Profiler", "stage", "count", "merge_records"]
+
+_ACTIVE_PROFILERS = []
+
+
+class _NullStage:
+    """Stage used when no profiler is active, it does nothing."""
+
+    size = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return None
+
+
+_NULL_STAGE = _NullStage()
+
+
+class _Stage:
+    """Stage timing its block and reporting to the active profilers."""
+
+    __slots__ = ("name", "size", "_start")
+
+    def __init__(self, name, size=None):
+        self.name = name
+        self.size = size
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        duration = time.perf_counter() - self._start
+        for profiler in _ACTIVE_PROFILERS:
+            profiler.record(self.name, duration=duration, size=self.size)
+
+
+def is_active():
+    """Whether a profiler is currently recording."""
+    return bool(_ACTIVE_PROFILERS)
+
+
+def stage(name, size=None):
+    """Context manager recording the wall time of a stage in the active profilers.
+
+    When no `Profiler` is active this returns a shared no-op context manager,
+    so that instrumented code costs a function call only. The array size can
+    also be set from within the block, once it is known, using the ``size``
+    attribute of the returned object.
+
+    Parameters
+    ----------
+    name : str
+        Name of the stage.
+    size : int, optional
+        Size of the array processed in the stage. Default is None.
+
+    Examples
+    --------
+    >>> from gammapy.utils.profiling import stage
+    >>> with stage("MapDatasetMaker.counts") as record:
+    ...     record.size = 100
+    """
+    if not _ACTIVE_PROFILERS:
+        return _NULL_STAGE
+    return _Stage(name, size=size)
+
+
+def count(name, n_calls=1, size=None):
+    """Count calls of an untimed event in the active profilers, e.g. a cache hit.
+
+    Parameters
+    ----------
+    name : str
+        Name of the event.
+    n_calls : int, optional
+        Number of calls to add. Default is 1.
+    size : int, optional
+        Size of the array processed. Default is None.
+    """
+    for profiler in _ACTIVE_PROFILERS:
+        profiler.record(name, n_calls=n_calls, size=size)
+
+
+def merge_records(records):
+    """Merge the records of another profiler into the active profilers.
+
+    Parameters
+    ----------
+    records : dict
+        Records of a profiler, e.g. returned by a task run in a sub-process.
+    """
+    for profiler in _ACTIVE_PROFILERS:
+        profiler._merge(records)
+
+
+def _run_profiled(func, *args):
+    """Run a function with a new profiler, and return the result and the records.
+
+    This is used to collect the records of tasks executed by process based parallel
+    backends, which are merged back into the active profilers of the main process.
+    """
+    active = list(_ACTIVE_PROFILERS)
+    profiler = Profiler()
+    _ACTIVE_PROFILERS[:] = [profiler]
+
+    try:
+        result = func(*args)
+    finally:
+        _ACTIVE_PROFILERS[:] = active
+
+    return result, profiler._records
+
+
+class Profiler:
+    """Record the wall time, number of calls and array sizes of the analysis stages.
+
+    The instrumented stages include the makers run by `~gammapy.makers.DatasetsMaker`,
+    the products of `~gammapy.makers.MapDatasetMaker`, the optimization and covariance
+    steps of `~gammapy.modeling.Fit`, the statistic of each dataset and the PSF and
+    energy dispersion kernel updates of the model evaluators, including cache hits.
+
+    Recording starts with `Profiler.start` or when entering the profiler as a context
+    manager. Several profilers can record at the same time. The instrumentation is
+    cheap, so a profiler can be left running for long analyses.
+
+    Examples
+    --------
+    >>> from gammapy.modeling import Fit
+    >>> from gammapy.utils.profiling import Profiler
+    >>> with Profiler() as profiler:
+    ...     result = Fit().run(datasets)  # doctest: +SKIP
+    >>> print(profiler.to_table())  # doctest: +SKIP
+    """
+
+    def __init__(self):
+        self._records = {}
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        self.stop()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(n_stages={len(self._records)})"
+
+    @property
+    def is_active(self):
+        """Whether the profiler is recording."""
+        return any(profiler is self for profiler in _ACTIVE_PROFILERS)
+
+    def start(self):
+        """Start recording."""
+        if not self.is_active:
+            _ACTIVE_PROFILERS.append(self)
+
+    def stop(self):
+        """Stop recording."""
+        _ACTIVE_PROFILERS[:] = [_ for _ in _ACTIVE_PROFILERS if _ is not self]
+
+    def reset(self):
+        """Remove all records."""
+        with self._lock:
+            self._records = {}
+
+    def record(self, name, duration=None, size=None, n_calls=1):
+        """Add a record.
+
+        Parameters
+        ----------
+        name : str
+            Name of the stage.
+        duration : float, optional
+            Wall time in seconds. Default is None, which only counts the calls.
+        size : int, optional
+            Size of the processed array. Default is None.
+        n_calls : int, optional
+            Number of calls. Default is 1.
+        """
+        with self._lock:
+            record = self._records.get(name)
+
+            if record is None:
+                record = self._records[name] = [0, 0.0, 0.0, 0]
+
+            record[0] += n_calls
+
+            if duration is not None:
+                record[1] += duration
+                record[2] = max(record[2], duration)
+
+            if size is not None:
+                record[3] += int(size)
+
+    def _merge(self, records):
+        """Merge records of another profiler, e.g. from a sub-process."""
+        with self._lock:
+            for name, (n_calls, duration, duration_max, size) in records.items():
+                record = self._records.setdefault(name, [0, 0.0, 0.0, 0])
+                record[0] += n_calls
+                record[1] += duration
+                record[2] = max(record[2], duration_max)
+                record[3] += size
+
+    def to_dict(self):
+        """Records as a dict, with one entry per stage.
+
+        Returns
+        -------
+        records : dict
+            Number of calls, total, mean and maximum wall times in seconds and
+            total size of the processed arrays of each stage.
+        """
+        with self._lock:
+            records = {name: list(record) for name, record in self._records.items()}
+
+        return {
+            name: {
+                "n_calls": n_calls,
+                "time_total": duration,
+                "time_mean": duration / n_calls if n_calls else 0.0,
+                "time_max": duration_max,
+                "size_total": size,
+            }
+            for name, (n_calls, duration, duration_max, size) in records.items()
+        }
+
+    def to_table(self, sort=True):
+        """Records as a table, with one row per stage.
+
+        Parameters
+        ----------
+        sort : bool, optional
+            Sort the stages by decreasing total wall time. Default is True.
+
+        Returns
+        -------
+        table : `~astropy.table.Table`
+            Table with the stage name, number of calls, total, mean and maximum
+            wall times and the total size of the processed arrays.
+        """
+        records = self.to_dict()
+        names = list(records)
+
+        if sort:
+            names = sorted(names, key=lambda _: -records[_]["time_total"])
+
+        table = Table()
+        table["stage"] = np.array(names, dtype=str)
+        table["n_calls"] = np.array([records[_]["n_calls"] for _ in names], dtype=int)
+
+        for column in ["time_total", "time_mean", "time_max"]:
+            values = [records[_][column] for _ in names]
+            table[column] = u.Quantity(values, "s", dtype=float)
+
+        values = [records[_]["size_total"] for _ in names]
+        table["size_total"] = np.array(values, dtype=int)
+        return table
+
+    def to_json(self):
+        """Records as a JSON string, see `Profiler.to_dict`."""
+        return json.dumps(self.to_dict(), indent=2)
+
+    def write(self, filename, overwrite=False):
+        """Write the records to a JSON file.
+
+        Parameters
+        ----------
+        filename : str or `~pathlib.Path`
+            Filename.
+        overwrite : bool, optional
+            Overwrite existing file. Default is False.
+        """
+        path = make_path(filename)
+
+        if path.exists() and not overwrite:
+            raise IOError(f"File exists already: {path}")
+
+        path.write_text(self.to_json())
@@ -139,3 +139,153 @@ def find_roots(
         except (RuntimeError, ValueError):
             continue
     return roots * unit, results
+
+
+def find_roots_vectorized(
+    f, lower_bound, upper_bound, xtol=2e-12, rtol=None, maxiter=100
+):
+    """Find the roots of many scalar functions at once using Brent's method.
+
+    This is a vectorized version of `~scipy.optimize.brentq`: all brackets are
+    iterated together as arrays and each element is frozen as soon as it has
+    converged. For every element the iterations are the same as with
+    `~scipy.optimize.brentq`, up to floating point rounding.
+
+    Parameters
+    ----------
+    f : callable
+        Vectorized objective function with signature ``f(x, index)``, where ``x``
+        is an array of values and ``index`` the integer indices of the elements
+        ``x`` corresponds to. It must return an array with the same shape as ``x``.
+    lower_bound : `~numpy.ndarray`
+        Lower bounds of the brackets.
+    upper_bound : `~numpy.ndarray`
+        Upper bounds of the brackets. The function values at both bounds
+        must have opposite signs.
+    xtol : float, optional
+        Tolerance (absolute) for termination. Default is 2e-12.
+    rtol : float, optional
+        Tolerance (relative) for termination. Default is None, which uses
+        four times the machine precision.
+    maxiter : int, optional
+        Maximum number of iterations. Default is 100.
+
+    Returns
+    -------
+    roots : `~numpy.ndarray`
+        The function roots. NaN where the bracket is invalid or the function
+        returned NaN.
+    iterations : `~numpy.ndarray`
+        Number of iterations for each element.
+    converged : `~numpy.ndarray`
+        Whether the solver converged for each element.
+    """
+    if rtol is None:
+        rtol = 4 * np.finfo(float).eps
+
+    xpre = np.array(lower_bound, dtype=float).ravel()
+    xcur = np.array(upper_bound, dtype=float).ravel()
+    xpre, xcur = np.broadcast_arrays(xpre, xcur)
+    xpre, xcur = xpre.copy(), xcur.copy()
+
+    size = xcur.size
+    index_all = np.arange(size)
+
+    roots = np.full(size, np.nan)
+    iterations = np.zeros(size, dtype=int)
+    converged = np.zeros(size, dtype=bool)
+
+    with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+        fpre = np.asarray(f(xpre, index_all), dtype=float)
+        fcur = np.asarray(f(xcur, index_all), dtype=float)
+
+    invalid = np.isnan(fpre) | np.isnan(fcur) | (fpre * fcur > 0)
+
+    done = fpre == 0
+    roots[done & ~invalid] = xpre[done & ~invalid]
+    converged[done & ~invalid] = True
+
+    done_cur = (fcur == 0) & ~done
+    roots[done_cur & ~invalid] = xcur[done_cur & ~invalid]
+    converged[done_cur & ~invalid] = True
+
+    active = np.nonzero(~(invalid | done | done_cur))[0]
+    xpre, xcur, fpre, fcur = xpre[active], xcur[active], fpre[active], fcur[active]
+
+    xblk = np.zeros_like(xcur)
+    fblk = np.zeros_like(xcur)
+    spre = np.zeros_like(xcur)
+    scur = np.zeros_like(xcur)
+
+    for niter in range(1, maxiter + 1):
+        if active.size == 0:
+            break
+
+        iterations[active] = niter
+
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            reset = (fpre != 0) & (fcur != 0) & (np.signbit(fpre) != np.signbit(fcur))
+            xblk = np.where(reset, xpre, xblk)
+            fblk = np.where(reset, fpre, fblk)
+            spre = np.where(reset, xcur - xpre, spre)
+            scur = np.where(reset, xcur - xpre, scur)
+
+            swap = np.abs(fblk) < np.abs(fcur)
+            xpre = np.where(swap, xcur, xpre)
+            xcur = np.where(swap, xblk, xcur)
+            xblk = np.where(swap, xpre, xblk)
+            fpre = np.where(swap, fcur, fpre)
+            fcur = np.where(swap, fblk, fcur)
+            fblk = np.where(swap, fpre, fblk)
+
+            delta = (xtol + rtol * np.abs(xcur)) / 2
+            sbis = (xblk - xcur) / 2
+
+            is_converged = (fcur == 0) | (np.abs(sbis) < delta)
+            roots[active[is_converged]] = xcur[is_converged]
+            converged[active[is_converged]] = True
+
+            # secant interpolation or inverse quadratic extrapolation
+            stry_secant = -fcur * (xcur - xpre) / (fcur - fpre)
+            dpre = (fpre - fcur) / (xpre - xcur)
+            dblk = (fblk - fcur) / (xblk - xcur)
+            stry_quad = (
+                -fcur * (fblk * dblk - fpre * dpre) / (dblk * dpre * (fblk - fpre))
+            )
+            stry = np.where(xpre == xblk, stry_secant, stry_quad)
+
+            interpolate = (np.abs(spre) > delta) & (np.abs(fcur) < np.abs(fpre))
+            accept = interpolate & (
+                2 * np.abs(stry) < np.minimum(np.abs(spre), 3 * np.abs(sbis) - delta)
+            )
+
+            spre = np.where(accept, scur, sbis)
+            scur = np.where(accept, stry, sbis)
+
+            xpre = xcur
+            fpre = fcur
+            step = np.where(
+                np.abs(scur) > delta, scur, np.where(sbis > 0, delta, -delta)
+            )
+            xcur = xcur + step
+
+        keep = ~is_converged
+        active = active[keep]
+        xpre, xcur, fpre = xpre[keep], xcur[keep], fpre[keep]
+        xblk, fblk, spre, scur = xblk[keep], fblk[keep], spre[keep], scur[keep]
+
+        if active.size == 0:
+            break
+
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            fcur = np.asarray(f(xcur, active), dtype=float)
+
+        is_nan = np.isnan(fcur)
+        if np.any(is_nan):
+            keep = ~is_nan
+            active = active[keep]
+            xpre, xcur, fpre, fcur = xpre[keep], xcur[keep], fpre[keep], fcur[keep]
+            xblk, fblk, spre, scur = xblk[keep], fblk[keep], spre[keep], scur[keep]
+
+    roots[active] = xcur
+    return roots, iterations, converged
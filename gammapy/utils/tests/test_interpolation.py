@@ -1,6 +1,6 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 import numpy as np
-from gammapy.utils.interpolation import LogScale
+from gammapy.utils.interpolation import InterpolationMatrix, LogScale
 from gammapy.utils.testing import assert_allclose
 
 
@@ -42,3 +42,25 @@ def test_logscale_adaptive_behavior():
     inv_values_32 = log_scale.inverse(log_values_32)
     expected_inv_32 = np.array([1, 1e-5, 0], dtype=np.float32)
     assert_allclose(inv_values_32, expected_inv_32, rtol=1e-6)
+
+
+def test_interpolation_matrix():
+    values = np.arange(12, dtype=float).reshape((3, 4))
+    pix = (np.array([0.5, 1, 2.5, 3]), np.array([1.5, 0, 3.5, np.nan]))
+
+    interp = InterpolationMatrix.from_pix((3, 4), pix)
+    assert interp.matrix.shape == (4, 12)
+
+    actual = interp(values)
+    assert_allclose(actual[:3], [3.5, 4, 13.5])
+    assert np.isnan(actual[3])
+
+    actual = interp(np.stack([values, 2 * values]))
+    assert actual.shape == (2, 4)
+    assert_allclose(actual[1, :3], [7, 8, 27])
+
+    interp = InterpolationMatrix.from_pix((3, 4), pix, method="nearest")
+    assert_allclose(interp(values)[:3], [1, 4, 11])
+
+    interp = InterpolationMatrix.from_pix((1, 4), (0, [0.5, 1.5]), values_scale="log")
+    assert_allclose(interp([[1, 4, 16, 64]]), [2, 8])
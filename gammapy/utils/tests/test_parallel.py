@@ -1,5 +1,8 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
+import multiprocessing
+import os
 import pytest
+import numpy as np
 import astropy.units as u
 import gammapy.utils.parallel as parallel
 from gammapy.estimators import FluxPointsEstimator
@@ -146,3 +149,138 @@ def test_multiprocessing_manager():
     with parallel.multiprocessing_manager(backend="ray", pool_kwargs=dict(processes=3)):
         assert fpe.parallel_backend == "multiprocessing"
         assert fpe.n_jobs == 2
+
+
+def _sum_shared(specs):
+    with parallel.attach_shared_memory_arrays(specs) as arrays:
+        result = arrays["data"].sum()
+    return result, arrays
+
+
+def test_shared_memory_arrays():
+    data = np.arange(12.0).reshape((3, 4))
+
+    with parallel.SharedMemoryArrays({"data": data, "empty": None}) as specs:
+        assert specs["empty"] is None
+        assert specs["data"][1:] == ((3, 4), "<f8")
+
+        result = parallel.run_multiprocessing(
+            _sum_shared,
+            inputs=[(specs,), (specs,)],
+            pool_kwargs=dict(processes=2),
+        )
+
+    assert [_[0] for _ in result] == [66.0, 66.0]
+    assert result[0][1] == {}
+
+
+def test_attach_shared_memory_arrays_untracked(monkeypatch):
+    from multiprocessing import resource_tracker
+
+    data = np.arange(3.0)
+
+    with parallel.SharedMemoryArrays({"data": data}) as specs:
+        registered = []
+        monkeypatch.setattr(
+            resource_tracker, "register", lambda name, rtype: registered.append(name)
+        )
+
+        with parallel.attach_shared_memory_arrays(specs) as arrays:
+            assert arrays["data"].sum() == 3.0
+
+        assert registered == []
+
+
+def _worker_pid(value):
+    return os.getpid()
+
+
+def test_persistent_pool(monkeypatch):
+    monkeypatch.setattr(multiprocessing, "cpu_count", lambda: 4)
+    inputs = [(idx,) for idx in range(4)]
+    backend = parallel.ParallelBackendEnum.multiprocessing
+    threading = parallel.ParallelBackendEnum.threading
+
+    with parallel.multiprocessing_manager(
+        pool_kwargs=dict(processes=2), persistent_pool=True
+    ):
+        pids = parallel.run_multiprocessing(_worker_pid, inputs)
+        pool = parallel._PERSISTENT_POOLS[backend].pool
+
+        # a different backend uses its own pool
+        parallel.run_multiprocessing(_worker_pid, inputs, backend="threading")
+        assert parallel._PERSISTENT_POOLS[threading].pool is not pool
+
+        pids_reused = parallel.run_multiprocessing(
+            _worker_pid, inputs, method="apply_async"
+        )
+        assert parallel._PERSISTENT_POOLS[backend].pool is pool
+
+        # a different number of processes recreates the pool
+        parallel.run_multiprocessing(_worker_pid, inputs, pool_kwargs=dict(processes=3))
+        assert parallel._PERSISTENT_POOLS[backend].pool is not pool
+        assert parallel._PERSISTENT_POOLS[backend].processes == 3
+
+    assert parallel._PERSISTENT_POOLS == {}
+    assert not parallel.PERSISTENT_POOL_DEFAULT
+
+    worker_pids = {_.pid for _ in pool._pool}
+    assert set(pids).issubset(worker_pids)
+    assert {_.get() for _ in pids_reused}.issubset(worker_pids)
+
+
+def _square(value):
+    if value < 0:
+        raise ValueError("Negative value")
+    return value**2
+
+
+@pytest.mark.parametrize("backend", ["futures", "threading"])
+def test_executor_backends(backend, monkeypatch):
+    monkeypatch.setattr(multiprocessing, "cpu_count", lambda: 2)
+    inputs = [(idx,) for idx in range(5)]
+    pool_kwargs = dict(processes=2)
+
+    result = parallel.run_multiprocessing(
+        _square,
+        inputs,
+        backend=backend,
+        pool_kwargs=pool_kwargs,
+        method_kwargs=dict(chunksize=2),
+    )
+    assert result == [0, 1, 4, 9, 16]
+
+    streamed = []
+    result = parallel.run_multiprocessing(
+        _square,
+        inputs,
+        backend=backend,
+        pool_kwargs=pool_kwargs,
+        method="as_completed",
+        method_kwargs=dict(callback=streamed.append),
+    )
+    assert sorted(streamed) == [0, 1, 4, 9, 16]
+
+    collected = []
+    result = parallel.run_multiprocessing(
+        _square,
+        inputs,
+        backend=backend,
+        pool_kwargs=pool_kwargs,
+        method="apply_async",
+        method_kwargs=dict(callback=collected.append),
+    )
+    assert sorted(collected) == [0, 1, 4, 9, 16]
+    assert [_.get() for _ in result] == [0, 1, 4, 9, 16]
+
+    with pytest.raises(ValueError, match="Negative value"):
+        parallel.run_multiprocessing(
+            _square, [(1,), (-1,), (2,)], backend=backend, pool_kwargs=pool_kwargs
+        )
+
+
+def test_array_backend():
+    assert parallel._array_backend() == parallel.ParallelBackendEnum.threading
+
+    with parallel.multiprocessing_manager(backend="futures"):
+        assert parallel._array_backend() == parallel.ParallelBackendEnum.futures
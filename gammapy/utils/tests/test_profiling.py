@@ -0,0 +1,101 @@
+# Licensed under a 3-clause BSD style license - see LICENSE.rst
+import json
+import pytest
+from numpy.testing import assert_allclose
+import astropy.units as u
+from gammapy.utils.profiling import (
+    Profiler,
+    _run_profiled,
+    count,
+    is_active,
+    merge_records,
+    stage,
+)
+
+
+def test_profiler():
+    profiler = Profiler()
+
+    with stage("a"):
+        pass
+
+    assert not is_active()
+    assert profiler.to_dict() == {}
+
+    with profiler:
+        assert is_active()
+
+        for _ in range(3):
+            with stage("a", size=10):
+                pass
+
+        with stage("b") as record:
+            record.size = 5
+
+        count("c", n_calls=2)
+
+    assert not is_active()
+
+    records = profiler.to_dict()
+    assert records["a"]["n_calls"] == 3
+    assert records["a"]["size_total"] == 30
+    assert records["a"]["time_total"] >= records["a"]["time_max"]
+    assert records["b"]["size_total"] == 5
+    assert records["c"]["n_calls"] == 2
+    assert records["c"]["time_total"] == 0
+
+    table = profiler.to_table(sort=False)
+    assert list(table["stage"]) == ["a", "b", "c"]
+    assert list(table["n_calls"]) == [3, 1, 2]
+    assert table["time_total"].unit == u.s
+
+    profiler.reset()
+    assert len(profiler.to_table()) == 0
+
+
+def test_profiler_nested():
+    outer, inner = Profiler(), Profiler()
+
+    with outer:
+        with stage("a"):
+            pass
+
+        with inner:
+            count("b")
+
+        count("c")
+
+    assert list(outer.to_dict()) == ["a", "b", "c"]
+    assert list(inner.to_dict()) == ["b"]
+
+
+def test_run_profiled():
+    def func(value):
+        count("a", n_calls=value)
+        return value
+
+    with Profiler() as profiler:
+        result, records = _run_profiled(func, 3)
+        assert profiler.to_dict() == {}
+
+        merge_records(records)
+
+    assert result == 3
+    assert profiler.to_dict()["a"]["n_calls"] == 3
+
+
+def test_profiler_write(tmp_path):
+    profiler = Profiler()
+
+    with profiler:
+        count("a", size=4)
+
+    filename = tmp_path / "profile.json"
+    profiler.write(filename)
+
+    with pytest.raises(IOError):
+        profiler.write(filename)
+
+    data = json.loads(filename.read_text())
+    assert data["a"]["n_calls"] == 1
+    assert_allclose(data["a"]["size_total"], 4)
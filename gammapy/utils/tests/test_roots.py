@@ -4,7 +4,8 @@ import pytest
 import numpy as np
 from numpy.testing import assert_allclose
 import astropy.units as u
-from gammapy.utils.roots import find_roots
+from scipy.optimize import brentq
+from gammapy.utils.roots import find_roots, find_roots_vectorized
 
 
 class TestFindRoots:
@@ -47,3 +48,33 @@ class TestFindRoots:
                 upper_bound=self.upper_bound,
                 method="xfail",
             )
+
+
+def test_find_roots_vectorized():
+    c = np.array([0.3, 2.0, 5.0, -1.0, 1.0])
+
+    def f(x, index):
+        return x**3 - c[index]
+
+    lower_bound = np.array([0, 0, 0, 0, np.nan])
+    upper_bound = np.array([1, 2, 3, 3, 3])
+
+    roots, iterations, converged = find_roots_vectorized(
+        f, lower_bound, upper_bound, rtol=1e-3
+    )
+
+    assert_allclose(roots[:3], np.cbrt(c[:3]), rtol=1e-3)
+    assert_allclose(converged, [True, True, True, False, False])
+    assert np.all(np.isnan(roots[3:]))
+
+    for idx in range(3):
+        root, result = brentq(
+            lambda x, value: x**3 - value,
+            lower_bound[idx],
+            upper_bound[idx],
+            args=(c[idx],),
+            rtol=1e-3,
+            full_output=True,
+        )
+        assert_allclose(roots[idx], root)
+        assert iterations[idx] == result.iterations